@@ -0,0 +1,70 @@
+import sys
+
+import plac
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+from benchmarks.benchmark_measures import create_proba
+from osm.data_streams.active_learner.strategy.pool_based.fixed_uncertainity import FixedUncertainty
+from osm.data_streams.active_learner.strategy.pool_based.random import Random
+from osm.data_streams.active_learner.strategy.pool_based.variable_randomized_uncertainity import \
+    RandomizedVariableUncertainty
+from osm.data_streams.active_learner.strategy.pool_based.variable_uncertainity import VariableUncertainty
+from osm.data_streams.oracle.availability_aware_oracle import AvailabilityAwareOracle
+
+BUDGET = 0.3
+
+
+def get_strategies():
+    """
+    The active learning strategies that are timed
+    :return: dict of the name and a function that creates the strategy
+    """
+    def oracle():
+        return AvailabilityAwareOracle(availability=1.0)
+
+    return {
+        "random": lambda: Random(budget=BUDGET, oracle=oracle(), target_col_name="stars", debug=False),
+        "fixed_uncertainty": lambda: FixedUncertainty(budget=BUDGET, oracle=oracle(), target_col_name="stars",
+                                                      threshold=0.9, debug=False),
+        "variable_uncertainty": lambda: VariableUncertainty(budget=BUDGET, oracle=oracle(), target_col_name="stars",
+                                                            debug=False),
+        "variable_randomized_uncertainty": lambda: RandomizedVariableUncertainty(budget=BUDGET, oracle=oracle(),
+                                                                                 target_col_name="stars",
+                                                                                 debug=False)
+    }
+
+
+def run(sizes, repeat=3):
+    """
+    Times querying the oracle for the labels of a timepoint
+    :param sizes: the number of reviews in a timepoint
+    :param repeat: the number of repetitions
+    :return: list of the results
+    """
+    results = []
+    for size in sizes:
+        data = utils.create_data(size)
+        proba = create_proba(size)
+
+        for name, create_strategy in get_strategies().items():
+            times = utils.measure(lambda strategy: strategy.get_labels(data=data, proba=proba, index=0),
+                                  setup=lambda: (create_strategy(),), repeat=repeat)
+            results.append(utils.create_result("strategy.get_labels", name, size, times))
+    return results
+
+
+@plac.annotations(
+    sizes=("Comma separated number of reviews in a timepoint", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(sizes=utils.SIZES, repeat=3, output=None):
+    """
+    Benchmarks the active learning strategies
+    """
+    utils.report(run(utils.parse_sizes(sizes), repeat), output)
+
+
+if __name__ == '__main__':
+    plac.call(main)
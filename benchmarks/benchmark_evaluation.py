@@ -0,0 +1,50 @@
+import sys
+
+import numpy as np
+import plac
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+from benchmarks.benchmark_measures import create_proba
+from osm.data_streams.evaluation.evaluation_criteria import EvaluationCriteria
+from osm.data_streams.stream_source.synthetic_stream_source import SyntheticStreamSource
+
+
+def run(sizes, repeat=3):
+    """
+    Times the evaluation of the predictions of a timepoint
+    :param sizes: the number of reviews in a timepoint
+    :param repeat: the number of repetitions
+    :return: list of the results
+    """
+    classes = np.array(SyntheticStreamSource.get_classes())
+    random = np.random.RandomState(0)
+
+    results = []
+    for size in sizes:
+        y_true = classes[random.randint(len(classes), size=size)]
+        y_predict_proba = create_proba(size, len(classes))
+        y_predict = classes[np.argmax(y_predict_proba, axis=1)]
+
+        for name, criteria in [("all", EvaluationCriteria(debug=False)),
+                               ("without_class_wise", EvaluationCriteria(individual_metrics=False, debug=False))]:
+            times = utils.measure(lambda: criteria.evaluate(index=0, y_true=y_true, y_predict=y_predict,
+                                                            y_predict_proba=y_predict_proba), repeat=repeat)
+            results.append(utils.create_result("EvaluationCriteria.evaluate", name, size, times))
+    return results
+
+
+@plac.annotations(
+    sizes=("Comma separated number of reviews in a timepoint", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(sizes=utils.SIZES, repeat=3, output=None):
+    """
+    Benchmarks the evaluation criteria
+    """
+    utils.report(run(utils.parse_sizes(sizes), repeat), output)
+
+
+if __name__ == '__main__':
+    plac.call(main)
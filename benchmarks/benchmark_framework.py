@@ -0,0 +1,133 @@
+import os
+import shutil
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+import plac
+from sklearn.calibration import CalibratedClassifierCV
+from sklearn.feature_extraction import DictVectorizer
+from sklearn.feature_extraction.text import TfidfTransformer
+from sklearn.feature_selection import chi2
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+import osm.data_streams.constants as const
+from osm.data_streams.active_learner.strategy.pool_based.variable_uncertainity import VariableUncertainty
+from osm.data_streams.algorithm.framework import FrameWork
+from osm.data_streams.oracle.availability_aware_oracle import AvailabilityAwareOracle
+from osm.data_streams.stream_source.synthetic_stream_source import SyntheticStreamSource
+from osm.data_streams.windows.fading_window import FadingWindow
+from osm.data_streams.windows.forgetting_strategy.threshold import FixedThreshold
+from osm.data_streams.windows.sliding_window import SlidingWindow
+from osm.transformers.FeatureCache import FeatureCache
+from osm.transformers.IncrementalDictVectorizer import IncrementalDictVectorizer
+from osm.transformers.Selectors import TextSelector, SelectDynamicKBest
+
+warnings.filterwarnings('ignore')
+np.seterr(all='ignore')
+
+
+def build_framework(stream_source, window_size=5, feature_cache=False, fading=False, **kwargs):
+    """
+    Builds the framework with the configuration of the main snippets
+    :param stream_source: the stream source
+    :param window_size: the size of the sliding window
+    :param feature_cache: If True the vectorized ngrams of the reviews in the window are cached
+    :param fading: If True a fading window with a decay of 0.5 weights the reviews instead of the sliding window. It
+    keeps the last 3 timepoints
+    :param kwargs: the other parameters of the framework
+    :return: the framework
+    """
+    classes = SyntheticStreamSource.get_classes()
+
+    if feature_cache:
+        features = [('cache', FeatureCache(Pipeline([
+            ('selector', TextSelector(key='ngrams')),
+            ('vect', IncrementalDictVectorizer())
+        ])))]
+    else:
+        features = [('selector', TextSelector(key='ngrams')), ('vect', DictVectorizer())]
+
+    feature_pipeline = Pipeline(features + [
+        ('kbest', SelectDynamicKBest(chi2, k_max=15000)),
+        ('tfidf', TfidfTransformer())
+    ])
+
+    oracle = AvailabilityAwareOracle(availability=0.5)
+    active_learner = VariableUncertainty(budget=0.1, oracle=oracle, target_col_name="stars", debug=False)
+    if fading:
+        window = FadingWindow(decay=0.5, min_weight=0.25)
+    else:
+        window = SlidingWindow(window_size=window_size,
+                               forgetting_strategy=FixedThreshold(min_count=3, classes=classes, target_col_name="stars"))
+
+    return FrameWork(summary_file=None,
+                     stream_source=stream_source,
+                     base_estimator=CalibratedClassifierCV(SGDClassifier(max_iter=1000, class_weight="balanced")),
+                     feature_pipeline=feature_pipeline,
+                     target_col_name="stars",
+                     ild_timepoint=stream_source.get_summary().index[0],
+                     active_learner=active_learner,
+                     window=window,
+                     debug=False,
+                     **kwargs)
+
+
+def run(sizes, repeat=1, n_timepoints=10, **kwargs):
+    """
+    Times processing a synthetic data stream end to end and reports the time of the stages recorded by the profiler
+    :param sizes: the number of reviews in a timepoint
+    :param repeat: the number of repetitions
+    :param n_timepoints: the number of timepoints of the data stream
+    :param kwargs: the other parameters of build_framework
+    :return: list of the results
+    """
+    results = []
+    for size in sizes:
+        frameworks = []
+
+        def setup():
+            # a new directory for every repetition, as the framework would resume from the checkpoint otherwise
+            framework = build_framework(utils.create_stream(size, n_timepoints=n_timepoints), **kwargs)
+            frameworks.append(framework)
+            return framework,
+
+        times = utils.measure(lambda framework: framework.process_data_stream(), setup=setup, repeat=repeat)
+        results.append(utils.create_result("FrameWork.process_data_stream", str(n_timepoints) + " timepoints", size,
+                                           times))
+
+        # the time of the stages per timepoint in the last repetition
+        framework = frameworks[-1]
+        summary = pd.read_pickle(os.path.join(framework.dir_result, framework.summary_filename))
+        for stage, values in summary[const.time_stats].items():
+            results.append(utils.create_result("FrameWork stage", stage, size, (values.min(), values.mean())))
+
+        for framework in frameworks:
+            shutil.rmtree(framework.stream_source.get_directory(), ignore_errors=True)
+    return results
+
+
+@plac.annotations(
+    sizes=("Comma separated number of reviews in a timepoint", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    n_timepoints=("Number of timepoints", "option", "t", int),
+    pipelined=("Train in the background", "flag", "p"),
+    feature_cache=("Cache the vectorized ngrams of the window", "flag", "c"),
+    fading=("Weight the reviews with a fading window", "flag", "f"),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(sizes="1000,5000", repeat=1, n_timepoints=10, pipelined=False, feature_cache=False, fading=False,
+         output=None):
+    """
+    Benchmarks processing a synthetic data stream end to end
+    """
+    utils.report(run(utils.parse_sizes(sizes), repeat, n_timepoints, pipelined=pipelined,
+                     feature_cache=feature_cache, fading=fading), output)
+
+
+if __name__ == '__main__':
+    plac.call(main)
@@ -0,0 +1,54 @@
+import sys
+
+import numpy as np
+import plac
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+from osm.data_streams.active_learner.measures.measures_factory import get_measure
+
+MEASURES = ["least_confident", "max_margin", "entropy"]
+
+
+def create_proba(size, n_classes=3, random_state=0):
+    """
+    Creates random probabilities of prediction
+    :param size: the number of instances
+    :param n_classes: the number of classes
+    :param random_state: the seed
+    :return: the probabilities
+    """
+    return np.random.RandomState(random_state).dirichlet(np.ones(n_classes), size=size)
+
+
+def run(sizes, repeat=3):
+    """
+    Times the information gain measures
+    :param sizes: the number of instances
+    :param repeat: the number of repetitions
+    :return: list of the results
+    """
+    results = []
+    for size in sizes:
+        proba = create_proba(size)
+        for name in MEASURES:
+            measure = get_measure(name)
+            times = utils.measure(lambda: measure.calculate(proba), repeat=repeat)
+            results.append(utils.create_result("measure.calculate", name, size, times))
+    return results
+
+
+@plac.annotations(
+    sizes=("Comma separated number of instances", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(sizes=utils.SIZES, repeat=3, output=None):
+    """
+    Benchmarks the information gain measures
+    """
+    utils.report(run(utils.parse_sizes(sizes), repeat), output)
+
+
+if __name__ == '__main__':
+    plac.call(main)
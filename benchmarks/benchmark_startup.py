@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+
+import plac
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+
+# the directory from which osm is imported in the new interpreters
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the modules whose import is timed in a new interpreter
+IMPORTS = {
+    "osm": "import osm",
+    "framework": "import osm.data_streams.algorithm.framework",
+    "transformers": "import osm.transformers.PreprocessTransformer",
+    "textacy_transformers": "import osm.transformers.ContractionTransformer",
+    "experiment_runner": "import osm.data_streams.algorithm.experiment_runner"
+}
+
+# the startup budget in seconds
+BUDGET = {
+    ("import", "osm"): 0.05,
+    ("import", "framework"): 2.0,
+    ("import", "transformers"): 1.5,
+    ("import", "textacy_transformers"): 1.5,
+    ("import", "experiment_runner"): 2.5,
+    ("worker", "startup"): 3.0
+}
+
+
+def time_import(statement, repeat=3):
+    """
+    Times a statement in a new interpreter, without the time to start the interpreter itself
+    :param statement: the statement, e.g. the import of a module
+    :param repeat: the number of repetitions
+    :return: the minimum and the mean time in seconds
+    """
+    def run(code):
+        return subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+    interpreter = utils.measure(lambda: run("pass"), repeat=repeat)
+    times = utils.measure(lambda: run(statement), repeat=repeat)
+    return times[0] - interpreter[0], times[1] - interpreter[1]
+
+
+def run_worker(size, n_timepoints):
+    """
+    Processes a synthetic data stream with the framework of the framework benchmark. Runs in the worker process
+    :param size: the number of reviews in a timepoint
+    :param n_timepoints: the number of timepoints
+    """
+    from benchmarks.benchmark_framework import build_framework
+
+    stream_source = utils.create_stream(size, n_timepoints=n_timepoints)
+    try:
+        build_framework(stream_source).process_data_stream()
+    finally:
+        shutil.rmtree(stream_source.get_directory(), ignore_errors=True)
+
+
+def time_worker(size, n_timepoints=3, repeat=3):
+    """
+    Times a data stream in a new worker process and again in the same worker, whose modules are then imported. The
+    difference is the startup time of a worker
+    :param size: the number of reviews in a timepoint
+    :param n_timepoints: the number of timepoints
+    :param repeat: the number of repetitions
+    :return: the times of the first data stream, of the second data stream and of the startup
+    """
+    context = multiprocessing.get_context("spawn")
+    cold = []
+    warm = []
+    for _ in range(repeat):
+        with context.Pool(processes=1) as pool:
+            cold.append(utils.measure(lambda: pool.apply(run_worker, (size, n_timepoints)), repeat=1)[0])
+            warm.append(utils.measure(lambda: pool.apply(run_worker, (size, n_timepoints)), repeat=1)[0])
+
+    startup = [first - second for first, second in zip(cold, warm)]
+    return [(min(times), sum(times) / len(times)) for times in (cold, warm, startup)]
+
+
+def run(sizes, repeat=3):
+    """
+    Times the imports of osm in a new interpreter and the startup of a worker process that runs the framework
+    :param sizes: the number of reviews in a timepoint of the data stream of the worker
+    :param repeat: the number of repetitions
+    :return: list of the results
+    """
+    results = []
+    for name, statement in IMPORTS.items():
+        results.append(utils.create_result("import", name, 0, time_import(statement, repeat)))
+
+    for size in sizes:
+        cold, warm, startup = time_worker(size, repeat=repeat)
+        results.append(utils.create_result("worker", "new process", size, cold))
+        results.append(utils.create_result("worker", "same process", size, warm))
+        results.append(utils.create_result("worker", "startup", size, startup))
+    return results
+
+
+def get_exceeded(results):
+    """
+    Gets the results whose minimum time exceeds the startup budget
+    :param results: list of the results
+    :return: list of the results that exceed the budget
+    """
+    return [result for result in results
+            if result[utils.MIN] > BUDGET.get((result[utils.COMPONENT], result[utils.CASE]), float("inf"))]
+
+
+@plac.annotations(
+    sizes=("Comma separated number of reviews in a timepoint of the worker", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(sizes="100", repeat=3, output=None):
+    """
+    Benchmarks the startup time of osm and of the worker processes. Exits with an error if the budget is exceeded
+    """
+    results = run(utils.parse_sizes(sizes), repeat)
+    utils.report(results, output)
+
+    exceeded = get_exceeded(results)
+    for result in exceeded:
+        print(str.format("{0} {1} exceeds the startup budget of {2}s", result[utils.COMPONENT], result[utils.CASE],
+                         BUDGET[(result[utils.COMPONENT], result[utils.CASE])]))
+    if exceeded:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    plac.call(main)
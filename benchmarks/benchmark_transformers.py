@@ -0,0 +1,61 @@
+import sys
+
+import plac
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+from osm.transformers.PreprocessTransformer import PreprocessTransformer
+
+
+def get_transformers():
+    """
+    The preprocessing transformers that are timed
+    :return: dict of the name and the transformer
+    """
+    return {
+        "whitespace": PreprocessTransformer(),
+        "all": PreprocessTransformer(replace_urls=True,
+                                     replace_emoticons=True,
+                                     replace_exclamations=True,
+                                     replace_punctuations=True,
+                                     replace_numbers=True,
+                                     replace_negations=True,
+                                     replace_repeated_letters=True,
+                                     replace_contractions=True,
+                                     replace_whitespace=True,
+                                     replace_currency=True,
+                                     replace_currency_with=" CURRENCY ")
+    }
+
+
+def run(sizes, repeat=3):
+    """
+    Times the preprocessing of the texts of a timepoint
+    :param sizes: the number of reviews in a timepoint
+    :param repeat: the number of repetitions
+    :return: list of the results
+    """
+    results = []
+    for size in sizes:
+        texts = list(utils.create_data(size, text=True)["text"])
+
+        for name, transformer in get_transformers().items():
+            times = utils.measure(lambda: transformer.transform(texts), repeat=repeat)
+            results.append(utils.create_result("PreprocessTransformer.transform", name, size, times))
+    return results
+
+
+@plac.annotations(
+    sizes=("Comma separated number of reviews in a timepoint", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(sizes=utils.SIZES, repeat=3, output=None):
+    """
+    Benchmarks the preprocessing transformers
+    """
+    utils.report(run(utils.parse_sizes(sizes), repeat), output)
+
+
+if __name__ == '__main__':
+    plac.call(main)
@@ -0,0 +1,101 @@
+import os
+import tempfile
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from osm.data_streams.stream_source.synthetic_stream_source import SyntheticStreamSource
+
+# the default number of reviews for which the components are timed
+SIZES = "1000,10000,50000"
+
+# the columns of the results
+COMPONENT = "component"
+CASE = "case"
+SIZE = "size"
+MIN = "min"
+MEAN = "mean"
+
+
+def parse_sizes(sizes):
+    """
+    Parses the comma separated sizes of the command line
+    :param sizes: the comma separated sizes, e.g. 1000,10000
+    :return: list of the sizes
+    """
+    return [int(size) for size in sizes.split(",")]
+
+
+def measure(function, setup=None, repeat=3):
+    """
+    Times a function. The setup is not timed
+    :param function: the function to time. Called with the result of the setup
+    :param setup: a function that returns the tuple of the arguments of the function. Called before every repetition
+    :param repeat: the number of repetitions
+    :return: the minimum and the mean time in seconds
+    """
+    times = []
+    for _ in range(repeat):
+        args = () if setup is None else setup()
+        start = perf_counter()
+        function(*args)
+        times.append(perf_counter() - start)
+    return np.min(times), np.mean(times)
+
+
+def create_result(component, case, size, times):
+    """
+    Creates a row of the results
+    :param component: the timed component
+    :param case: the configuration of the component
+    :param size: the number of reviews
+    :param times: the minimum and the mean time
+    :return: dict of the row
+    """
+    return {COMPONENT: component, CASE: case, SIZE: size, MIN: times[0], MEAN: times[1]}
+
+
+def create_stream(size, n_timepoints=1, directory=None, **kwargs):
+    """
+    Creates a synthetic data stream
+    :param size: the number of reviews in every timepoint
+    :param n_timepoints: the number of timepoints
+    :param directory: the directory of the results. Default: a new temporary directory
+    :param kwargs: the other parameters of the SyntheticStreamSource
+    :return: the stream source
+    """
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix="osm_benchmark_")
+    return SyntheticStreamSource(directory, n_timepoints=n_timepoints, reviews_per_timepoint=size, **kwargs)
+
+
+def create_data(size, **kwargs):
+    """
+    Creates the data of a single synthetic timepoint
+    :param size: the number of reviews
+    :param kwargs: the other parameters of the SyntheticStreamSource
+    :return: the data
+    """
+    stream = create_stream(size, **kwargs)
+    data = stream.read(stream.get_summary().index[0])
+    os.rmdir(stream.get_directory())
+    return data
+
+
+def report(results, output=None):
+    """
+    Prints the results and optionally appends them to a csv file
+    :param results: list of the rows of the results
+    :param output: the path of the csv file. Default: None
+    :return: the results as a dataframe
+    """
+    results = pd.DataFrame(results, columns=[COMPONENT, CASE, SIZE, MIN, MEAN])
+
+    with pd.option_context("display.max_rows", None, "display.width", 120):
+        print(results.to_string(index=False, float_format=lambda value: "{0:.6f}".format(value)))
+
+    if output is not None:
+        results.to_csv(output, mode="a", index=False, header=not os.path.isfile(output))
+
+    return results
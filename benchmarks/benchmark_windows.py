@@ -0,0 +1,89 @@
+import sys
+
+import pandas as pd
+import plac
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+from osm.data_streams.windows.fading_window import FadingWindow
+from osm.data_streams.windows.fixed_length_window import FixedLengthWindow
+from osm.data_streams.windows.landmark_window import LandmarkWindow
+from osm.data_streams.windows.no_window import NoWindow
+from osm.data_streams.windows.reservoir_window import ReservoirWindow
+from osm.data_streams.windows.sliding_window import SlidingWindow
+from osm.data_streams.windows.storage.sparse_storage import SparseStorage
+from osm.data_streams.windows.stratified_window import StratifiedWindow
+from osm.data_streams.windows.time_span_window import TimeSpanWindow
+from osm.data_streams.windows.forgetting_strategy.threshold import FixedThreshold
+from osm.data_streams.stream_source.synthetic_stream_source import SyntheticStreamSource
+
+WINDOW_SIZE = 5
+
+
+def get_windows(size):
+    """
+    The windows that are timed
+    :param size: the number of reviews in a timepoint
+    :return: dict of the name and a function that creates the window
+    """
+    classes = SyntheticStreamSource.get_classes()
+    return {
+        "no_window": lambda: NoWindow(),
+        "sliding_window": lambda: SlidingWindow(window_size=WINDOW_SIZE),
+        "sliding_window_fixed_threshold": lambda: SlidingWindow(
+            window_size=WINDOW_SIZE, forgetting_strategy=FixedThreshold(100, classes, "stars")),
+        "stratified_window": lambda: StratifiedWindow(window_size=WINDOW_SIZE, min_count=100,
+                                                      target_col_name="stars"),
+        "sliding_window_sparse": lambda: SlidingWindow(window_size=WINDOW_SIZE, storage=SparseStorage("ngrams")),
+        "landmark_window": lambda: LandmarkWindow(window_size=WINDOW_SIZE),
+        "fixed_length_window": lambda: FixedLengthWindow(window_size=WINDOW_SIZE * size // 2),
+        "time_span_window": lambda: TimeSpanWindow(duration=pd.Timedelta(weeks=WINDOW_SIZE)),
+        "reservoir_window": lambda: ReservoirWindow(window_size=WINDOW_SIZE * size // 2, random_state=0),
+        "fading_window": lambda: FadingWindow(decay=0.5, min_weight=0.5 ** (WINDOW_SIZE - 1))
+    }
+
+
+def run(sizes, repeat=3):
+    """
+    Times adding a timepoint of every size to a full window, which includes forgetting the oldest timepoint
+    :param sizes: the number of reviews in a timepoint
+    :param repeat: the number of repetitions
+    :return: list of the results
+    """
+    results = []
+    for size in sizes:
+        stream = utils.create_stream(size, n_timepoints=WINDOW_SIZE + 1)
+        timepoints = [stream.read(timepoint) for timepoint in stream.get_summary().index]
+
+        for name, create_window in get_windows(size).items():
+            def setup():
+                window = create_window()
+                for data in timepoints[:-1]:
+                    window.add(data)
+                return window, timepoints[-1]
+
+            times = utils.measure(lambda window, data: window.add(data), setup=setup, repeat=repeat)
+            results.append(utils.create_result("window.add", name, size, times))
+
+            times = utils.measure(lambda window, data: window.get_window_data(), setup=setup, repeat=repeat)
+            results.append(utils.create_result("window.get_window_data", name, size, times))
+
+            times = utils.measure(lambda window, data: window.get_window_features(), setup=setup, repeat=repeat)
+            results.append(utils.create_result("window.get_window_features", name, size, times))
+    return results
+
+
+@plac.annotations(
+    sizes=("Comma separated number of reviews in a timepoint", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(sizes=utils.SIZES, repeat=3, output=None):
+    """
+    Benchmarks the windows
+    """
+    utils.report(run(utils.parse_sizes(sizes), repeat), output)
+
+
+if __name__ == '__main__':
+    plac.call(main)
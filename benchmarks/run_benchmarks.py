@@ -0,0 +1,44 @@
+import sys
+
+import plac
+
+sys.path.append('../')
+import benchmarks.benchmark_utils as utils
+import benchmarks.benchmark_active_learner as active_learner
+import benchmarks.benchmark_evaluation as evaluation
+import benchmarks.benchmark_framework as framework
+import benchmarks.benchmark_measures as measures
+import benchmarks.benchmark_transformers as transformers
+import benchmarks.benchmark_windows as windows
+
+BENCHMARKS = {
+    "windows": windows,
+    "measures": measures,
+    "active_learner": active_learner,
+    "evaluation": evaluation,
+    "transformers": transformers,
+    "framework": framework
+}
+
+
+@plac.annotations(
+    benchmarks=("Comma separated benchmarks. Default: all", "option", "b", str),
+    sizes=("Comma separated number of reviews in a timepoint", "option", "s", str),
+    repeat=("Number of repetitions", "option", "r", int),
+    output=("Append the results to this csv file", "option", "o", str)
+)
+def main(benchmarks=",".join(BENCHMARKS), sizes=utils.SIZES, repeat=3, output=None):
+    """
+    Runs the benchmarks of the components of osm on synthetic data streams
+    """
+    results = []
+    for name in benchmarks.split(","):
+        if name not in BENCHMARKS:
+            raise ValueError("The specified benchmark is not supported. Supported: " + str(list(BENCHMARKS)))
+        results.extend(BENCHMARKS[name].run(utils.parse_sizes(sizes), repeat))
+
+    utils.report(results, output)
+
+
+if __name__ == '__main__':
+    plac.call(main)
@@ -1,12 +1,13 @@
 from abc import ABC, abstractmethod
 
 import numpy as np
-import pandas as pd
 from datetime import datetime
 
 from osm.data_streams.abstract_base_class import AbstractBaseClass
 from osm.data_streams.active_learner.measures.measures_factory import get_measure
+from osm.data_streams.metrics_recorder import MetricsRecorder
 from osm.data_streams.oracle.oracle import Oracle
+from osm.data_streams.profiler import Profiler
 import osm.data_streams.constants as const
 
 
@@ -37,6 +38,21 @@ class AbstractActiveLearningStrategy(AbstractBaseClass):
         self.measure = get_measure(measure)
         self.debug = debug
 
+        # times the information gain measure and the oracle
+        self.profiler = Profiler()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['profiler']
+        return state
+
+    def set_profiler(self, profiler):
+        """
+        Sets the profiler with which the information gain measure and the oracle are timed
+        :param profiler: Profiler: the profiler
+        """
+        self.profiler = profiler
+
     def get_labels(self, data, proba=None, index=0):
         """
         Queries the oracle to get the data
@@ -56,8 +72,10 @@ class AbstractActiveLearningStrategy(AbstractBaseClass):
 
         if hasattr(data, "iterrows"):
             # calculate the information gain measure
-            gain = self.measure.calculate(proba)
+            with self.profiler.stage(index, const.measure_time):
+                gain = self.measure.calculate(proba)
 
+            stream_index = index
             indices = []
             gain_index = 0
             for index, row in data.iterrows():
@@ -69,7 +87,8 @@ class AbstractActiveLearningStrategy(AbstractBaseClass):
                     indices.append(index)
                 gain_index += 1
 
-            labeled = self.oracle.predict(indices)
+            with self.profiler.stage(stream_index, const.oracle_time):
+                labeled = self.oracle.predict(indices)
             return labeled if labeled.empty else data.loc[labeled.index.values, :]
         else:
             raise ValueError("A pandas dataframe expected")
@@ -83,19 +102,19 @@ class AbstractActiveLearningStrategy(AbstractBaseClass):
         """
         pass
 
-    def get_stats(self, index=0):
+    def get_stats(self, index=0, recorder=None):
         """
         Generates stats of how many queries were answered by the oracle
         and the total cost of labeling
         :param index: the index in the data stream for which the stats
         are required
-        :return: the cost of labeling, number of queries, number of answered queries
+        :param recorder: MetricsRecorder: the recorder to which the stats are written. Default: a new recorder
+        :return: the recorder with the cost of labeling, number of queries, number of answered queries
         """
-        pd_index = pd.MultiIndex.from_product([[const.active_learner_stats], [const.queried, const.answered, const.cost]])
-        stats = pd.DataFrame(index=pd_index).T.copy()
-        stats.loc[index, (const.active_learner_stats, const.cost)] = self.oracle.get_cost()
-        stats.loc[index, (const.active_learner_stats, const.queried)] = self.oracle.get_total_queried()
-        stats.loc[index, (const.active_learner_stats, const.answered)] = self.oracle.get_total_answered()
+        stats = MetricsRecorder(index=[index]) if recorder is None else recorder
+        stats.record(index, (const.active_learner_stats, const.queried), self.oracle.get_total_queried())
+        stats.record(index, (const.active_learner_stats, const.answered), self.oracle.get_total_answered())
+        stats.record(index, (const.active_learner_stats, const.cost), self.oracle.get_cost())
 
         if self.debug:
             print(str.format("{0}: Index: {1}\tQueried: {2}\tAnswered: {3}\tCost: {4}",
@@ -0,0 +1,186 @@
+import os
+
+import joblib
+import pandas as pd
+
+import osm.data_streams.constants as const
+
+
+class CheckpointLog(object):
+    """
+    Append-only checkpoints of the data stream. A checkpoint only stores the rows of the summary and the changes of the
+    window since the previous checkpoint. The log is periodically compacted into a full snapshot of the summary and the
+    window data. The fitted models are saved separately, so that a resumed data stream does not need to retrain them
+    """
+    def __init__(self, directory, summary_filename, compaction_interval=10) -> None:
+        """
+        :param directory: the directory of the results
+        :param summary_filename: the file name of the summary snapshot
+        :param compaction_interval: the number of checkpoints appended to the log before it is compacted
+        """
+        if compaction_interval is None or compaction_interval <= 0:
+            raise ValueError("The compaction_interval should be a positive integer")
+
+        self.directory = directory
+        self.summary_filename = summary_filename
+        self.compaction_interval = compaction_interval
+        self.dir_log = os.path.join(directory, const.checkpoint_dir)
+        self.last_index = None
+
+        os.makedirs(self.dir_log, exist_ok=True)
+
+    def exists(self):
+        """
+        Checks if a snapshot exists
+        :return: True if a snapshot exists
+        """
+        return os.path.isfile(os.path.join(self.directory, self.summary_filename))
+
+    def get_log_files(self):
+        """
+        Gets the files of the log ordered by the index of the checkpoint
+        :return: list of (index, path)
+        """
+        files = []
+        for filename in os.listdir(self.dir_log):
+            name = filename[:-len(const.ext_pkl)]
+            if filename.endswith(const.ext_pkl) and name.isdigit():
+                files.append((int(name), os.path.join(self.dir_log, filename)))
+        return sorted(files)
+
+    def save(self, index, summary, metrics, window):
+        """
+        Saves a checkpoint. The checkpoint is appended to the log even if the log is compacted afterwards, so that the
+        data stream can be restored if the compaction is interrupted
+        :param index: the index in the data stream
+        :param summary: the summary table
+        :param metrics: MetricsRecorder: the metrics of the data stream
+        :param window: the window
+        """
+        compaction_required = not self.exists() or len(self.get_log_files()) >= self.compaction_interval
+
+        # the rows of the summary updated since the last checkpoint
+        rows = summary.loc[self.last_index:index] if self.last_index is not None else summary
+        checkpoint = {
+            "index": index,
+            "summary": metrics.merge(rows),
+            "changes": window.pop_changes(),
+            "window_index": window.index
+        }
+        self.write(checkpoint, os.path.join(self.dir_log, str.format("{0:010d}{1}", index, const.ext_pkl)))
+
+        if compaction_required:
+            self.compact(index, summary, metrics, window)
+
+        self.last_index = index
+
+    def compact(self, index, summary, metrics, window):
+        """
+        Writes a snapshot of the window data and of the summary and clears the log. The snapshots are written one
+        after the other, so the snapshot of the window stores the index of the checkpoint that it contains
+        :param index: the index in the data stream
+        :param summary: the summary table
+        :param metrics: MetricsRecorder: the metrics of the data stream
+        :param window: the window
+        """
+        # the changes of the window that were not saved are part of the snapshot
+        window.pop_changes()
+
+        snapshot = {
+            "index": index,
+            "window_index": window.index,
+            "data": window.get_snapshot()
+        }
+        self.write(snapshot, os.path.join(self.directory, const.window_data_filename))
+        self.write(metrics.merge(summary), os.path.join(self.directory, self.summary_filename))
+
+        # the checkpoints in the log are part of the snapshots now
+        for log_index, path in self.get_log_files():
+            if log_index <= index:
+                os.remove(path)
+
+    def restore(self, window):
+        """
+        Restores the summary and the window from the snapshots and replays the log. The checkpoints of the log are
+        replayed on the summary and on the window separately, from the index that each snapshot contains
+        :param window: the window to restore
+        :return: the summary table including the metrics
+        """
+        summary = pd.read_pickle(os.path.join(self.directory, self.summary_filename))
+        summary_index = max(summary[summary.loc[:, (const.summary_level, const.processed)]].index.values)
+
+        snapshot = pd.read_pickle(os.path.join(self.directory, const.window_data_filename))
+        if isinstance(snapshot, dict) and "index" in snapshot:
+            window_index = snapshot["index"]
+            window.restore_window(index=snapshot["window_index"], data=snapshot["data"])
+        else:
+            # the snapshots written before the index of the checkpoint was stored
+            window_index = summary_index
+            window.restore_window(index=summary_index + 1, data=snapshot)
+
+        index = max(summary_index, window_index)
+        for log_index, path in self.get_log_files():
+            # skip the checkpoints that were compacted before the log could be cleared
+            if log_index <= min(summary_index, window_index):
+                continue
+
+            checkpoint = pd.read_pickle(path)
+            if log_index > summary_index:
+                summary = checkpoint["summary"].combine_first(summary)
+            if log_index > window_index:
+                window.apply_changes(checkpoint["changes"], index=checkpoint["window_index"])
+            index = max(index, checkpoint["index"])
+
+        self.last_index = index
+        return summary
+
+    def save_models(self, index, feature_pipeline, base_estimator, last_refit_index=None, retraining_policy=None):
+        """
+        Saves the models trained after the timepoint with joblib, which stores the numpy arrays so that they can be
+        memory-mapped when the models are restored
+        :param index: the index in the data stream
+        :param feature_pipeline: the fitted feature pipeline
+        :param base_estimator: the fitted base estimator
+        :param last_refit_index: the index at which the models were last refitted on the whole window
+        :param retraining_policy: the retraining policy, whose state, e.g. of the drift detector, depends on the models
+        """
+        models = {
+            "index": index,
+            "feature_pipeline": feature_pipeline,
+            "base_estimator": base_estimator,
+            "last_refit_index": last_refit_index,
+            "retraining_policy": retraining_policy
+        }
+        path = os.path.join(self.directory, const.models_filename)
+        tmp_path = os.path.join(self.directory, "tmp_" + const.models_filename)
+        joblib.dump(models, tmp_path)
+        os.replace(tmp_path, path)
+
+    def restore_models(self, index):
+        """
+        Restores the models if they were trained after the timepoint. The numpy arrays are memory-mapped copy-on-write,
+        so that the models can still be updated in memory
+        :param index: the index in the data stream up to which the data stream is restored
+        :return: dict with the feature_pipeline, the base_estimator, the last_refit_index and the retraining_policy. None
+        if no models were saved for the index
+        """
+        path = os.path.join(self.directory, const.models_filename)
+        if not os.path.isfile(path):
+            return None
+
+        models = joblib.load(path, mmap_mode="c")
+        return models if models["index"] == index else None
+
+    @staticmethod
+    def write(obj, path):
+        """
+        Pickles the object to a temporary file which then replaces the file at path, so that a checkpoint is never
+        partially written
+        :param obj: the object
+        :param path: the path of the file
+        """
+        directory, filename = os.path.split(path)
+        # keep the extension so that the same compression is inferred
+        tmp_path = os.path.join(directory, "tmp_" + filename)
+        pd.to_pickle(obj, tmp_path)
+        os.replace(tmp_path, path)
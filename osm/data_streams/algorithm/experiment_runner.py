@@ -0,0 +1,109 @@
+import random
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.model_selection import ParameterGrid
+
+
+class ExperimentRunner(object):
+    """
+    Runs the data stream for every configuration of a parameter grid, e.g. every combination of active learner,
+    budget, oracle availability, window and forgetting strategy. The configurations are run in parallel in a pool of
+    worker processes
+    """
+    def __init__(self,
+                 build_framework,
+                 param_grid,
+                 n_jobs=1,
+                 random_state=None,
+                 layout_params=("strategy", "availability"),
+                 debug=True) -> None:
+        """
+        :param build_framework: callable that returns the FrameWork for a configuration. It is called with the
+        parameters of the configuration and the result_name as keyword arguments and must be picklable
+        :param param_grid: dict or list of dicts: the parameter grid, see sklearn.model_selection.ParameterGrid
+        :param n_jobs: the number of worker processes. -1 uses all the processors
+        :param random_state: int: the seed from which the seeds of the configurations are drawn. Default: None
+        :param layout_params: the parameters that are already part of the results layout of the FrameWork
+        (results/<strategy>/<availability>). The other parameters that vary in the grid are used to build the
+        result_name of a configuration, so that the results of the configurations do not overwrite each other
+        :param debug: If True prints debug messages to console
+        """
+        if not callable(build_framework):
+            raise ValueError("The build_framework should be callable")
+
+        if n_jobs is None or n_jobs == 0:
+            raise ValueError("Please specify the number of jobs")
+
+        self.build_framework = build_framework
+        self.param_grid = ParameterGrid(param_grid)
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.layout_params = layout_params
+        self.debug = debug
+
+    def get_configurations(self):
+        """
+        Gets the configurations of the parameter grid together with their result name and seed
+        :return: list of (configuration, result_name, seed)
+        """
+        configurations = list(self.param_grid)
+
+        # parameters that take more than one value and are not part of the results layout
+        varying = {}
+        for configuration in configurations:
+            for param, value in configuration.items():
+                varying.setdefault(param, set()).add(repr(value))
+        varying = sorted(param for param, values in varying.items()
+                         if len(values) > 1 and param not in self.layout_params)
+
+        # draw an independent seed for every configuration
+        seeds = np.random.RandomState(self.random_state).randint(np.iinfo(np.int32).max, size=len(configurations))
+
+        return [(configuration, self.get_result_name(configuration, varying), seed)
+                for configuration, seed in zip(configurations, seeds)]
+
+    @staticmethod
+    def get_result_name(configuration, params):
+        """
+        Builds the name of the result directory of a configuration
+        :param configuration: the configuration
+        :param params: the parameters used in the name
+        :return: the result name. None if no parameter is used in the name
+        """
+        if not params:
+            return None
+        return "_".join(str.format("{0}={1}", param, configuration[param]) for param in params)
+
+    def run(self):
+        """
+        Runs the data stream for all the configurations
+        :return: list of (configuration, directory of the results)
+        """
+        configurations = self.get_configurations()
+
+        verbose = 10 if self.debug else 0
+        dirs = Parallel(n_jobs=self.n_jobs, verbose=verbose)(
+            delayed(run_experiment)(self.build_framework, configuration, result_name, seed)
+            for configuration, result_name, seed in configurations)
+
+        return [(configuration, dir_result) for (configuration, _, _), dir_result in zip(configurations, dirs)]
+
+
+def run_experiment(build_framework, configuration, result_name=None, seed=None):
+    """
+    Runs the data stream for a single configuration. Runs in the worker process
+    :param build_framework: callable that returns the FrameWork for the configuration
+    :param configuration: dict: the parameters of the configuration
+    :param result_name: the name of the result directory of the configuration
+    :param seed: the seed of the random number generators of the worker
+    :return: the directory of the results
+    """
+    # seed the random number generators used by the active learners, oracles and forgetting strategies
+    random.seed(seed)
+    np.random.seed(seed)
+
+    framework = build_framework(result_name=result_name, **configuration)
+    framework.process_data_stream()
+
+    return framework.dir_result
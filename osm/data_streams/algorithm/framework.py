@@ -1,8 +1,10 @@
 import os
-import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime
+from itertools import takewhile
+from time import perf_counter
 
-import jsonpickle
 import pandas as pd
 import time
 from sklearn.base import BaseEstimator
@@ -11,9 +13,20 @@ from sklearn.pipeline import FeatureUnion, Pipeline
 import osm.data_streams.constants as const
 from osm.data_streams.abstract_base_class import AbstractBaseClass
 from osm.data_streams.active_learner.strategy.abstract_strategy import AbstractActiveLearningStrategy
+from osm.data_streams.algorithm.checkpoint import CheckpointLog
+from osm.data_streams.algorithm.prefetcher import Prefetcher
+from osm.data_streams.evaluation.inference_result import InferenceResult
 from osm.data_streams.evaluation.strategy.abstract_evaluation_strategy import AbstractEvaluationStrategy
 from osm.data_streams.evaluation.strategy.prequential import Prequential
+from osm.data_streams.memory_usage import get_object_size, get_peak_rss, get_rss, get_vocabularies
+from osm.data_streams.metrics_recorder import MetricsRecorder
 from osm.data_streams.oracle.availability_aware_oracle import AvailabilityAwareOracle
+from osm.data_streams.profiler import Profiler
+from osm.data_streams.retraining_policy.abstract_retraining_policy import AbstractRetrainingPolicy
+from osm.data_streams.retraining_policy.always_retraining import AlwaysRetraining
+from osm.data_streams.retraining_policy.interval_retraining import IntervalRetraining
+from osm.data_streams.stream_source.abstract_stream_source import AbstractStreamSource
+from osm.data_streams.stream_source.summary_file_stream_source import SummaryFileStreamSource
 from osm.data_streams.windows.abstract_window import AbstractWindow
 from osm.data_streams.windows.no_window import NoWindow
 
@@ -32,30 +45,74 @@ class FrameWork(AbstractBaseClass):
                  active_learner=None,
                  window=None,
                  evaluation_strategy=None,
+                 incremental=False,
+                 refit_interval=None,
+                 prefetch=0,
+                 result_name=None,
+                 compaction_interval=10,
+                 stream_source=None,
+                 ild_workers=None,
+                 profiler=None,
+                 pipelined=False,
+                 checkpoint_models=False,
+                 retraining_policy=None,
                  debug=True) -> None:
 
         """
         Abstract class for the evaluation strategies in data streams
         :param summary_file: A pandas dataframe containing a column filename. Each file name is the relative path
         of the file from the directory of the summary_file. Each file contains data that needs to be processed. The
-        index of the filename gives the order in which the files need to be processed in the data stream
+        index of the filename gives the order in which the files need to be processed in the data stream. Not
+        required if the stream_source is specified
         :param base_estimator: The base estimator
-        :param feature_pipeline: The pipeline to build the features
+        :param feature_pipeline: The pipeline to build the features. If the storage of the window vectorizes the data,
+        e.g. the SparseStorage, the pipeline is applied to the vectorized features, starting with a SparseFeatureSelector
         :param target_col_name: the name of the target column
         :param ild_timepoint: the timepoint until which the initially labeled data is considered
         :param active_learner: the active learner
         :param evaluation_strategy: the evaluation strategy to be used. Default: prequential evaluation
         :param window: The type of Window to use
+        :param incremental: If True the base estimator is updated with partial_fit on the newly labeled data when the
+        models are not refitted on the whole window
+        :param refit_interval: Only used if incremental is True. The number of timepoints after which the feature
+        pipeline and the base estimator are refitted on the whole window, same as an IntervalRetraining policy.
+        Default: None (never refit)
+        :param prefetch: The number of timepoints that are read ahead in a background thread while the current
+        timepoint is processed. Default: 0 (no prefetching)
+        :param result_name: The name of an additional directory in results/<strategy>/<availability> in which the
+        results are stored. Used to separate the results of runs that differ in other parameters. Default: None
+        :param compaction_interval: The number of incremental checkpoints after which the summary and the window data
+        are saved in full. Default: 10
+        :param stream_source: AbstractStreamSource: the source of the data stream. Default: the summary file
+        :param ild_workers: The number of threads used to read the timepoints of the initially labeled data
+        concurrently. Default: None (the default number of workers of the ThreadPoolExecutor)
+        :param profiler: Profiler: times the stages of every timepoint and records them in the Time Statistics of the
+        summary. If the profiler samples the memory, the size of the window data and of the vocabulary of the feature
+        pipeline are recorded after training as well. Default: a profiler without hooks, cProfile or memory sampling
+        :param pipelined: If True copies of the models are trained in a background thread while the main loop saves
+        the checkpoint and reads the next timepoint. The trained models are swapped in before the next timepoint is
+        tested, so the evaluation is still prequential. The stages of the background training are timed, but their
+        memory is not sampled by the profiler. Default: False
+        :param checkpoint_models: If True the fitted feature pipeline and base estimator are saved after every
+        training, so that a restored data stream continues without retraining. The models are written in full at every
+        timepoint, so this is only worth it if the training takes longer than writing them. Default: False
+        :param retraining_policy: AbstractRetrainingPolicy: decides after every timepoint if the feature pipeline and
+        the base estimator are refitted on the whole window, e.g. only if a drift is detected. If the models are not
+        refitted they are kept as they are, or updated with partial_fit if incremental is True. Default: refit after
+        every timepoint, or as specified by refit_interval if incremental is True
         """
         super().__init__()
-        if summary_file is None:
-            raise ValueError("Please pass the summary file")
+        if summary_file is None and stream_source is None:
+            raise ValueError("Please pass the summary file or the stream source")
 
-        if not os.path.isfile(summary_file):
-            raise ValueError("The summary file does not exist")
+        if summary_file is not None and stream_source is not None:
+            raise ValueError("Please pass either the summary file or the stream source")
 
-        if not "".join(pathlib.Path(summary_file).suffixes) == ".pkl.gzip":
-            raise ValueError("The summary file should have a valid extension (*.pkl.gzip)")
+        if stream_source is not None and not isinstance(stream_source, AbstractStreamSource):
+            raise ValueError("The stream_source must be an instance of AbstractStreamSource")
+
+        if stream_source is None:
+            stream_source = SummaryFileStreamSource(summary_file)
 
         if not isinstance(base_estimator, BaseEstimator):
             raise ValueError("The base_estimator must be an instance of BaseEstimator")
@@ -63,6 +120,27 @@ class FrameWork(AbstractBaseClass):
         if not hasattr(base_estimator, "predict_proba"):
             raise ValueError("The base_estimator should be able to predict probabilities")
 
+        if incremental and not hasattr(base_estimator, "partial_fit"):
+            raise ValueError("The base_estimator should support partial_fit for incremental training")
+
+        if refit_interval is not None and refit_interval <= 0:
+            raise ValueError("The refit_interval should be a positive integer")
+
+        if refit_interval is not None and not incremental:
+            raise ValueError("The refit_interval is only used for incremental training")
+
+        if retraining_policy is not None and not isinstance(retraining_policy, AbstractRetrainingPolicy):
+            raise ValueError("The retraining_policy must be an instance of AbstractRetrainingPolicy")
+
+        if retraining_policy is not None and refit_interval is not None:
+            raise ValueError("Please pass either the refit_interval or the retraining_policy")
+
+        if prefetch is None or prefetch < 0:
+            raise ValueError("The prefetch should be a non negative integer")
+
+        if ild_workers is not None and ild_workers <= 0:
+            raise ValueError("The ild_workers should be a positive integer")
+
         if not isinstance(feature_pipeline, FeatureUnion) and not isinstance(feature_pipeline, Pipeline):
             raise ValueError("The feature_pipeline must be an instance of FeatureUnion or Pipeline")
 
@@ -75,6 +153,9 @@ class FrameWork(AbstractBaseClass):
         if evaluation_strategy is not None and not isinstance(evaluation_strategy, AbstractEvaluationStrategy):
             raise ValueError("the evaluation_strategy must be an instance of AbstractEvaluationStrategy")
 
+        if profiler is not None and not isinstance(profiler, Profiler):
+            raise ValueError("The profiler must be an instance of Profiler")
+
         if window is None:
             # default is no windowing
             window = NoWindow()
@@ -83,7 +164,14 @@ class FrameWork(AbstractBaseClass):
             # default
             evaluation_strategy = Prequential(target_col_name)
 
+        if retraining_policy is None and not incremental:
+            # default is to refit after every timepoint
+            retraining_policy = AlwaysRetraining()
+        elif retraining_policy is None and refit_interval is not None:
+            retraining_policy = IntervalRetraining(refit_interval)
+
         self.summary = None
+        self.metrics = None
         self.base_estimator = base_estimator
         self.feature_pipeline = feature_pipeline
         self.active_learner = active_learner
@@ -93,10 +181,26 @@ class FrameWork(AbstractBaseClass):
         self.target_col_name = target_col_name
         self.evaluation_strategy = evaluation_strategy
         self.classes = None
+        self.incremental = incremental
+        self.refit_interval = refit_interval
+        self.retraining_policy = retraining_policy
+        self.last_refit_index = None
+        self.prefetch = prefetch
+        self.stream_source = stream_source
+        self.ild_workers = ild_workers
+        self.profiler = Profiler() if profiler is None else profiler
+        self.pipelined = pipelined
+        self.checkpoint_models = checkpoint_models
+        self.executor = None
+        self.training = None
+        self.timepoints = None
+
+        # True if the base estimator predicts the class with the highest probability, checked after every training
+        self.predicts_argmax = None
 
         # paths
-        self.summary_filename = os.path.basename(summary_file)
-        self.dir = os.path.dirname(summary_file)
+        self.summary_filename = stream_source.get_summary_filename()
+        self.dir = stream_source.get_directory()
 
         oracle_availability = ""
         strategy = ""
@@ -110,18 +214,38 @@ class FrameWork(AbstractBaseClass):
         self.dir_result = self.create_dir(self.dir, "results")
         self.dir_result = self.create_dir(self.dir_result, strategy)
         self.dir_result = self.create_dir(self.dir_result, str(oracle_availability))
+        if result_name is not None:
+            self.dir_result = self.create_dir(self.dir_result, str(result_name))
+
+        self.checkpoint = CheckpointLog(self.dir_result, self.summary_filename, compaction_interval)
+
+        # time the forgetting of the window and the queries of the active learner with the same profiler
+        if self.profiler.directory is None:
+            self.profiler.directory = os.path.join(self.dir_result, const.profile_dir)
+        self.window.set_profiler(self.profiler)
+        if self.active_learner is not None:
+            self.active_learner.set_profiler(self.profiler)
+
+        # the window counts the classes as the data is added and forgotten, which gives the window stats
+        self.window.set_target_col_name(target_col_name)
 
     @staticmethod
     def create_dir(path, dir):
         path = os.path.join(path, dir)
-        if not os.path.exists(path):
-            os.mkdir(path)
+        # the directory may be created concurrently by the other runs of an experiment
+        os.makedirs(path, exist_ok=True)
         return path
 
     def __getstate__(self):
         state = super().__getstate__()
         del state["summary"]
+        del state["metrics"]
         del state["feature_pipeline"]
+        del state["checkpoint"]
+        del state["timepoints"]
+        del state["executor"]
+        del state["training"]
+        del state["predicts_argmax"]
         state["ild_timepoint"] = str(self.ild_timepoint)
         return state
 
@@ -129,25 +253,25 @@ class FrameWork(AbstractBaseClass):
         """
         Initialize the data stream
         """
+        # the timepoints of the data stream in the order of the rows of the summary
+        self.timepoints = list(self.read_summary().index)
 
-        if os.path.isfile(os.path.join(self.dir_result, self.summary_filename)):
+        if self.checkpoint.exists():
             # restore if part of the stream is already processed
             self.log("Restoring the window state")
             self.restore_state()
+            models_restored = self.restore_models()
+
+            # the processed timepoints are not read again
+            self.stream_source.skip([self.timepoints[index] for index, row in self.summary.iterrows()
+                                     if row[(const.summary_level, const.processed)]])
         else:
+            models_restored = False
+
             self.log("Initializing")
 
             # read the summary file
-            self.summary = pd.read_pickle(os.path.join(self.dir, self.summary_filename))
-
-            if not isinstance(self.summary, pd.DataFrame):
-                raise ValueError("The summary file specified is not a dataframe")
-
-            if self.summary.empty:
-                raise ValueError("The summary file is empty")
-
-            if const.filename_col not in self.summary.columns.values:
-                raise ValueError("The summary file does not contain a column 'filename'")
+            self.summary = self.read_summary()
 
             # flag in the summary to check if the file is processed
             self.summary[const.processed] = False
@@ -157,18 +281,10 @@ class FrameWork(AbstractBaseClass):
                 self.ild_timepoint = self.summary.index.values[0]
 
             # get the initially labeled data
-            ild = pd.DataFrame()
-            timepoint = -1
-            for index, row in self.summary.iterrows():
-                if index > self.ild_timepoint:
-                    break
-
-                self.log(str.format("Adding data from {0} to the initially labeled data", index))
-
-                data = pd.read_pickle(os.path.join(self.dir, row[const.filename_col]))
-                ild = ild.append(data)
-                self.summary.loc[index, const.processed] = True
-                timepoint += 1
+            ild_timepoints = list(takewhile(lambda tp: tp <= self.ild_timepoint, self.summary.index))
+            ild = self.read_ild(ild_timepoints)
+            self.summary.loc[ild_timepoints, const.processed] = True
+            timepoint = len(ild_timepoints) - 1
 
             # set the window data to be the ild
             self.window.set_index(timepoint)
@@ -182,10 +298,8 @@ class FrameWork(AbstractBaseClass):
 
             self.summary = pd.concat(summary, axis=1)
 
-            # create the time statistics columns
-            pd_index = pd.MultiIndex.from_product([[const.time_stats], [const.train_time, const.test_time, const.sample_time]])
-            time_stats = pd.DataFrame(index=pd_index).T.copy()
-            self.summary = pd.concat([self.summary, time_stats])
+            # create the recorder of the metrics
+            self.metrics = MetricsRecorder(index=self.summary.index.values)
 
             # log the parameters
             self.log_parameters()
@@ -193,146 +307,469 @@ class FrameWork(AbstractBaseClass):
             # save the data
             self.save_state(index=timepoint)
 
+        # write the timings of the stages to the summary
+        self.profiler.set_recorder(self.metrics)
+
         # get the distinct clases
         self.classes = sorted(self.window.get_window_data()[self.target_col_name].unique())
 
-        # train the classifier with the ild
-        self.train(index=max(self.window.get_window_data().index.levels[0]))
+        if models_restored:
+            self.log("Continuing with the models of the checkpoint")
+        else:
+            # train the classifier with the ild
+            self.train(index=self.window.get_last_index())
+
+    def read_ild(self, timepoints):
+        """
+        Reads the data of the timepoints of the initially labeled data concurrently and concatenates it once
+        :param timepoints: the timepoints of the initially labeled data in the order of the data stream
+        :return: the initially labeled data
+        """
+        for timepoint in timepoints:
+            self.log(str.format("Adding data from {0} to the initially labeled data", timepoint))
+
+        if len(timepoints) == 0:
+            return pd.DataFrame()
+
+        # the files are read in threads as most of the time is spent in I/O and decompression
+        with ThreadPoolExecutor(max_workers=self.ild_workers) as executor:
+            data = list(executor.map(self.stream_source.read, timepoints))
 
-    def train(self, index, test_data=None):
+        return pd.concat(data, sort=False)
+
+    def train(self, index, labeled_data=None):
+        """
+        Trains the base estimator. The feature pipeline and the base estimator are refitted on the whole window
+        unless incremental training is enabled, in which case the base estimator is only updated with the labeled data.
+        In the pipelined mode copies of the models are trained in the background and swapped in by wait_for_training
+        :param index: the index in the data stream
+        :param labeled_data: the data that was labeled in this timepoint
+        """
         train_time = time.time()
 
+        # the models are swapped before the next training, so that the copies are made from the latest models
+        self.wait_for_training()
+
         # log the window stats
-        stats = self.window.get_window_stats(index=index, classes=self.classes.copy(), target_col_name=self.target_col_name)
-        self.summary = self.summary.combine_first(stats)
+        with self.profiler.stage(index, const.window_stats_time):
+            self.window.get_window_stats(index=index, classes=self.classes.copy(),
+                                         target_col_name=self.target_col_name, recorder=self.metrics)
+
+        if self.retraining_policy is not None:
+            self.retraining_policy.get_stats(index=index, recorder=self.metrics)
+
+        refit_required = self.is_refit_required(index)
+        self.metrics.record(index, (const.retraining_stats, const.retrained), int(refit_required))
+
+        if refit_required:
+            # the window data is a snapshot, as the window is updated while the models are trained in the background
+            refit = True
+            train_data = self.window.get_window_data()
+            train_features = self.window.get_window_features()
+            train_weights = self.window.get_sample_weights(train_data)
+            self.last_refit_index = index
+        elif self.incremental and labeled_data is not None and not labeled_data.empty:
+            refit = False
+            train_data = labeled_data
+            train_features = self.window.transform(labeled_data)
+            train_weights = self.window.get_sample_weights(labeled_data)
+        else:
+            refit = False
+            train_data = None
+            train_features = None
+            train_weights = None
+
+        if self.pipelined and train_data is not None:
+            if self.executor is None:
+                # a single worker, as the models of a timepoint are trained from the models of the previous timepoint
+                self.executor = ThreadPoolExecutor(max_workers=1)
+
+            feature_pipeline, base_estimator = deepcopy((self.feature_pipeline, self.base_estimator))
+
+            # the state of the retraining policy that is saved with the models, as the main loop updates the policy
+            retraining_policy = deepcopy(self.retraining_policy) if self.checkpoint_models else None
+
+            # the stages of the background thread are timed without sampling the memory and recorded by
+            # wait_for_training, as the recorder and the peaks of tracemalloc are shared with the main loop
+            timings = []
+            profiler = Profiler(hooks=[lambda *timing: timings.append(timing)])
+
+            training = self.executor.submit(self.fit, index, refit, train_data, train_features, train_weights,
+                                            feature_pipeline, base_estimator, train_time, profiler)
+            self.training = (training, index, timings, retraining_policy)
+        else:
+            feature_pipeline, base_estimator, train_time = self.fit(index, refit, train_data, train_features,
+                                                                    train_weights, self.feature_pipeline,
+                                                                    self.base_estimator, train_time, self.profiler)
+            self.complete_training(index, feature_pipeline, base_estimator, train_time, self.retraining_policy)
+
+    def fit(self, index, refit, train_data, train_features, train_weights, feature_pipeline, base_estimator,
+            train_time, profiler):
+        """
+        Fits the models. In the pipelined mode this runs in the background thread
+        :param index: the index in the data stream
+        :param refit: If True the models are refitted on the train data, else the base estimator is updated
+        :param train_data: the data in the window or the labeled data. None if there is nothing to train on
+        :param train_features: the train data as transformed by the window, the input of the feature pipeline
+        :param train_weights: the sample weights of the train data. None if the window does not weight the data
+        :param feature_pipeline: the feature pipeline to fit
+        :param base_estimator: the base estimator to fit
+        :param train_time: the time at which the training started
+        :param profiler: Profiler: times the stages of the fit
+        :return: the fitted feature pipeline and base estimator, and the time taken since the start of the training
+        """
+        if refit:
+            self.refit(index, train_data, train_features, train_weights, feature_pipeline, base_estimator, profiler)
+        elif train_data is not None:
+            self.partial_fit(index, train_data, train_features, train_weights, feature_pipeline, base_estimator,
+                             profiler)
+
+        return feature_pipeline, base_estimator, time.time() - train_time
+
+    def complete_training(self, index, feature_pipeline, base_estimator, train_time, retraining_policy):
+        """
+        Records the time taken by the training and the memory stats, and saves the fitted models. This runs in the main
+        thread, after the models trained in the background are fitted in the pipelined mode
+        :param index: the index in the data stream
+        :param feature_pipeline: the fitted feature pipeline
+        :param base_estimator: the fitted base estimator
+        :param train_time: the time taken by the training
+        :param retraining_policy: the state of the retraining policy that is saved with the models
+        """
+        # log the time taken
+        self.metrics.record(index, (const.time_stats, const.train_time), train_time)
+
+        # the fitted models are checked again on the next test data
+        self.predicts_argmax = None
+
+        if self.profiler.memory is not None:
+            self.record_memory_stats(index, feature_pipeline)
+
+        if self.checkpoint_models:
+            self.checkpoint.save_models(index=index,
+                                        feature_pipeline=feature_pipeline,
+                                        base_estimator=base_estimator,
+                                        last_refit_index=self.last_refit_index,
+                                        retraining_policy=retraining_policy)
+
+    def wait_for_training(self):
+        """
+        Waits until the models trained in the background are fitted, records the training and swaps the fitted models
+        with the current models
+        """
+        if self.training is None:
+            return
+
+        training, index, timings, retraining_policy = self.training
+        self.training = None
+
+        # an exception raised during the training is raised here
+        feature_pipeline, base_estimator, train_time = training.result()
 
-        # get the training data
-        train_data = self.window.get_window_data()
+        for timing in timings:
+            self.profiler.record(*timing)
+        self.complete_training(index, feature_pipeline, base_estimator, train_time, retraining_policy)
 
+        self.feature_pipeline, self.base_estimator = feature_pipeline, base_estimator
+
+    def record_memory_stats(self, index, feature_pipeline):
+        """
+        Records the size of the window data and of the vocabulary of the fitted feature pipeline, and the current and
+        the peak resident set size of the process. The peak is the high-water mark since the process started
+        :param index: the index in the data stream
+        :param feature_pipeline: the fitted feature pipeline
+        """
+        self.window.get_memory_stats(index=index, recorder=self.metrics)
+
+        vocabularies = get_vocabularies(feature_pipeline)
+        if self.window.get_vectorizer() is not None:
+            vocabularies += get_vocabularies(self.window.get_vectorizer())
+        self.metrics.record(index, (const.memory_stats, const.vocabulary_size),
+                            sum(len(vocabulary) for vocabulary in vocabularies))
+        self.metrics.record(index, (const.memory_stats, const.vocabulary_bytes),
+                            sum(get_object_size(vocabulary) for vocabulary in vocabularies))
+
+        self.metrics.record(index, (const.memory_stats, const.rss), get_rss())
+        self.metrics.record(index, (const.memory_stats, const.peak_rss), get_peak_rss())
+
+        self.log(str.format("Index: {0}\tWindow: {1} bytes\tRSS: {2} bytes\tPeak RSS: {3} bytes", index,
+                            self.metrics.get(index, (const.window_memory, const.total)),
+                            self.metrics.get(index, (const.memory_stats, const.rss)),
+                            self.metrics.get(index, (const.memory_stats, const.peak_rss))))
+
+    def is_refit_required(self, index):
+        """
+        Checks if the feature pipeline and the base estimator need to be refitted on the whole window
+        :param index: the index in the data stream
+        :return: True if a full refit is required
+        """
+        if self.last_refit_index is None:
+            return True
+
+        if self.retraining_policy is None:
+            # incremental training without refitting
+            return False
+
+        return self.retraining_policy.is_retraining_required(index, self.last_refit_index)
+
+    def refit(self, index, train_data, train_features, train_weights, feature_pipeline, base_estimator, profiler):
+        """
+        Refits the feature pipeline and the base estimator on the data in the window
+        :param index: the index in the data stream
+        :param train_data: the data in the window
+        :param train_features: the features of the data in the window
+        :param train_weights: the sample weights of the data in the window. None if the data is not weighted
+        :param feature_pipeline: the feature pipeline to fit
+        :param base_estimator: the base estimator to fit
+        :param profiler: Profiler: times the stages of the refit
+        """
         # log to console the number of instances in the window
         self.log(str.format("Index: {0}\tTrain Data: {1}", index, len(train_data)))
 
         # create features
-        train_feature = self.feature_pipeline.fit_transform(train_data, train_data[self.target_col_name])
+        with profiler.stage(index, const.pipeline_fit_time):
+            train_feature = feature_pipeline.fit_transform(train_features, train_data[self.target_col_name])
 
         # train the classifier
-        self.base_estimator.fit(train_feature, train_data[self.target_col_name])
+        with profiler.stage(index, const.estimator_fit_time):
+            if train_weights is None:
+                base_estimator.fit(train_feature, train_data[self.target_col_name])
+            else:
+                base_estimator.fit(train_feature, train_data[self.target_col_name], sample_weight=train_weights)
+
+    def partial_fit(self, index, labeled_data, labeled_features, labeled_weights, feature_pipeline, base_estimator,
+                    profiler):
+        """
+        Updates the base estimator with the labeled data. The fitted feature pipeline is not changed
+        :param index: the index in the data stream
+        :param labeled_data: the data that was labeled in this timepoint
+        :param labeled_features: the labeled data as transformed by the window
+        :param labeled_weights: the sample weights of the labeled data. None if the data is not weighted
+        :param feature_pipeline: the fitted feature pipeline
+        :param base_estimator: the base estimator to update
+        :param profiler: Profiler: times the stages of the update
+        """
+        # log to console the number of instances used for the update
+        self.log(str.format("Index: {0}\tPartial Train Data: {1}", index, len(labeled_data)))
 
-        train_time = time.time() - train_time
+        # create features using the fitted pipeline
+        with profiler.stage(index, const.transform_time):
+            labeled_feature = feature_pipeline.transform(labeled_features)
 
-        # log the time taken
-        self.summary.loc[index, (const.time_stats, const.train_time)] = train_time
+        # update the classifier
+        with profiler.stage(index, const.estimator_fit_time):
+            if labeled_weights is None:
+                base_estimator.partial_fit(labeled_feature, labeled_data[self.target_col_name], classes=self.classes)
+            else:
+                base_estimator.partial_fit(labeled_feature, labeled_data[self.target_col_name], classes=self.classes,
+                                           sample_weight=labeled_weights)
 
     def test(self, index, test_data):
+        """
+        Evaluates the base estimator on the test data
+        :param index: the index in the data stream
+        :param test_data: the test data
+        :return: InferenceResult: the features and predictions of the test data
+        """
         test_time = time.time()
 
-        # evaluate the test data
-        evaluation_stats = self.evaluation_strategy.evaluate(index=index,
-                                                             classifier=self.base_estimator,
-                                                             feature_pipeline=self.feature_pipeline,
-                                                             test_data=test_data)
-
-        # update the stats to the  summary table
-        self.summary = self.summary.combine_first(evaluation_stats)
+        # create the test features and get the predictions once for the evaluation and the sampling
+        with self.profiler.stage(index, const.transform_time):
+            test_feature = self.feature_pipeline.transform(self.window.transform(test_data))
+
+        with self.profiler.stage(index, const.predict_time):
+            inference = InferenceResult.from_features(self.base_estimator, test_feature, self.predicts_argmax)
+            self.predicts_argmax = inference.predicts_argmax
+
+        # evaluate the test data and record the stats
+        with self.profiler.stage(index, const.evaluation_time):
+            self.evaluation_strategy.evaluate(index=index,
+                                              classifier=self.base_estimator,
+                                              feature_pipeline=self.feature_pipeline,
+                                              test_data=test_data,
+                                              inference=inference,
+                                              recorder=self.metrics)
+
+        # the prequential errors decide if the models are refitted after this timepoint
+        if self.retraining_policy is not None:
+            self.retraining_policy.update(index=index,
+                                          y_true=test_data[self.target_col_name],
+                                          inference=inference,
+                                          classes=getattr(self.base_estimator, "classes_", self.classes))
 
         test_time = time.time() - test_time
 
         # log the time taken
-        self.summary.loc[index, (const.time_stats, const.test_time)] = test_time
+        self.metrics.record(index, (const.time_stats, const.test_time), test_time)
 
-    def sample_data(self, index, test_data):
-        sample_time = time.time()
+        return inference
 
-        # create the test feature
-        test_features = self.feature_pipeline.transform(test_data)
+    def sample_data(self, index, test_data, inference=None):
+        """
+        Queries the oracle for the labels of the test data using the active learner
+        :param index: the index in the data stream
+        :param test_data: the test data
+        :param inference: InferenceResult: the features and predictions of the test data if already computed
+        :return: the labeled data
+        """
+        sample_time = time.time()
 
-        # get probabilities
-        prob = self.base_estimator.predict_proba(test_features)
+        if inference is None:
+            # create the test features and get the probabilities
+            inference = InferenceResult.from_data(self.base_estimator, self.feature_pipeline,
+                                                  self.window.transform(test_data), self.predicts_argmax)
+            self.predicts_argmax = inference.predicts_argmax
 
         # sample data
-        sampled_data = self.active_learner.get_labels(data=test_data, proba=prob, index=index)
+        sampled_data = self.active_learner.get_labels(data=test_data, proba=inference.y_predict_proba, index=index)
 
         # log the stats
-        stats = self.active_learner.get_stats(index=index)
-        self.summary = self.summary.combine_first(stats)
+        self.active_learner.get_stats(index=index, recorder=self.metrics)
 
         sample_time = time.time() - sample_time
 
         # log the time taken
-        self.summary.loc[index, (const.time_stats, const.sample_time)] = sample_time
+        self.metrics.record(index, (const.time_stats, const.sample_time), sample_time)
 
         return sampled_data
 
     def get_next_timepoint(self):
         """
-        Gets the data for the next timepoint
+        Gets the data for the next timepoint. If prefetching is enabled the data of the next timepoints is read in
+        a background thread
         :return: index, data
         """
-        max_index = max(self.summary.index.values)
-        for index, row in self.summary.iterrows():
-            if row[(const.summary_level, const.processed)] or index > max_index:
-                continue
-            data = pd.read_pickle(
-                os.path.join(self.dir, row[(const.summary_level, const.filename_col)]))
+        # collect the timepoints up front, as the summary is updated while the data stream is processed
+        timepoints = [(index, self.timepoints[index])
+                      for index, row in self.summary.iterrows()
+                      if not row[(const.summary_level, const.processed)]]
+
+        reader = (self.read_timepoint(index, timepoint) for index, timepoint in timepoints)
+
+        if self.prefetch > 0:
+            reader = Prefetcher(reader, size=self.prefetch)
+
+        for index, data, read_time in reader:
+            # the read time is recorded here, as the data may have been read in the background thread
+            self.profiler.record(index, const.read_time, read_time)
             yield index, data
 
+    def read_timepoint(self, index, timepoint):
+        """
+        Reads the data of a timepoint from the stream source
+        :param index: the index in the data stream
+        :param timepoint: the timepoint
+        :return: index, data, the time taken to read the data
+        """
+        read_time = perf_counter()
+        data = self.stream_source.read(timepoint)
+        return index, data, perf_counter() - read_time
+
     def process_data_stream(self):
         """
         Call this function to start processing the data stream
         """
 
-        # initialize
-        self.initialize()
+        try:
+            # initialize
+            self.initialize()
+
+            # get the data from the next timepoint
+            for index, data in self.get_next_timepoint():
 
-        # get the data from the next timepoint
-        for index, data in self.get_next_timepoint():
+                # send console message
+                self.log(message=str.format("Index: {0}\tProcess Started", index))
 
-            # send console message
-            self.log(message=str.format("Index: {0}\tProcess Started", index))
+                with self.profiler.profile(index):
+                    # the models trained on the previous timepoint are used to test this timepoint
+                    self.wait_for_training()
 
-            # test data
-            self.test(index=index, test_data=data)
+                    # test data
+                    inference = self.test(index=index, test_data=data)
 
-            # sample data
-            labeled_data = self.sample_data(index=index, test_data=data)
+                    # sample data
+                    labeled_data = self.sample_data(index=index, test_data=data, inference=inference)
 
-            # add labeled data to window
-            self.window.add(labeled_data)
+                    # add labeled data to window
+                    self.window.add(labeled_data)
 
-            # save the state
-            self.save_state(index=index)
+                    # train for the next iteration
+                    self.train(index=index, labeled_data=labeled_data)
 
-            # train for the next iteration
-            self.train(index=index)
+                    # save the state while the models are trained in the pipelined mode
+                    self.save_state(index=index)
 
-            # send console message
-            self.log(message=str.format("Index: {0}\tProcess Completed", index))
+                # send console message
+                self.log(message=str.format("Index: {0}\tProcess Completed", index))
+
+            self.wait_for_training()
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+                self.executor = None
+                self.training = None
+
+        # write the complete summary and window data at the end of the data stream
+        self.checkpoint.compact(index=self.checkpoint.last_index, summary=self.summary, metrics=self.metrics,
+                                window=self.window)
 
     def save_state(self, index):
         """
-        Saves the current progress and the data in the window
+        Saves the current progress and the changes to the data in the window
         """
         # mark as processed
         self.summary.loc[index, (const.summary_level, const.processed)] = True
 
-        # save the data in the window
-        self.summary.loc[:, :].to_pickle(os.path.join(self.dir_result, self.summary_filename))
-
-        # save the summary file
-        self.window.get_window_data().to_pickle(os.path.join(self.dir_result, const.window_data_filename))
+        # append the checkpoint to the log
+        with self.profiler.stage(index, const.checkpoint_time):
+            self.checkpoint.save(index=index, summary=self.summary, metrics=self.metrics, window=self.window)
 
     def restore_state(self):
         """
         Restore the state of the stream processing
         """
-        # restore the summary file
-        self.summary = pd.read_pickle(os.path.join(self.dir_result, self.summary_filename))
+        # restore the summary file and the window data
+        summary = self.checkpoint.restore(window=self.window)
 
-        index = max(self.summary[self.summary.loc[:, (const.summary_level, const.processed)]].index.values)
+        # separate the metrics from the columns of the summary file
+        columns = list(self.read_summary().reset_index(drop=False).columns.values) + [const.processed]
+        columns = pd.MultiIndex.from_product([[const.summary_level], columns])
 
-        # restore the window data
-        data = pd.read_pickle(os.path.join(self.dir_result, const.window_data_filename))
-        self.window.restore_window(index=index, data=data)
+        self.summary = summary.loc[:, columns]
+        self.metrics = MetricsRecorder.from_frame(summary.drop(columns=columns))
+
+    def restore_models(self):
+        """
+        Restores the models that were trained after the last processed timepoint of the checkpoint
+        :return: True if the models were restored, False if they need to be retrained
+        """
+        if not self.checkpoint_models:
+            return False
+
+        models = self.checkpoint.restore_models(index=self.checkpoint.last_index)
+        if models is None:
+            return False
+
+        self.feature_pipeline = models["feature_pipeline"]
+        self.base_estimator = models["base_estimator"]
+        self.last_refit_index = models["last_refit_index"]
+        self.retraining_policy = models.get("retraining_policy", self.retraining_policy)
+        return True
+
+    def read_summary(self):
+        """
+        Reads the summary of the data stream from the stream source
+        :return: the summary
+        """
+        summary = self.stream_source.get_summary()
+
+        if not isinstance(summary, pd.DataFrame):
+            raise ValueError("The summary specified is not a dataframe")
+
+        if summary.index.empty:
+            raise ValueError("The summary is empty")
+
+        return summary
 
     def log(self, message):
         """
@@ -346,6 +783,9 @@ class FrameWork(AbstractBaseClass):
         """
         Log the current parameters to a file called param.txt
         """
+        # only imported when the parameters are logged, as a restored data stream does not log them
+        import jsonpickle
+
         # create the file
         f = open(os.path.join(self.dir_result, "param.txt"), "w")
 
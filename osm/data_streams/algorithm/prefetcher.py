@@ -0,0 +1,72 @@
+import queue
+import threading
+
+
+class Prefetcher(object):
+    """
+    Iterates over an iterable while a background thread reads ahead the next items into a queue. The thread only
+    reads the next item once a slot is free, so that at most size items are read ahead and not yet consumed.
+    Used to hide the latency of reading the data of the next timepoints while the current timepoint is processed
+    """
+    # marks the end of the iterable in the queue
+    END = object()
+
+    def __init__(self, iterable, size=1) -> None:
+        """
+        :param iterable: the iterable to read from
+        :param size: the maximum number of items that are read ahead
+        """
+        if size is None or size < 1:
+            raise ValueError("The size should be a positive integer")
+
+        self.iterable = iterable
+        self.size = size
+        self.queue = queue.Queue()
+        self.slots = threading.Semaphore(size)
+        self.stopped = threading.Event()
+
+    def __iter__(self):
+        thread = threading.Thread(target=self.read, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item, error = self.queue.get()
+                self.slots.release()
+
+                # raise the errors of the background thread in the consumer
+                if error is not None:
+                    raise error
+
+                if item is Prefetcher.END:
+                    return
+
+                yield item
+        finally:
+            # stop reading if the consumer stops iterating
+            self.stopped.set()
+
+    def read(self):
+        """
+        Reads the items of the iterable into the queue. Runs in the background thread
+        """
+        try:
+            iterator = iter(self.iterable)
+            while self.acquire():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self.queue.put((Prefetcher.END, None))
+                    return
+                self.queue.put((item, None))
+        except Exception as error:
+            self.queue.put((None, error))
+
+    def acquire(self):
+        """
+        Waits until a slot is free for the next item
+        :return: False if the consumer stopped iterating before a slot was free
+        """
+        while not self.stopped.is_set():
+            if self.slots.acquire(timeout=0.1):
+                return True
+        return False
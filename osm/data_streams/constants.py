@@ -1,6 +1,7 @@
 summary_level = 'summary'
 processed = "processed"
 filename_col = "filename"
+timepoint = "timepoint"
 
 # evaluation criteria
 accuracy = 'accuracy'
@@ -8,6 +9,7 @@ recall = 'recall'
 precision = 'precision'
 f1 = 'f1'
 log_loss = 'log_loss'
+error = 'error'
 support = 'support'
 
 # time stats
@@ -16,9 +18,39 @@ train_time = 'Train time'
 test_time = 'Test time'
 sample_time = 'Sampling'
 
+# profiled stages
+read_time = 'Read time'
+transform_time = 'Transform time'
+predict_time = 'Predict time'
+evaluation_time = 'Evaluation time'
+measure_time = 'Measure time'
+oracle_time = 'Oracle time'
+forget_time = 'Forget time'
+window_stats_time = 'Window statistics time'
+pipeline_fit_time = 'Pipeline fit time'
+estimator_fit_time = 'Estimator fit time'
+checkpoint_time = 'Checkpoint time'
+
+# memory stats
+memory_stats = 'Memory Statistics'
+memory_rss = 'rss'
+memory_tracemalloc = 'tracemalloc'
+rss = 'RSS'
+peak_rss = 'Peak RSS'
+vocabulary_size = 'Vocabulary size'
+vocabulary_bytes = 'Vocabulary bytes'
+window_memory = 'Window Memory'
+
 # window statistics
 window_stats = 'Window Statistics'
 total = 'total'
+reservoir_fill = 'reservoir fill'
+
+# retraining stats
+retraining_stats = "Retraining Statistics"
+retrained = "retrained"
+drifts = "drifts"
+warning = "warning"
 
 # active learning stats
 active_learner_stats = "Active Learning Statistics"
@@ -26,4 +58,20 @@ queried = "queried"
 answered = "answered"
 cost = "cost"
 
-window_data_filename = "window_data.pkl.gzip"
\ No newline at end of file
+ext_pkl = ".pkl.gzip"
+ext_parquet = ".parquet"
+ext_arrow = ".arrow"
+summary_filename = "summary" + ext_pkl
+window_data_filename = "window_data" + ext_pkl
+models_filename = "models.joblib"
+
+# checkpoints
+checkpoint_dir = "checkpoints"
+profile_dir = "profiles"
+change_add = "add"
+change_drop = "drop"
+change_drop_rows = "drop_rows"
+
+# window storage
+window_index = "window_index"
+reservoir_key = "reservoir_key"
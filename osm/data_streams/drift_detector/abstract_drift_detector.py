@@ -0,0 +1,37 @@
+from abc import abstractmethod
+
+from osm.data_streams.abstract_base_class import AbstractBaseClass
+
+
+class AbstractDriftDetector(AbstractBaseClass):
+
+    def __init__(self) -> None:
+        """
+        Abstract class for the detectors of concept drift over a stream of the errors of the classifier
+        """
+        super().__init__()
+        self.in_warning = False
+
+    def requires_binary_input(self):
+        """
+        Checks if the detector only supports binary errors, i.e. 1 if the instance was misclassified else 0
+        :return: True if only binary errors are supported
+        """
+        return False
+
+    @abstractmethod
+    def add_element(self, value):
+        """
+        Adds the error of an instance to the detector. After a drift the detector starts a new estimate of the error,
+        so that a drift is only signaled once
+        :param value: the error
+        :return: True if a drift is detected
+        """
+        pass
+
+    @abstractmethod
+    def reset(self):
+        """
+        Resets the detector, e.g. after the classifier is retrained
+        """
+        pass
@@ -0,0 +1,85 @@
+from collections import deque
+
+import numpy as np
+
+from osm.data_streams.drift_detector.abstract_drift_detector import AbstractDriftDetector
+
+
+class ADWIN(AbstractDriftDetector):
+
+    def __init__(self, delta=0.002, block_size=32, max_blocks=1024) -> None:
+        """
+        Adaptive Windowing (Bifet and Gavalda, 2007). Keeps a window of the recent errors and signals a drift when the
+        means of an older and a newer part of the window differ by more than the Hoeffding bound, in which case the
+        older part is dropped. The errors are summarized in blocks, so the window is only split at the boundaries of
+        the blocks. Supports real valued errors, e.g. the log loss
+        :param delta: the confidence of the bound
+        :param block_size: the number of errors summarized in a block. The window is checked when a block is full
+        :param max_blocks: the maximum number of blocks in the window
+        """
+        super().__init__()
+
+        if not 0 < delta < 1:
+            raise ValueError("The delta should be a float between (0,1)")
+
+        if block_size is None or block_size <= 0:
+            raise ValueError("The block_size should be a positive integer")
+
+        if max_blocks is None or max_blocks < 2:
+            raise ValueError("The max_blocks should be an integer greater than 1")
+
+        self.delta = delta
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.reset()
+
+    def get_name(self):
+        return "adwin"
+
+    def reset(self):
+        # (count, sum, sum of squares) of the blocks, from the oldest to the newest
+        self.blocks = deque(maxlen=self.max_blocks)
+        self.block = [0, 0.0, 0.0]
+        self.in_warning = False
+
+    def add_element(self, value):
+        self.block[0] += 1
+        self.block[1] += value
+        self.block[2] += value * value
+
+        if self.block[0] < self.block_size:
+            return False
+
+        self.blocks.append(tuple(self.block))
+        self.block = [0, 0.0, 0.0]
+
+        drift = False
+        while self.detect_cut():
+            # drop the oldest block until the window is consistent
+            self.blocks.popleft()
+            drift = True
+        return drift
+
+    def detect_cut(self):
+        """
+        Checks all the splits of the window at the boundaries of the blocks
+        :return: True if the means of the two parts of a split differ significantly
+        """
+        if len(self.blocks) < 2:
+            return False
+
+        blocks = np.array(self.blocks)
+        count, total, squares = blocks[:, 0], blocks[:, 1], blocks[:, 2]
+        n = count.sum()
+        variance = max(squares.sum() / n - (total.sum() / n) ** 2, 0.0)
+        delta = np.log(2 * np.log(n) / self.delta)
+
+        # the older part of every split and the newer part that remains
+        n0 = np.cumsum(count)[:-1]
+        sum0 = np.cumsum(total)[:-1]
+        n1 = n - n0
+        sum1 = total.sum() - sum0
+
+        m = 1 / (1 / n0 + 1 / n1)
+        epsilon = np.sqrt(2 / m * variance * delta) + 2 / (3 * m) * delta
+        return bool(np.any(np.abs(sum0 / n0 - sum1 / n1) > epsilon))
@@ -0,0 +1,60 @@
+import numpy as np
+
+from osm.data_streams.drift_detector.abstract_drift_detector import AbstractDriftDetector
+
+
+class DDM(AbstractDriftDetector):
+
+    def __init__(self, min_num_instances=30, warning_level=2.0, drift_level=3.0) -> None:
+        """
+        Drift Detection Method (Gama et al., 2004). Monitors the error rate p and its standard deviation s and signals
+        a drift when p + s exceeds the minimum of p + s by drift_level standard deviations
+        :param min_num_instances: the number of instances before a drift can be detected
+        :param warning_level: the number of standard deviations for the warning level
+        :param drift_level: the number of standard deviations for the drift level
+        """
+        super().__init__()
+
+        if min_num_instances is None or min_num_instances <= 0:
+            raise ValueError("The min_num_instances should be a positive integer")
+
+        if warning_level <= 0 or drift_level < warning_level:
+            raise ValueError("The drift_level should be greater than or equal to the positive warning_level")
+
+        self.min_num_instances = min_num_instances
+        self.warning_level = warning_level
+        self.drift_level = drift_level
+        self.reset()
+
+    def get_name(self):
+        return "ddm"
+
+    def requires_binary_input(self):
+        return True
+
+    def reset(self):
+        self.n = 0
+        self.p = 1.0
+        self.s = 0.0
+        self.p_min = np.inf
+        self.s_min = np.inf
+        self.in_warning = False
+
+    def add_element(self, value):
+        self.n += 1
+        self.p += (value - self.p) / self.n
+        self.s = np.sqrt(self.p * (1 - self.p) / self.n)
+
+        if self.n < self.min_num_instances:
+            return False
+
+        if self.p + self.s <= self.p_min + self.s_min:
+            self.p_min = self.p
+            self.s_min = self.s
+
+        self.in_warning = self.p + self.s > self.p_min + self.warning_level * self.s_min
+        if self.p + self.s > self.p_min + self.drift_level * self.s_min:
+            # the errors after the drift are monitored from a new minimum
+            self.reset()
+            return True
+        return False
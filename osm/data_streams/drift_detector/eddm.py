@@ -0,0 +1,72 @@
+import numpy as np
+
+from osm.data_streams.drift_detector.abstract_drift_detector import AbstractDriftDetector
+
+
+class EDDM(AbstractDriftDetector):
+
+    def __init__(self, min_num_errors=30, warning_level=0.95, drift_level=0.9) -> None:
+        """
+        Early Drift Detection Method (Baena-Garcia et al., 2006). Monitors the mean m and the standard deviation s of
+        the distance between two errors and signals a drift when (m + 2s) falls below drift_level times its maximum.
+        Detects gradual drifts earlier than DDM
+        :param min_num_errors: the number of errors before a drift can be detected
+        :param warning_level: the ratio to the maximum of m + 2s for the warning level
+        :param drift_level: the ratio to the maximum of m + 2s for the drift level
+        """
+        super().__init__()
+
+        if min_num_errors is None or min_num_errors <= 0:
+            raise ValueError("The min_num_errors should be a positive integer")
+
+        if not 0 < drift_level <= warning_level < 1:
+            raise ValueError("The levels should satisfy 0 < drift_level <= warning_level < 1")
+
+        self.min_num_errors = min_num_errors
+        self.warning_level = warning_level
+        self.drift_level = drift_level
+        self.reset()
+
+    def get_name(self):
+        return "eddm"
+
+    def requires_binary_input(self):
+        return True
+
+    def reset(self):
+        self.n = 0
+        self.num_errors = 0
+        self.last_error = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.max_level = 0.0
+        self.in_warning = False
+
+    def add_element(self, value):
+        self.n += 1
+
+        if value == 0:
+            return False
+
+        # update the mean and the variance of the distance between two errors
+        distance = self.n - self.last_error
+        self.last_error = self.n
+        self.num_errors += 1
+        delta = distance - self.mean
+        self.mean += delta / self.num_errors
+        self.m2 += delta * (distance - self.mean)
+
+        level = self.mean + 2 * np.sqrt(self.m2 / self.num_errors)
+        if level > self.max_level:
+            self.max_level = level
+
+        if self.num_errors < self.min_num_errors:
+            return False
+
+        ratio = level / self.max_level
+        self.in_warning = ratio < self.warning_level
+        if ratio < self.drift_level:
+            # the distances after the drift are monitored from a new maximum
+            self.reset()
+            return True
+        return False
@@ -1,9 +1,9 @@
-import pandas as pd
 import numpy as np
 from datetime import datetime
 from sklearn import metrics
 from sklearn.utils.multiclass import unique_labels
 from osm.data_streams import constants as const
+from osm.data_streams.metrics_recorder import MetricsRecorder
 
 
 class EvaluationCriteria(object):
@@ -36,64 +36,64 @@ class EvaluationCriteria(object):
     def get_accuracy(self, stats, index, y_true, y_pred):
         """
         Calculates the accuracy
-        :param stats: the stats dataframe
-        :param index: row index in the stats dataframe
+        :param stats: MetricsRecorder: the recorder of the stats
+        :param index: the index in the data stream
         :param y_true: the true labels
         :param y_pred: the predicted labels
         """
         if self.accuracy:
-            stats.loc[index, (const.summary_level, const.accuracy)] = metrics.accuracy_score(y_true, y_pred)
+            stats.record(index, (const.summary_level, const.accuracy), metrics.accuracy_score(y_true, y_pred))
 
     def get_precision(self, stats, index, y_true, y_pred, labels=None, average=None):
         """
         Calculates the precision
-        :param stats: the stats dataframe
-        :param index: row index in the stats dataframe
+        :param stats: MetricsRecorder: the recorder of the stats
+        :param index: the index in the data stream
         :param y_true: the true labels
         :param y_pred: the predicted labels
         :param labels: the distinct class names
         :param average
         """
         if self.precision:
-            stats.loc[index, (const.summary_level, const.precision)] = metrics.precision_score(y_true, y_pred,
-                                                                                              labels=labels,
-                                                                                              average=average)
+            stats.record(index, (const.summary_level, const.precision), metrics.precision_score(y_true, y_pred,
+                                                                                                labels=labels,
+                                                                                                average=average))
 
     def get_recall(self, stats, index, y_true, y_pred, labels=None, average=None):
         """
         Calculates the recall
-        :param stats: the stats dataframe
-        :param index: row index in the stats dataframe
+        :param stats: MetricsRecorder: the recorder of the stats
+        :param index: the index in the data stream
         :param y_true: the true labels
         :param y_pred: the predicted labels
         :param labels: the distinct class names
         :param average
         """
         if self.recall:
-            stats.loc[index, (const.summary_level, const.recall)] = metrics.recall_score(y_true, y_pred,
-                                                                                           labels=labels,
-                                                                                           average=average)
+            stats.record(index, (const.summary_level, const.recall), metrics.recall_score(y_true, y_pred,
+                                                                                          labels=labels,
+                                                                                          average=average))
 
     def get_f1(self, stats, index, y_true, y_pred, labels=None, average=None):
         """
         Calculates the f1 score
-        :param stats: the stats dataframe
-        :param index: row index in the stats dataframe
+        :param stats: MetricsRecorder: the recorder of the stats
+        :param index: the index in the data stream
         :param y_true: the true labels
         :param y_pred: the predicted labels
         :param labels: the distinct class names
         :param average
         """
         if self.f1:
-            stats.loc[index, (const.summary_level, const.f1)] = metrics.f1_score(y_true, y_pred,
-                                                                                 labels=labels,
-                                                                                 average=average)
+            stats.record(index, (const.summary_level, const.f1), metrics.f1_score(y_true, y_pred,
+                                                                                  labels=labels,
+                                                                                  average=average))
 
     def get_log_loss(self, stats, index, y_true, y_pred_proba, labels=None):
         """
         Calculates the log loss
-        :param stats: the stats dataframe
-        :param index: row index in the stats dataframe
+        :param stats: MetricsRecorder: the recorder of the stats
+        :param index: the index in the data stream
         :param y_true: the true labels
         :param y_pred_proba: the probabilities of prediction
         :param labels: the distinct class names
@@ -104,27 +104,24 @@ class EvaluationCriteria(object):
             except ValueError:
                 value = np.NaN
 
-            stats.loc[index, (const.summary_level, const.log_loss)] = value
+            stats.record(index, (const.summary_level, const.log_loss), value)
 
-    def get_class_wise_metrics(self, index, y_true, y_pred, labels=None):
+    def get_class_wise_metrics(self, stats, index, y_true, y_pred, labels=None):
         """
         Calculates the precision, recall, f1 score and support of each class
+        :param stats: MetricsRecorder: the recorder of the stats
         :param index: the index in the data stream for which the evaluation is done
         :param y_true: the true classes
         :param y_pred: the predicted labels
         :param labels: the distinct class names
-        :return: the precision, recall, f1 score and support of each class
         """
-        pd_index = pd.MultiIndex.from_product([[const.precision, const.recall, const.f1, const.support], labels])
-        stats = pd.DataFrame(index=pd_index).T.copy()
         if self.individual_metrics:
             p, r, f, s = metrics.precision_recall_fscore_support(y_true, y_pred, labels=labels)
             for label, pr, re, fb, su in zip(labels, p, r, f, s):
-                stats.loc[index, (const.precision, label)] = pr
-                stats.loc[index, (const.recall, label)] = re
-                stats.loc[index, (const.f1, label)] = fb
-                stats.loc[index, (const.support, label)] = su
-        return stats
+                stats.record(index, (const.precision, label), pr)
+                stats.record(index, (const.recall, label), re)
+                stats.record(index, (const.f1, label), fb)
+                stats.record(index, (const.support, label), su)
 
     def get_criteria_names(self, y_predict_proba=None):
         criteria = []
@@ -140,21 +137,20 @@ class EvaluationCriteria(object):
             criteria.append(const.log_loss)
         return criteria
 
-    def evaluate(self, index, y_true, y_predict, y_predict_proba) -> pd.DataFrame:
+    def evaluate(self, index, y_true, y_predict, y_predict_proba, recorder=None) -> MetricsRecorder:
         """
         Calculates the specified metrics
         :param index: the index in the data stream for which the evaluation is done
         :param y_true: The true labels
         :param y_predict: The predicted labels
         :param y_predict_proba: The probabilities of the predictions
-        :return: The evaluation metrics
+        :param recorder: MetricsRecorder: the recorder to which the metrics are written. Default: a new recorder
+        :return: The recorder with the evaluation metrics
         """
         labels = unique_labels(y_true, y_predict)
         average = "weighted"
 
-        pd_index = pd.MultiIndex.from_product(
-            [[const.summary_level], self.get_criteria_names(y_predict_proba=y_predict_proba)])
-        stats = pd.DataFrame(index=pd_index).T.copy()
+        stats = MetricsRecorder(index=[index]) if recorder is None else recorder
 
         self.get_accuracy(stats, index, y_true, y_predict)
         self.get_precision(stats, index, y_true, y_predict, labels, average)
@@ -162,14 +158,12 @@ class EvaluationCriteria(object):
         self.get_f1(stats, index, y_true, y_predict, labels, average)
         self.get_log_loss(stats, index, y_true, y_predict_proba, labels)
 
-        class_wise_metrics = self.get_class_wise_metrics(index, y_true, y_predict, labels)
-        if not class_wise_metrics.empty:
-            stats = stats.join(class_wise_metrics, how="inner")
+        self.get_class_wise_metrics(stats, index, y_true, y_predict, labels)
 
         if self.debug:
             print(str.format("{0}: Index: {1}\tF1: {2}\tLog loss: {3}", str(datetime.now()),
                              index,
-                             stats.loc[index, (const.summary_level, const.f1)],
-                             stats.loc[index, (const.summary_level, const.log_loss)]))
+                             stats.get(index, (const.summary_level, const.f1)),
+                             stats.get(index, (const.summary_level, const.log_loss))))
 
         return stats
@@ -0,0 +1,78 @@
+import numpy as np
+
+
+class InferenceResult(object):
+    """
+    Holds the features, the predictions and the probabilities of prediction of a batch of data, so that the
+    evaluation strategy and the active learner can share them within a timepoint
+    """
+    def __init__(self, features, y_predict, y_predict_proba=None, predicts_argmax=None) -> None:
+        """
+        :param features: the features created by the feature pipeline
+        :param y_predict: the predicted labels
+        :param y_predict_proba: the probabilities of prediction. None if the classifier cannot predict probabilities
+        :param predicts_argmax: True if the classifier predicts the class with the highest probability. None if the
+        classifier cannot predict probabilities
+        """
+        self.features = features
+        self.y_predict = y_predict
+        self.y_predict_proba = y_predict_proba
+        self.predicts_argmax = predicts_argmax
+
+    @classmethod
+    def from_data(cls, classifier, feature_pipeline, data, predicts_argmax=None):
+        """
+        Creates the features and runs the classifier once on the data
+        :param classifier: the fitted classifier
+        :param feature_pipeline: the fitted pipeline
+        :param data: the data
+        :param predicts_argmax: True if the classifier is known to predict the class with the highest probability.
+        Default: None, checked on the data
+        :return: the inference result
+        """
+        # create the features
+        features = feature_pipeline.transform(data)
+
+        return cls.from_features(classifier, features, predicts_argmax)
+
+    @classmethod
+    def from_features(cls, classifier, features, predicts_argmax=None):
+        """
+        Runs the classifier once on the features
+        :param classifier: the fitted classifier
+        :param features: the features created by the fitted pipeline
+        :param predicts_argmax: True if the classifier is known to predict the class with the highest probability.
+        Default: None, checked on the features
+        :return: the inference result
+        """
+        y_predict_proba = None
+        if hasattr(classifier, "predict_proba"):
+            y_predict_proba = classifier.predict_proba(features)
+
+        if y_predict_proba is None:
+            predicts_argmax = None
+
+        if predicts_argmax:
+            # the predicted label is the class with the highest probability,
+            # which avoids a second pass over the features
+            y_predict = cls.get_argmax(classifier, y_predict_proba)
+        else:
+            y_predict = classifier.predict(features)
+
+            # not every classifier predicts the class with the highest probability, e.g. the probabilities of an SVC
+            # are calibrated separately from its predictions
+            if y_predict_proba is not None and predicts_argmax is None:
+                predicts_argmax = np.array_equal(y_predict, cls.get_argmax(classifier, y_predict_proba))
+
+        return cls(features=features, y_predict=y_predict, y_predict_proba=y_predict_proba,
+                   predicts_argmax=predicts_argmax)
+
+    @staticmethod
+    def get_argmax(classifier, y_predict_proba):
+        """
+        Gets the classes with the highest probability of prediction
+        :param classifier: the fitted classifier
+        :param y_predict_proba: the probabilities of prediction
+        :return: the classes
+        """
+        return classifier.classes_[np.argmax(y_predict_proba, axis=1)]
@@ -6,6 +6,7 @@ from sklearn.pipeline import FeatureUnion, Pipeline
 
 from osm.data_streams.abstract_base_class import AbstractBaseClass
 from osm.data_streams.evaluation.evaluation_criteria import EvaluationCriteria
+from osm.data_streams.evaluation.inference_result import InferenceResult
 
 
 class AbstractEvaluationStrategy(AbstractBaseClass):
@@ -27,14 +28,16 @@ class AbstractEvaluationStrategy(AbstractBaseClass):
         self.evaluation_criteria = evaluation_criteria
 
     @abstractmethod
-    def evaluate(self, index, classifier, feature_pipeline, test_data=None):
+    def evaluate(self, index, classifier, feature_pipeline, test_data=None, inference=None, recorder=None):
         """
         Evaluates using the specified strategy for data streams
         :param index: index
         :param classifier: the fitted classifier
         :param feature_pipeline: the fitted pipeline
         :param test_data: the test data
-        :return: the evaluation stats
+        :param inference: InferenceResult: the features and predictions of the test data if already computed
+        :param recorder: MetricsRecorder: the recorder to which the evaluation stats are written
+        :return: the recorder with the evaluation stats
         """
         if not isinstance(classifier, BaseEstimator):
             raise ValueError("The classifier must be an instance of BaseEstimator")
@@ -48,17 +51,12 @@ class AbstractEvaluationStrategy(AbstractBaseClass):
         if test_data is None or test_data.empty:
             raise ValueError("The test_data is not provided")
 
-        # create the test features
-        test_features = feature_pipeline.transform(test_data)
-
-        # get the predictions
-        y_predict = classifier.predict(test_features)
-
-        y_predict_proba = None
-        if hasattr(classifier, "predict_proba"):
-            y_predict_proba = classifier.predict_proba(test_features)
+        if inference is None:
+            # create the test features and get the predictions
+            inference = InferenceResult.from_data(classifier, feature_pipeline, test_data)
 
         return self.evaluation_criteria.evaluate(index=index,
-                                                 y_predict=y_predict,
+                                                 y_predict=inference.y_predict,
                                                  y_true=test_data[self.target_col_name],
-                                                 y_predict_proba=y_predict_proba)
+                                                 y_predict_proba=inference.y_predict_proba,
+                                                 recorder=recorder)
@@ -1,7 +1,7 @@
-import pandas as pd
 from pandas import DataFrame
 
 from osm.data_streams.evaluation.strategy.abstract_evaluation_strategy import AbstractEvaluationStrategy
+from osm.data_streams.metrics_recorder import MetricsRecorder
 
 
 class HoldOut(AbstractEvaluationStrategy):
@@ -21,19 +21,24 @@ class HoldOut(AbstractEvaluationStrategy):
 
         self.test_data = test_data
 
-    def evaluate(self, index, classifier, feature_pipeline, test_data=None) -> pd.DataFrame:
+    def evaluate(self, index, classifier, feature_pipeline, test_data=None, inference=None,
+                 recorder=None) -> MetricsRecorder:
         """
         For hold out method we evaluate using the held out data
         :param index: index
         :param classifier: the fitted classifier
         :param feature_pipeline: the fitted pipeline
         :param test_data: the test data
-        :return: the evaluation stats
+        :param inference: InferenceResult: not used, as the inference of the test data does not apply to the held
+        out data
+        :param recorder: MetricsRecorder: the recorder to which the evaluation stats are written
+        :return: the recorder with the evaluation stats
         """
         return super().evaluate(index=index,
                                 classifier=classifier,
                                 feature_pipeline=feature_pipeline,
-                                test_data=self.test_data) # test data is the held out data
+                                test_data=self.test_data,  # test data is the held out data
+                                recorder=recorder)
 
     def get_name(self):
         return "hold_out_evaluation"
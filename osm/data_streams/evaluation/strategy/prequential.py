@@ -1,25 +1,29 @@
-import pandas as pd
-
 from osm.data_streams.evaluation.strategy.abstract_evaluation_strategy import AbstractEvaluationStrategy
+from osm.data_streams.metrics_recorder import MetricsRecorder
 
 
 class Prequential(AbstractEvaluationStrategy):
     """
     Implements the prequential (interleaved test-then-train method) in data streams
     """
-    def evaluate(self, index, classifier, feature_pipeline, test_data=None) -> pd.DataFrame:
+    def evaluate(self, index, classifier, feature_pipeline, test_data=None, inference=None,
+                 recorder=None) -> MetricsRecorder:
         """
         Evaluates using the specified strategy for data streams
         :param index: index
         :param classifier: the fitted classifier
         :param feature_pipeline: the fitted pipeline
         :param test_data: the test data
-        :return: the evaluation stats
+        :param inference: InferenceResult: the features and predictions of the test data if already computed
+        :param recorder: MetricsRecorder: the recorder to which the evaluation stats are written
+        :return: the recorder with the evaluation stats
         """
         return super().evaluate(index=index,
                                 classifier=classifier,
                                 feature_pipeline=feature_pipeline,
-                                test_data=test_data)
+                                test_data=test_data,
+                                inference=inference,
+                                recorder=recorder)
 
     def get_name(self):
         return "prequential_evaluation"
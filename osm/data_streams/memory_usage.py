@@ -0,0 +1,100 @@
+"""
+Estimates of the memory used by the window data and the fitted feature pipeline, and of the memory of the process
+"""
+import os
+import sys
+
+import numpy as np
+from sklearn.pipeline import FeatureUnion, Pipeline
+
+try:
+    import resource
+except ImportError:
+    # not available on windows
+    resource = None
+
+
+def get_rss():
+    """
+    Gets the current resident set size of the process from /proc/self/statm
+    :return: the resident set size in bytes. None if it cannot be determined on this platform, e.g. without /proc
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def get_peak_rss():
+    """
+    Gets the peak resident set size of the process so far, the high-water mark since the process started
+    :return: the peak resident set size in bytes. None if it cannot be determined on this platform
+    """
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # the peak is reported in bytes on macOS and in kilobytes on linux
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def get_object_size(value):
+    """
+    Gets the size of an object including the keys and values of dicts and the items of lists, e.g. the ngram counts
+    :param value: the object
+    :return: the size in bytes
+    """
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        size += sum(get_object_size(key) + get_object_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(get_object_size(item) for item in value)
+
+    return size
+
+
+def get_column_sizes(data):
+    """
+    Gets the size of every column of the data. Unlike DataFrame.memory_usage the contents of the dicts in object
+    columns are counted
+    :param data: the dataframe
+    :return: dict of column name to size in bytes, including the size of the index under the key "Index"
+    """
+    sizes = {"Index": data.index.memory_usage(deep=True)}
+
+    for column in data.columns:
+        values = data[column].values
+        if values.dtype == np.object_:
+            sizes[column] = values.nbytes + sum(get_object_size(value) for value in values)
+        else:
+            sizes[column] = values.nbytes
+
+    return sizes
+
+
+def get_vocabularies(estimator):
+    """
+    Gets the vocabularies of the fitted steps of a pipeline, e.g. of the DictVectorizer or the CountVectorizer
+    :param estimator: the pipeline, feature union or estimator
+    :return: list of the vocabularies
+    """
+    # the transformers are only imported when the memory is sampled
+    from osm.transformers.FeatureCache import FeatureCache
+
+    if isinstance(estimator, Pipeline):
+        return [vocabulary for name, step in estimator.steps for vocabulary in get_vocabularies(step)]
+
+    if isinstance(estimator, FeatureUnion):
+        return [vocabulary for name, transformer in estimator.transformer_list
+                for vocabulary in get_vocabularies(transformer)]
+
+    if isinstance(estimator, FeatureCache):
+        return get_vocabularies(estimator.transformer)
+
+    vocabulary = getattr(estimator, "vocabulary_", None)
+    return [] if vocabulary is None else [vocabulary]
@@ -0,0 +1,144 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+class MetricsRecorder(object):
+    """
+    Records the metrics of the data stream in preallocated float columns. A value is keyed by the index in the data
+    stream and the path of the metric, e.g. (const.summary_level, const.f1). The metrics are only converted to a
+    dataframe when they are exported. The recorder can be shared by the threads that process the data stream
+    """
+    def __init__(self, index=None, capacity=16) -> None:
+        """
+        :param index: the indices in the data stream for which rows are preallocated
+        :param capacity: the minimum number of preallocated rows. The columns grow as more indices are recorded
+        """
+        index = [] if index is None else list(index)
+
+        self.index = []
+        self.positions = {}
+        self.capacity = max(capacity, len(index), 1)
+        self.columns = OrderedDict()
+        self.lock = threading.RLock()
+
+        for value in index:
+            self.get_position(value)
+
+    def get_position(self, index):
+        """
+        Gets the row of the index in the columns. Adds a row if the index is not recorded yet
+        :param index: the index in the data stream
+        :return: the row of the index
+        """
+        position = self.positions.get(index)
+        if position is None:
+            position = len(self.index)
+            if position >= self.capacity:
+                self.grow(2 * self.capacity)
+            self.positions[index] = position
+            self.index.append(index)
+        return position
+
+    def get_column(self, path):
+        """
+        Gets the column of a metric. Adds the column if the metric is not recorded yet
+        :param path: tuple: the path of the metric
+        :return: the column
+        """
+        column = self.columns.get(path)
+        if column is None:
+            column = np.full(self.capacity, np.nan, dtype=np.float64)
+            self.columns[path] = column
+        return column
+
+    def grow(self, capacity):
+        """
+        Increases the number of preallocated rows
+        :param capacity: the new number of rows
+        """
+        for path, column in self.columns.items():
+            self.columns[path] = np.concatenate([column, np.full(capacity - len(column), np.nan)])
+        self.capacity = capacity
+
+    def record(self, index, path, value):
+        """
+        Records the value of a metric
+        :param index: the index in the data stream
+        :param path: tuple: the path of the metric
+        :param value: the value
+        """
+        with self.lock:
+            position = self.get_position(index)
+            self.get_column(path)[position] = np.nan if value is None else value
+
+    def add(self, index, path, value):
+        """
+        Adds the value to the recorded value of a metric. A metric that is not recorded yet starts at 0
+        :param index: the index in the data stream
+        :param path: tuple: the path of the metric
+        :param value: the value to add
+        """
+        with self.lock:
+            position = self.get_position(index)
+            column = self.get_column(path)
+            column[position] = value if np.isnan(column[position]) else column[position] + value
+
+    def get(self, index, path):
+        """
+        Gets the value of a metric
+        :param index: the index in the data stream
+        :param path: tuple: the path of the metric
+        :return: the value. NaN if it is not recorded
+        """
+        with self.lock:
+            position = self.positions.get(index)
+            column = self.columns.get(path)
+            if position is None or column is None:
+                return np.nan
+            return column[position]
+
+    def to_frame(self, index=None):
+        """
+        Converts the metrics to a dataframe with a row for every index and a multi index column for every path
+        :param index: the indices to convert. Default: all the recorded indices
+        :return: the dataframe
+        """
+        with self.lock:
+            if index is None:
+                index = self.index
+            index = [value for value in index if value in self.positions]
+            positions = [self.positions[value] for value in index]
+
+            if not self.columns:
+                return pd.DataFrame(index=index)
+
+            data = np.column_stack([column[positions] for column in self.columns.values()])
+            columns = pd.MultiIndex.from_tuples(list(self.columns.keys()))
+        return pd.DataFrame(data, index=index, columns=columns)
+
+    def merge(self, frame):
+        """
+        Adds the metrics of the rows of the frame to the frame
+        :param frame: the dataframe indexed by the index in the data stream
+        :return: the dataframe with the metrics
+        """
+        with self.lock:
+            if not self.columns:
+                return frame
+        return frame.combine_first(self.to_frame(index=frame.index.values))
+
+    @classmethod
+    def from_frame(cls, frame):
+        """
+        Creates a recorder from the dataframe returned by to_frame
+        :param frame: the dataframe
+        :return: the recorder
+        """
+        recorder = cls(index=frame.index.values)
+        for path in frame.columns:
+            column = recorder.get_column(path)
+            column[:len(frame)] = frame[path].values.astype(np.float64)
+        return recorder
@@ -0,0 +1,149 @@
+import cProfile
+import os
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+
+import numpy as np
+
+import osm.data_streams.constants as const
+from osm.data_streams.memory_usage import get_rss
+
+
+class Profiler(object):
+    """
+    Times the stages of the processing of a timepoint with a high resolution clock. The time taken by a stage is
+    added to the column (const.time_stats, stage) of the recorder and passed to the registered hooks. Optionally
+    the complete processing of selected timepoints is captured with cProfile and the memory of every stage is sampled
+    """
+    def __init__(self, profile_timepoints=None, directory=None, hooks=None, memory=None) -> None:
+        """
+        :param profile_timepoints: the indices in the data stream that are captured with cProfile. Default: None
+        :param directory: the directory to which the cProfile stats are written as profile_<index>.prof. Default: the
+        profiles directory of the results of the framework
+        :param hooks: list of callables hook(index, stage, elapsed) that are called after every stage
+        :param memory: the memory sampled after every stage and written to the column (const.memory_stats, stage).
+        "rss": the growth of the resident set size of the process during the stage, which is only available with /proc.
+        "tracemalloc": the peak memory allocated by python during the stage, which is slower. Both include the memory
+        of the stages that run concurrently in other threads.
+        Default: None (no memory sampling)
+        """
+        supported_memory = [const.memory_rss, const.memory_tracemalloc]
+        if memory is not None and memory not in supported_memory:
+            raise ValueError("The specified memory sampling is not supported. Supported: " + str(supported_memory))
+
+        if memory == const.memory_tracemalloc and not hasattr(tracemalloc, "reset_peak"):
+            raise ValueError("The memory of the stages can only be traced with tracemalloc from python 3.9")
+
+        if memory == const.memory_rss and get_rss() is None:
+            raise ValueError("The resident set size cannot be sampled on this platform")
+
+        self.profile_timepoints = set() if profile_timepoints is None else set(profile_timepoints)
+        self.directory = directory
+        self.hooks = [] if hooks is None else list(hooks)
+        self.memory = memory
+        self.recorder = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["recorder"]
+        del state["hooks"]
+        state["profile_timepoints"] = sorted(self.profile_timepoints)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.profile_timepoints = set(self.profile_timepoints)
+        self.hooks = []
+        self.recorder = None
+
+    def set_recorder(self, recorder):
+        """
+        Sets the recorder to which the timings are written
+        :param recorder: MetricsRecorder: the recorder. None to only call the hooks
+        """
+        self.recorder = recorder
+
+    def add_hook(self, hook):
+        """
+        Registers a hook that is called after every stage
+        :param hook: callable hook(index, stage, elapsed)
+        """
+        self.hooks.append(hook)
+
+    def record(self, index, stage, elapsed):
+        """
+        Adds the time taken by a stage, so that a stage that runs several times in a timepoint is accumulated
+        :param index: the index in the data stream
+        :param stage: the name of the stage
+        :param elapsed: the time taken in seconds
+        """
+        if self.recorder is not None:
+            self.recorder.add(index, (const.time_stats, stage), elapsed)
+
+        for hook in self.hooks:
+            hook(index, stage, elapsed)
+
+    def record_memory(self, index, stage, memory):
+        """
+        Records the memory of a stage. A stage that runs several times in a timepoint keeps the maximum
+        :param index: the index in the data stream
+        :param stage: the name of the stage
+        :param memory: the memory in bytes
+        """
+        if self.recorder is not None:
+            path = (const.memory_stats, stage)
+            self.recorder.record(index, path, np.fmax(self.recorder.get(index, path), memory))
+
+    def is_tracing_memory(self):
+        """
+        Checks if the memory allocated during the stages is traced with tracemalloc
+        :return: True if tracemalloc is used
+        """
+        return self.memory == const.memory_tracemalloc
+
+    @contextmanager
+    def stage(self, index, stage):
+        """
+        Times the code executed in the context
+        :param index: the index in the data stream
+        :param stage: the name of the stage
+        """
+        if self.is_tracing_memory():
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            # the peak of the stage is measured from the memory allocated at its start
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        elif self.memory == const.memory_rss:
+            start_memory = get_rss()
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(index, stage, perf_counter() - start)
+
+            if self.is_tracing_memory():
+                self.record_memory(index, stage, tracemalloc.get_traced_memory()[1] - start_memory)
+            elif self.memory == const.memory_rss:
+                self.record_memory(index, stage, get_rss() - start_memory)
+
+    @contextmanager
+    def profile(self, index):
+        """
+        Captures the code executed in the context with cProfile if the index is one of the profiled timepoints
+        :param index: the index in the data stream
+        """
+        if index not in self.profile_timepoints:
+            yield
+            return
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            os.makedirs(self.directory, exist_ok=True)
+            profile.dump_stats(os.path.join(self.directory, str.format("profile_{0}.prof", index)))
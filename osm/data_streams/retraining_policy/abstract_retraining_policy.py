@@ -0,0 +1,43 @@
+from abc import abstractmethod
+
+from osm.data_streams.abstract_base_class import AbstractBaseClass
+from osm.data_streams.metrics_recorder import MetricsRecorder
+
+
+class AbstractRetrainingPolicy(AbstractBaseClass):
+
+    def __init__(self) -> None:
+        """
+        Abstract class for the policies that decide when the feature pipeline and the base estimator are refitted on
+        the whole window
+        """
+        super().__init__()
+
+    def update(self, index, y_true, inference, classes):
+        """
+        Updates the policy with the predictions on the test data of a timepoint
+        :param index: the index in the data stream
+        :param y_true: the true labels
+        :param inference: InferenceResult: the predictions on the test data
+        :param classes: the classes of the columns of the probabilities of prediction
+        """
+        pass
+
+    @abstractmethod
+    def is_retraining_required(self, index, last_retraining_index):
+        """
+        Checks if the models need to be refitted after the timepoint
+        :param index: the index in the data stream
+        :param last_retraining_index: the index at which the models were last refitted
+        :return: True if the models need to be refitted
+        """
+        pass
+
+    def get_stats(self, index, recorder=None):
+        """
+        Gets the statistics of the policy
+        :param index: the index in the data stream
+        :param recorder: MetricsRecorder: the recorder to which the stats are written. Default: a new recorder
+        :return: the recorder with the statistics
+        """
+        return MetricsRecorder(index=[index]) if recorder is None else recorder
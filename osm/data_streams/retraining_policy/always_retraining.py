@@ -0,0 +1,16 @@
+from osm.data_streams.retraining_policy.abstract_retraining_policy import AbstractRetrainingPolicy
+
+
+class AlwaysRetraining(AbstractRetrainingPolicy):
+
+    def __init__(self) -> None:
+        """
+        Refits the models after every timepoint
+        """
+        super().__init__()
+
+    def get_name(self):
+        return "always"
+
+    def is_retraining_required(self, index, last_retraining_index):
+        return True
@@ -0,0 +1,91 @@
+import numpy as np
+
+import osm.data_streams.constants as const
+from osm.data_streams.drift_detector.abstract_drift_detector import AbstractDriftDetector
+from osm.data_streams.metrics_recorder import MetricsRecorder
+from osm.data_streams.retraining_policy.abstract_retraining_policy import AbstractRetrainingPolicy
+
+
+class DriftRetraining(AbstractRetrainingPolicy):
+
+    def __init__(self, detector, error=const.error, max_interval=None) -> None:
+        """
+        Refits the models only if the drift detector signals a drift in the prequential errors of the test data
+        :param detector: AbstractDriftDetector: the drift detector
+        :param error: the error of an instance that is monitored. "error": 1 if the instance is misclassified else 0.
+        "log_loss": the negative log of the predicted probability of the true class
+        :param max_interval: the number of timepoints after which the models are refitted even if no drift is
+        detected. Default: None (only refit on drift)
+        """
+        super().__init__()
+
+        if not isinstance(detector, AbstractDriftDetector):
+            raise ValueError("The detector must be an instance of AbstractDriftDetector")
+
+        supported_errors = [const.error, const.log_loss]
+        if error not in supported_errors:
+            raise ValueError("The specified error is not supported. Supported: " + str(supported_errors))
+
+        if error != const.error and detector.requires_binary_input():
+            raise ValueError(str.format("The detector {0} only supports the error", detector.get_name()))
+
+        if max_interval is not None and max_interval <= 0:
+            raise ValueError("The max_interval should be a positive integer")
+
+        self.detector = detector
+        self.error = error
+        self.max_interval = max_interval
+        self.drift_detected = False
+        self.drifts = {}
+
+    def get_name(self):
+        return "drift"
+
+    def get_errors(self, y_true, inference, classes):
+        """
+        Calculates the error of every instance
+        :param y_true: the true labels
+        :param inference: InferenceResult: the predictions on the test data
+        :param classes: the classes of the columns of the probabilities of prediction
+        :return: the errors
+        """
+        y_true = np.asarray(y_true)
+
+        if self.error == const.error:
+            return (y_true != np.asarray(inference.y_predict)).astype(np.float64)
+
+        if inference.y_predict_proba is None:
+            raise ValueError("The log loss requires the probabilities of prediction")
+
+        # the probability of the true class, which is 0 if the class is unknown to the classifier
+        columns = {clazz: column for column, clazz in enumerate(classes)}
+        proba = np.array([inference.y_predict_proba[row, columns[label]] if label in columns else 0.0
+                          for row, label in enumerate(y_true)])
+        return -np.log(np.clip(proba, 1e-15, 1.0))
+
+    def update(self, index, y_true, inference, classes):
+        # the detector starts a new estimate after every drift, so every drift event is counted once
+        drifts = 0
+        for error in self.get_errors(y_true, inference, classes):
+            if self.detector.add_element(error):
+                drifts += 1
+
+        self.drifts[index] = drifts
+        self.drift_detected = self.drift_detected or drifts > 0
+
+    def is_retraining_required(self, index, last_retraining_index):
+        interval_exceeded = self.max_interval is not None and (last_retraining_index is None or
+                                                               index - last_retraining_index >= self.max_interval)
+        if not self.drift_detected and not interval_exceeded:
+            return False
+
+        # the retrained models start with a new estimate of the error
+        self.detector.reset()
+        self.drift_detected = False
+        return True
+
+    def get_stats(self, index, recorder=None):
+        stats = MetricsRecorder(index=[index]) if recorder is None else recorder
+        stats.record(index, (const.retraining_stats, const.drifts), self.drifts.pop(index, 0))
+        stats.record(index, (const.retraining_stats, const.warning), int(self.detector.in_warning))
+        return stats
@@ -0,0 +1,22 @@
+from osm.data_streams.retraining_policy.abstract_retraining_policy import AbstractRetrainingPolicy
+
+
+class IntervalRetraining(AbstractRetrainingPolicy):
+
+    def __init__(self, interval) -> None:
+        """
+        Refits the models every k timepoints
+        :param interval: the number of timepoints after which the models are refitted
+        """
+        super().__init__()
+
+        if interval is None or interval <= 0:
+            raise ValueError("The interval should be a positive integer")
+
+        self.interval = interval
+
+    def get_name(self):
+        return "interval"
+
+    def is_retraining_required(self, index, last_retraining_index):
+        return last_retraining_index is None or index - last_retraining_index >= self.interval
@@ -0,0 +1,60 @@
+import os
+from abc import abstractmethod
+
+import osm.data_streams.constants as const
+from osm.data_streams.abstract_base_class import AbstractBaseClass
+
+
+class AbstractStreamSource(AbstractBaseClass):
+
+    def __init__(self, directory) -> None:
+        """
+        Abstract class for the sources of the data in a data stream
+        :param directory: the directory in which the results of the data stream are stored
+        """
+        super().__init__()
+        if directory is None:
+            raise ValueError("Please specify the directory of the results")
+
+        if not os.path.isdir(directory):
+            raise ValueError("The directory does not exist")
+
+        self.directory = directory
+
+    def get_directory(self):
+        """
+        Gets the directory in which the results of the data stream are stored
+        :return: the directory
+        """
+        return self.directory
+
+    def get_summary_filename(self):
+        """
+        Gets the file name of the summary in the results
+        :return: the file name of the summary
+        """
+        return const.summary_filename
+
+    @abstractmethod
+    def get_summary(self):
+        """
+        Gets the summary of the data stream
+        :return: pandas dataframe indexed by the timepoints of the data stream in the order in which they are processed
+        """
+        pass
+
+    @abstractmethod
+    def read(self, timepoint):
+        """
+        Reads the data of a timepoint
+        :param timepoint: the timepoint in the index of the summary
+        :return: pandas dataframe: the data of the timepoint
+        """
+        pass
+
+    def skip(self, timepoints):
+        """
+        Tells the source that the timepoints are not read, e.g. the processed timepoints when the data stream is resumed
+        :param timepoints: the timepoints that are skipped
+        """
+        pass
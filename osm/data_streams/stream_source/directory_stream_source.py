@@ -0,0 +1,39 @@
+import os
+
+import pandas as pd
+
+import osm.data_streams.constants as const
+from osm.data_streams.stream_source.abstract_stream_source import AbstractStreamSource
+from osm.data_streams.stream_source.file_format import read_file
+
+
+class DirectoryStreamSource(AbstractStreamSource):
+
+    def __init__(self, directory, extension=const.ext_parquet, columns=None) -> None:
+        """
+        Reads the data stream from a directory of columnar files. Each file contains the data of a timepoint. The
+        timepoint is the file name without the extension and the files are processed in the order of their names
+        :param directory: the directory of the files. The results of the data stream are stored in this directory
+        :param extension: the extension of the files (.parquet, .arrow)
+        :param columns: the columns of the data that are read from the disk. Default: all the columns
+        """
+        super().__init__(directory)
+        self.extension = extension
+        self.columns = columns
+
+    def get_name(self):
+        return "directory_stream_source"
+
+    def get_summary(self):
+        filenames = sorted(filename for filename in os.listdir(self.directory)
+                           if filename.endswith(self.extension)
+                           and os.path.isfile(os.path.join(self.directory, filename)))
+
+        if not filenames:
+            raise ValueError("The directory does not contain any file with the extension " + self.extension)
+
+        timepoints = [filename[:-len(self.extension)] for filename in filenames]
+        return pd.DataFrame({const.filename_col: filenames}, index=pd.Index(timepoints, name=const.timepoint))
+
+    def read(self, timepoint):
+        return read_file(os.path.join(self.directory, timepoint + self.extension), columns=self.columns)
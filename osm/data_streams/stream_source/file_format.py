@@ -0,0 +1,149 @@
+"""
+Reading and writing of the files that contain the data of a timepoint. Besides the gzip pickles of the dataframes,
+the data can be stored in the columnar Arrow IPC (Feather) or Parquet formats, which can be memory-mapped and read with
+column projection
+"""
+import collections.abc
+import json
+
+import numpy as np
+import pandas as pd
+
+import osm.data_streams.constants as const
+
+# schema metadata of the columnar files
+METADATA_INDEX = b"osm_index"
+METADATA_MAP_COLUMNS = b"osm_map_columns"
+
+
+def read_file(path, columns=None):
+    """
+    Reads the data of a timepoint. The format is determined by the extension of the file
+    :param path: the path of the file
+    :param columns: the columns to read. Default: all the columns
+    :return: the data
+    """
+    if path.endswith(const.ext_arrow) or path.endswith(const.ext_parquet):
+        return read_columnar(path, columns=columns)
+
+    data = pd.read_pickle(path)
+    if columns is not None:
+        data = data.loc[:, columns]
+    return data
+
+
+def write_columnar(data, path, compression="uncompressed"):
+    """
+    Writes the data of a timepoint to a columnar file. The index is stored as columns and the columns that contain
+    dicts, e.g. the ngrams, are stored as maps, so that the keys and the values of the dicts keep their types
+    :param data: the data
+    :param path: the path of the file. Files ending with .parquet are written in the Parquet format, otherwise in the
+    Arrow IPC (Feather) format
+    :param compression: the compression of the Arrow IPC file. Only uncompressed files can be memory-mapped without
+    copying
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    index_names = [name if name is not None else str.format("level_{0}", level)
+                   for level, name in enumerate(data.index.names)]
+    data = data.copy()
+    data.index.names = index_names
+    data = data.reset_index(drop=False)
+
+    arrays = []
+    map_columns = []
+    for column in data.columns:
+        values = [unwrap(value) for value in data[column].values]
+        if values and any(isinstance(value, collections.abc.Mapping) for value in values):
+            map_columns.append(column)
+            arrays.append(to_map_array(values))
+        else:
+            arrays.append(pa.Array.from_pandas(data[column]))
+
+    table = pa.Table.from_arrays(arrays, names=[str(column) for column in data.columns])
+    table = table.replace_schema_metadata({
+        METADATA_INDEX: json.dumps(index_names),
+        METADATA_MAP_COLUMNS: json.dumps(map_columns)
+    })
+
+    if path.endswith(const.ext_parquet):
+        pq.write_table(table, path)
+    else:
+        feather.write_feather(table, path, compression=compression)
+
+
+def read_columnar(path, columns=None):
+    """
+    Reads the data of a timepoint from a memory-mapped columnar file
+    :param path: the path of the file
+    :param columns: the columns to read. The index is always read. Default: all the columns
+    :return: the data
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if path.endswith(const.ext_parquet):
+        schema = pq.read_schema(path, memory_map=True)
+    else:
+        with pa.memory_map(path) as source:
+            schema = pa.ipc.open_file(source).schema
+
+    metadata = schema.metadata or {}
+    index_names = json.loads(metadata.get(METADATA_INDEX, b"[]"))
+    map_columns = json.loads(metadata.get(METADATA_MAP_COLUMNS, b"[]"))
+
+    if columns is not None:
+        columns = index_names + [column for column in columns if column not in index_names]
+
+    if path.endswith(const.ext_parquet):
+        table = pq.read_table(path, columns=columns, memory_map=True)
+    else:
+        table = feather.read_table(path, columns=columns, memory_map=True)
+
+    data = table.to_pandas()
+
+    # convert the maps back to dicts
+    for column in map_columns:
+        if column in data.columns:
+            data[column] = [None if value is None else dict(value) for value in data[column].values]
+
+    if index_names:
+        data.set_index(index_names, inplace=True)
+
+    return data
+
+
+def to_map_array(values):
+    """
+    Converts the dicts to an Arrow map array whose key and item types are inferred from the keys and the values of
+    the dicts, e.g. strings and integers for the ngram counts
+    :param values: the dicts. None for the missing values
+    :return: the map array
+    """
+    import pyarrow as pa
+
+    entries = [None if value is None else list(value.items()) for value in values]
+    key_type = pa.array([key for entry in entries if entry is not None for key, item in entry]).type
+    item_type = pa.array([item for entry in entries if entry is not None for key, item in entry]).type
+
+    # the dicts are empty, so any type holds them
+    if pa.types.is_null(key_type):
+        key_type = pa.string()
+    if pa.types.is_null(item_type):
+        item_type = pa.float64()
+
+    return pa.array(entries, type=pa.map_(key_type, item_type))
+
+
+def unwrap(value):
+    """
+    Unwraps the values that are stored as 0-dimensional numpy arrays, e.g. the ngrams
+    :param value: the value
+    :return: the unwrapped value
+    """
+    if isinstance(value, np.ndarray) and value.ndim == 0:
+        return value.item()
+    return value
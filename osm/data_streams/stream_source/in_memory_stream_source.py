@@ -0,0 +1,83 @@
+import collections.abc
+import threading
+
+import pandas as pd
+
+from osm.data_streams.stream_source.abstract_stream_source import AbstractStreamSource
+
+
+class InMemoryStreamSource(AbstractStreamSource):
+
+    def __init__(self, data, directory, timepoints=None) -> None:
+        """
+        Reads the data stream from memory, e.g. directly from the output of the preprocessing
+        :param data: dict of timepoint -> dataframe or an iterable of (timepoint, dataframe) in the order of the data
+        stream. If data is an iterator or a generator it is consumed lazily and the timepoints must be specified
+        :param directory: the directory in which the results of the data stream are stored
+        :param timepoints: the timepoints of the data stream. Required if data is an iterator or a generator
+        """
+        super().__init__(directory)
+
+        if data is None:
+            raise ValueError("Please pass the data")
+
+        if isinstance(data, collections.abc.Mapping):
+            data = list(data.items())
+
+        if isinstance(data, collections.abc.Iterator):
+            if timepoints is None:
+                raise ValueError("The timepoints should be specified if the data is an iterator")
+            self.iterator = data
+            self.data = {}
+        else:
+            data = list(data)
+            if timepoints is None:
+                timepoints = [timepoint for timepoint, _ in data]
+            self.iterator = None
+            self.data = dict(data)
+
+        self.timepoints = list(timepoints)
+        self.skipped = set()
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["data"]
+        del state["iterator"]
+        del state["skipped"]
+        del state["lock"]
+        return state
+
+    def get_name(self):
+        return "in_memory_stream_source"
+
+    def get_summary(self):
+        return pd.DataFrame(index=pd.Index(self.timepoints))
+
+    def skip(self, timepoints):
+        with self.lock:
+            for timepoint in timepoints:
+                if timepoint in self.data:
+                    del self.data[timepoint]
+                elif self.iterator is not None:
+                    # the data of the timepoint is dropped when the iterator reaches it
+                    self.skipped.add(timepoint)
+
+    def read(self, timepoint):
+        with self.lock:
+            if self.iterator is None:
+                return self.data[timepoint]
+
+            # consume the iterator until the timepoint is found. The data of the other timepoints is kept until read,
+            # unless they are skipped
+            while timepoint not in self.data:
+                try:
+                    next_timepoint, data = next(self.iterator)
+                except StopIteration:
+                    raise ValueError("The data of the timepoint is not available: " + str(timepoint))
+                if next_timepoint in self.skipped:
+                    self.skipped.discard(next_timepoint)
+                else:
+                    self.data[next_timepoint] = data
+
+            return self.data.pop(timepoint)
@@ -0,0 +1,70 @@
+import os
+import pathlib
+
+import pandas as pd
+
+import osm.data_streams.constants as const
+from osm.data_streams.stream_source.abstract_stream_source import AbstractStreamSource
+from osm.data_streams.stream_source.file_format import read_file
+
+
+class SummaryFileStreamSource(AbstractStreamSource):
+
+    def __init__(self, summary_file, columns=None) -> None:
+        """
+        Reads the data stream from a summary file
+        :param summary_file: A pandas dataframe containing a column filename. Each file name is the relative path
+        of the file from the directory of the summary_file. Each file contains data that needs to be processed. The
+        index of the filename gives the order in which the files need to be processed in the data stream. The files
+        can be gzip pickles (*.pkl.gzip) or columnar files (*.arrow, *.parquet)
+        :param columns: the columns of the data that are read. Columnar files only read these columns from the disk.
+        Default: all the columns
+        """
+        if summary_file is None:
+            raise ValueError("Please pass the summary file")
+
+        if not os.path.isfile(summary_file):
+            raise ValueError("The summary file does not exist")
+
+        if not "".join(pathlib.Path(summary_file).suffixes) == const.ext_pkl:
+            raise ValueError("The summary file should have a valid extension (*.pkl.gzip)")
+
+        super().__init__(os.path.dirname(summary_file) or os.curdir)
+        self.summary_file = summary_file
+        self.columns = columns
+        self.summary = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["summary"]
+        return state
+
+    def get_name(self):
+        return "summary_file_stream_source"
+
+    def get_summary_filename(self):
+        return os.path.basename(self.summary_file)
+
+    def get_summary(self):
+        return self.load_summary().copy()
+
+    def load_summary(self):
+        """
+        Reads the summary file once and validates it
+        :return: the summary
+        """
+        if self.summary is None:
+            summary = pd.read_pickle(self.summary_file)
+
+            if not isinstance(summary, pd.DataFrame):
+                raise ValueError("The summary file specified is not a dataframe")
+
+            if const.filename_col not in summary.columns.values:
+                raise ValueError("The summary file does not contain a column 'filename'")
+
+            self.summary = summary
+        return self.summary
+
+    def read(self, timepoint):
+        filename = self.load_summary().loc[timepoint, const.filename_col]
+        return read_file(os.path.join(self.directory, filename), columns=self.columns)
@@ -0,0 +1,197 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+import osm.data_streams.constants as const
+from osm.data_streams.stream_source.abstract_stream_source import AbstractStreamSource
+
+
+class SyntheticStreamSource(AbstractStreamSource):
+
+    def __init__(self,
+                 directory,
+                 n_timepoints=52,
+                 reviews_per_timepoint=1000,
+                 vocabulary_size=10000,
+                 words_per_review=50,
+                 zipf_exponent=1.1,
+                 class_words=0.3,
+                 class_proportions=(0.2, 0.1, 0.7),
+                 drift_timepoints=None,
+                 drift_magnitude=0.5,
+                 bigrams=True,
+                 text=False,
+                 start="2005-01-02",
+                 freq="W",
+                 target_col_name="stars",
+                 random_state=0) -> None:
+        """
+        Generates a data stream of reviews shaped like the preprocessed files, e.g. to benchmark the framework without
+        the datasets. Every timepoint is indexed by (date, review_id) and contains the columns business_id, the target
+        and ngrams, a dict of the counts of the terms of the review. The words are drawn from a Zipfian distribution
+        over the vocabulary, and a share of the words from a class specific ranking of the vocabulary. A concept drift
+        reassigns the ranks of a share of the words of every class. The data of a timepoint is generated from its own
+        seed, so it is the same every time it is read
+        :param directory: the directory in which the results of the data stream are stored
+        :param n_timepoints: the number of timepoints
+        :param reviews_per_timepoint: the number of reviews in a timepoint
+        :param vocabulary_size: the number of distinct words
+        :param words_per_review: the average number of words in a review
+        :param zipf_exponent: the exponent of the Zipfian distribution of the words
+        :param class_words: the share of the words that are drawn from the ranking of the class of the review
+        :param class_proportions: the proportions of the classes negative, neutral and positive
+        :param drift_timepoints: the indices of the timepoints at which the concept drifts. Default: None (no drift)
+        :param drift_magnitude: the share of the words of every class that are reassigned at a drift
+        :param bigrams: If True the bigrams of consecutive words are added to the ngrams
+        :param text: If True the words are also joined to a text column, e.g. for the preprocessing transformers
+        :param start: the date of the first timepoint
+        :param freq: the frequency of the timepoints as a pandas offset alias. Default: weekly
+        :param target_col_name: the name of the target column
+        :param random_state: int: the seed of the generator
+        """
+        super().__init__(directory)
+
+        if n_timepoints is None or n_timepoints <= 0:
+            raise ValueError("The n_timepoints should be a positive integer")
+
+        if reviews_per_timepoint is None or reviews_per_timepoint <= 0:
+            raise ValueError("The reviews_per_timepoint should be a positive integer")
+
+        if vocabulary_size is None or vocabulary_size <= 0:
+            raise ValueError("The vocabulary_size should be a positive integer")
+
+        if words_per_review is None or words_per_review <= 0:
+            raise ValueError("The words_per_review should be a positive integer")
+
+        if zipf_exponent <= 0:
+            raise ValueError("The zipf_exponent should be positive")
+
+        if class_words < 0 or class_words > 1:
+            raise ValueError("The class_words should be a float between [0,1]")
+
+        if len(class_proportions) != len(self.get_classes()) or not np.isclose(np.sum(class_proportions), 1):
+            raise ValueError("The class_proportions should contain a proportion for every class that sum to 1")
+
+        if drift_magnitude < 0 or drift_magnitude > 1:
+            raise ValueError("The drift_magnitude should be a float between [0,1]")
+
+        self.n_timepoints = n_timepoints
+        self.reviews_per_timepoint = reviews_per_timepoint
+        self.vocabulary_size = vocabulary_size
+        self.words_per_review = words_per_review
+        self.zipf_exponent = zipf_exponent
+        self.class_words = class_words
+        self.class_proportions = list(class_proportions)
+        self.drift_timepoints = [] if drift_timepoints is None else sorted(drift_timepoints)
+        self.drift_magnitude = drift_magnitude
+        self.bigrams = bigrams
+        self.text = text
+        self.start = start
+        self.freq = freq
+        self.target_col_name = target_col_name
+        self.random_state = random_state
+
+        self.timepoints = pd.date_range(start=start, periods=n_timepoints, freq=freq, name=const.timepoint)
+        self.positions = {timepoint: position for position, timepoint in enumerate(self.timepoints)}
+
+        # the cumulative zipfian distribution over the ranks of the words
+        probabilities = 1 / np.arange(1, vocabulary_size + 1) ** zipf_exponent
+        self.cumulative = np.cumsum(probabilities / probabilities.sum())
+        self.vocabulary = np.array([str.format("w{0}", word) for word in range(vocabulary_size)], dtype=object)
+
+        self.rankings = self.create_rankings()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state["timepoints"]
+        del state["positions"]
+        del state["cumulative"]
+        del state["vocabulary"]
+        del state["rankings"]
+        return state
+
+    def get_name(self):
+        return "synthetic_stream_source"
+
+    @staticmethod
+    def get_classes():
+        """
+        Gets the classes of the target
+        :return: the classes
+        """
+        return ["negative", "neutral", "positive"]
+
+    def create_rankings(self):
+        """
+        Creates the ranking of the vocabulary of every class for every concept of the data stream
+        :return: list of the rankings of the classes for every concept
+        """
+        random = np.random.RandomState(self.random_state)
+        rankings = [[random.permutation(self.vocabulary_size) for _ in self.get_classes()]]
+
+        for _ in self.drift_timepoints:
+            concept = []
+            for ranking in rankings[-1]:
+                # reassign the ranks of a share of the words
+                ranking = ranking.copy()
+                words = random.choice(self.vocabulary_size, int(self.drift_magnitude * self.vocabulary_size),
+                                      replace=False)
+                ranking[words] = ranking[random.permutation(words)]
+                concept.append(ranking)
+            rankings.append(concept)
+
+        return rankings
+
+    def get_summary(self):
+        return pd.DataFrame(index=self.timepoints)
+
+    def read(self, timepoint):
+        timepoint = pd.Timestamp(timepoint)
+        position = self.positions[timepoint]
+        random = np.random.RandomState([self.random_state, position])
+        rankings = self.rankings[np.searchsorted(self.drift_timepoints, position, side="right")]
+        classes = self.get_classes()
+        n = self.reviews_per_timepoint
+
+        labels = random.choice(len(classes), size=n, p=self.class_proportions)
+        lengths = 1 + random.poisson(self.words_per_review - 1, size=n)
+
+        # draw the ranks of all the words at once and map the class specific ones to the ranking of the class
+        ranks = np.minimum(np.searchsorted(self.cumulative, random.rand(lengths.sum())), self.vocabulary_size - 1)
+        words = ranks.copy()
+        word_labels = np.repeat(labels, lengths)
+        is_class_word = random.rand(len(ranks)) < self.class_words
+        for label, ranking in enumerate(rankings):
+            selected = is_class_word & (word_labels == label)
+            words[selected] = ranking[ranks[selected]]
+
+        reviews = np.split(self.vocabulary[words], np.cumsum(lengths)[:-1])
+
+        # the reviews are spread over the period of the timepoint
+        period = (timepoint + to_offset(self.freq)) - timepoint
+        offsets = pd.to_timedelta(random.randint(0, int(period.total_seconds()), size=n), unit="s")
+        data = {
+            "business_id": [str.format("b{0}", business) for business in random.randint(0, 100, size=n)],
+            self.target_col_name: [classes[label] for label in labels],
+            "ngrams": [self.get_ngrams(review) for review in reviews]
+        }
+        if self.text:
+            data["text"] = [" ".join(review) for review in reviews]
+
+        index = pd.MultiIndex.from_arrays([timepoint + offsets,
+                                           [str.format("r{0:05d}{1:07d}", position, i) for i in range(n)]],
+                                          names=["date", "review_id"])
+        return pd.DataFrame(data, index=index).sort_index()
+
+    def get_ngrams(self, words):
+        """
+        Counts the terms of a review
+        :param words: the words of the review
+        :return: dict of the term and its count
+        """
+        ngrams = Counter(words)
+        if self.bigrams:
+            ngrams.update(" ".join(bigram) for bigram in zip(words[:-1], words[1:]))
+        return dict(ngrams)
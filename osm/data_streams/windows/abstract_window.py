@@ -1,34 +1,118 @@
-import pandas as pd
 import numpy as np
 from abc import ABC, abstractmethod
+from collections import Counter
 
 from osm.data_streams.abstract_base_class import AbstractBaseClass
 import osm.data_streams.constants as const
+from osm.data_streams.metrics_recorder import MetricsRecorder
+from osm.data_streams.profiler import Profiler
+from osm.data_streams.windows.storage.abstract_window_storage import AbstractWindowStorage
+from osm.data_streams.windows.storage.dataframe_storage import DataFrameStorage
 
 
 class AbstractWindow(AbstractBaseClass):
-    def __init__(self, window_size, index=0, apply_windowing=True) -> None:
+    def __init__(self, window_size, index=0, apply_windowing=True, storage=None) -> None:
         """
 
         :param window_size: int: The window size
         :param index: int: The start index to use. As data is added to the window, the index is incremented
         :param apply_windowing: bool: If false does not apply any windowing
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
         """
         super().__init__()
 
         if apply_windowing and (window_size is None or window_size == 0):
             raise ValueError("Please specify the window size")
+
+        if storage is not None and not isinstance(storage, AbstractWindowStorage):
+            raise ValueError("The storage must be an instance of AbstractWindowStorage")
+
         self.window_size = window_size
-        self.window_data = None
+        self.storage = DataFrameStorage() if storage is None else storage
+        self.initialized = False
         self.index = index
         self.apply_windowing = apply_windowing
 
+        # changes made to the window data since the last checkpoint
+        self.changes = []
+
+        # times the forgetting of data from the window
+        self.profiler = Profiler()
+
+        # the number of instances of every class per index and in total, counted when the data is added or dropped
+        self.target_col_name = None
+        self.class_counts = {}
+        self.total_counts = Counter()
+
     def __getstate__(self):
         state = super().__getstate__()
-        del state['window_data']
+        del state['initialized']
         del state['index']
+        del state['changes']
+        del state['profiler']
+        del state['class_counts']
+        del state['total_counts']
         return state
 
+    def set_profiler(self, profiler):
+        """
+        Sets the profiler with which the forgetting of data is timed
+        :param profiler: Profiler: the profiler
+        """
+        self.profiler = profiler
+
+    def set_target_col_name(self, target_col_name):
+        """
+        Sets the target column whose classes are counted as the data is added to and dropped from the window
+        :param target_col_name: the name of the target column
+        """
+        self.target_col_name = target_col_name
+        self.count_classes()
+
+    def count_classes(self):
+        """
+        Counts the classes of the data in the window from scratch, e.g. after the window is restored
+        """
+        self.class_counts = {}
+        self.total_counts = Counter()
+
+        if self.target_col_name is None or not self.initialized:
+            return
+
+        data = self.storage.get_data()
+        if data.empty:
+            return
+
+        for index, rows in data.groupby(level=0, sort=False):
+            self.add_class_counts(index, rows)
+
+    def add_class_counts(self, index, X):
+        """
+        Adds the classes of the data to the counts
+        :param index: the index of the data in the window
+        :param X: the data
+        """
+        counts = Counter(X[self.target_col_name].value_counts().to_dict())
+        self.class_counts.setdefault(index, Counter()).update(counts)
+        self.total_counts.update(counts)
+
+    def get_class_counts(self, index=None):
+        """
+        Gets the number of instances of every class in the window. Only available if the target column is set
+        :param index: {int, range, list}: the index of the data. Default: all the data in the window
+        :return: Counter of the class and the number of instances
+        """
+        if self.target_col_name is None:
+            raise ValueError("The classes are only counted if the target column is set")
+
+        if index is None:
+            return +self.total_counts
+
+        counts = Counter()
+        for data_index in self.storage.to_list(index):
+            counts.update(self.class_counts.get(data_index, {}))
+        return +counts
+
     def get_window_size(self):
         """
         Gets the configured window size
@@ -39,24 +123,61 @@ class AbstractWindow(AbstractBaseClass):
     def get_window_data(self, index=None):
         """
         Returns the window data for the specified index
-        :param index: {int, range}
-        :return: the window data for the specified index
+        :param index: {int, range, list}
+        :return: the window data for the specified index, with the index of the window as the first index level
         """
-        if self.window_data is None:
+        if not self.initialized:
             raise ValueError("The window is not initialized")
-        if index is None:
-            index = self.window_data.index.values
-        elif isinstance(index, range):
-            index = list(index)
-        return self.window_data.loc[index, :]
+        return self.storage.get_data(index)
+
+    def get_window_features(self, index=None):
+        """
+        Returns the features of the window data on which the feature pipeline is fitted
+        :param index: {int, range, list}
+        :return: the features in the order of the rows of get_window_data. The window data itself unless the storage
+        vectorizes the data
+        """
+        if not self.initialized:
+            raise ValueError("The window is not initialized")
+        return self.storage.get_features(index)
+
+    def transform(self, X):
+        """
+        Transforms data that is not in the window, e.g. the test data, into the features of get_window_features
+        :param X: the data
+        :return: the features
+        """
+        return self.storage.transform(X)
+
+    def get_vectorizer(self):
+        """
+        :return: the vectorizer of the storage. None if the storage does not vectorize the data
+        """
+        return self.storage.get_vectorizer()
+
+    def get_sample_weights(self, X):
+        """
+        Gets the weights of the instances with which the base estimator is fitted
+        :param X: the window data or the data that was added to the window
+        :return: array of the weights. None if the window does not weight the instances
+        """
+        return None
+
+    def get_indices(self):
+        """
+        Returns the indices of the data in the window
+        :return: sorted list of the indices
+        """
+        return self.storage.get_indices()
 
     def get_first_index(self):
         """
         Returns the first index of the window
         :return: the first index of the window
         """
-        if self.window_data is not None and not self.window_data.empty:
-            return self.window_data.index.levels[0][0]
+        indices = self.get_indices()
+        if len(indices) > 0:
+            return indices[0]
         else:
             return self.index
 
@@ -65,8 +186,9 @@ class AbstractWindow(AbstractBaseClass):
         Returns the last index of the window
         :return: the last index of the window
         """
-        if self.window_data is not None and not self.window_data.empty:
-            return self.window_data.index.levels[0][-1]
+        indices = self.get_indices()
+        if len(indices) > 0:
+            return indices[-1]
         else:
             return self.index
 
@@ -75,8 +197,8 @@ class AbstractWindow(AbstractBaseClass):
         Checks if the window is full
         :return: True if the window is full
         """
-        if self.window_data is not None:
-            return not self.window_data.empty and len(self.window_data.index.get_level_values(0).unique()) == self.window_size
+        if self.initialized:
+            return len(self.get_indices()) == self.window_size
         else:
             raise ValueError("The window is not initialized")
 
@@ -87,12 +209,12 @@ class AbstractWindow(AbstractBaseClass):
         :return:
         """
         # initialize the window
-        if self.window_data is None:
-            self.window_data = pd.DataFrame()
+        self.initialized = True
 
         # forget the data from the window if the window is full and if we have something to add
         if not X.empty and self.apply_windowing and self.is_full():
-            self.forget()
+            with self.profiler.stage(self.index, const.forget_time):
+                self.forget()
 
         # add the data to the window
         self.add_to_window(X)
@@ -107,16 +229,96 @@ class AbstractWindow(AbstractBaseClass):
         """
         if X is None or X.empty:
             return
-        data = {self.index: X}
-        self.window_data = self.window_data.append(pd.concat(data))
+        self.append_data(self.index, X)
+
+    def append_data(self, index, X):
+        """
+        Appends the data to the window with the specified index and records the change
+        :param index: the index of the data in the window
+        :param X: The data to add to the window
+        """
+        self.storage.append(index, X)
+        if self.target_col_name is not None:
+            self.add_class_counts(index, X)
+        self.changes.append((const.change_add, index, X))
+
+    def drop_data(self, index):
+        """
+        Drops the data with the specified index from the window and records the change
+        :param index: {int, list}: the index of the data to drop
+        """
+        self.storage.drop(index)
+        if self.target_col_name is not None:
+            for data_index in self.storage.to_list(index):
+                self.total_counts.subtract(self.class_counts.pop(data_index, {}))
+        self.changes.append((const.change_drop, index, None))
+
+    def drop_rows(self, index, rows):
+        """
+        Drops rows of the data with the specified index from the window and records the change
+        :param index: the index of the data in the window
+        :param rows: {int, array-like}: the number of first rows to drop, or the positions of the rows to drop
+        """
+        dropped = self.storage.drop_rows(index, rows)
+        if self.target_col_name is not None:
+            counts = Counter(dropped[self.target_col_name].value_counts().to_dict())
+            self.class_counts[index].subtract(counts)
+            self.total_counts.subtract(counts)
+            if self.storage.get_size(index) == 0:
+                del self.class_counts[index]
+        self.changes.append((const.change_drop_rows, index, rows))
+
+    def pop_changes(self):
+        """
+        Gets the changes made to the window data since the last call and clears them
+        :return: list of (change, index, data)
+        """
+        changes = self.changes
+        self.changes = []
+        return changes
+
+    def apply_changes(self, changes, index=None):
+        """
+        Replays the changes returned by pop_changes on the window data
+        :param changes: list of (change, index, data)
+        :param index: the index of the window after the changes
+        """
+        self.initialized = True
+
+        for change, change_index, data in changes:
+            if change == const.change_add:
+                self.append_data(change_index, data)
+            elif change == const.change_drop:
+                self.drop_data(change_index)
+            elif change == const.change_drop_rows:
+                self.drop_rows(change_index, data)
+            else:
+                raise ValueError("Unknown change: " + str(change))
+
+        # the replayed changes are already part of the checkpoint
+        self.changes = []
+
+        if index is not None:
+            self.index = index
+
+    def get_snapshot(self):
+        """
+        Gets the window data that is written to the checkpoint
+        :return: the snapshot of the storage
+        """
+        return self.storage.get_snapshot()
 
     def restore_window(self, index, data):
         """
         Restores the window data
-        :param data: the data with which the window is initialized
+        :param index: the index of the window
+        :param data: the snapshot returned by get_snapshot with which the window is initialized
         """
-        self.window_data = data
+        self.storage.restore(data)
+        self.initialized = True
+        self.count_classes()
         self.index = index
+        self.changes = []
 
     def set_index(self, index):
         """
@@ -126,31 +328,49 @@ class AbstractWindow(AbstractBaseClass):
         """
         self.index = index
 
-    def get_window_stats(self, index:int, classes: list, target_col_name: str) -> pd.DataFrame:
+    def get_window_stats(self, index: int, classes: list, target_col_name: str,
+                         recorder: MetricsRecorder = None) -> MetricsRecorder:
         """
         Gets the window statistics for the specified classes
         :param index: index for the stats
         :param classes: the classes for which the statistics need to be extracted
         :param target_col_name: the name of the target column
-        :return: the window statistics
+        :param recorder: the recorder to which the statistics are written. Default: a new recorder
+        :return: the recorder with the window statistics
         """
-        classes.insert(0, const.total)
-        pd_index = pd.MultiIndex.from_product([[const.window_stats], classes])
-        stats = pd.DataFrame(index=pd_index).T.copy()
-
-        data = self.get_window_data()
+        stats = MetricsRecorder(index=[index]) if recorder is None else recorder
 
-        other_columns = list(data.columns.values)
-        other_columns.remove(target_col_name)
+        classes.insert(0, const.total)
 
-        counts = dict(data.groupby(by=target_col_name).count()[other_columns[0]])
+        if target_col_name == self.target_col_name:
+            counts = self.get_class_counts()
+        else:
+            data = self.get_window_data()
+            counts = dict(data[target_col_name].value_counts()) if not data.empty else {}
 
         for clazz in classes:
             if clazz == const.total:
                 value = np.sum(list(counts.values()))
             else:
                 value = counts.get(clazz)
-            stats.loc[index, (const.window_stats, clazz)] = value
+            stats.record(index, (const.window_stats, clazz), value)
+
+        return stats
+
+    def get_memory_stats(self, index: int, recorder: MetricsRecorder = None) -> MetricsRecorder:
+        """
+        Gets the size of every column of the window data
+        :param index: index for the stats
+        :param recorder: the recorder to which the statistics are written. Default: a new recorder
+        :return: the recorder with the size of the columns and the total size in bytes
+        """
+        stats = MetricsRecorder(index=[index]) if recorder is None else recorder
+
+        sizes = self.storage.get_column_sizes()
+
+        for column, size in sizes.items():
+            stats.record(index, (const.window_memory, column), size)
+        stats.record(index, (const.window_memory, const.total), np.sum(list(sizes.values())))
 
         return stats
 
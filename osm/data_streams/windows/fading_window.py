@@ -0,0 +1,78 @@
+import numpy as np
+
+import osm.data_streams.constants as const
+from osm.data_streams.windows.abstract_window import AbstractWindow
+
+
+class FadingWindow(AbstractWindow):
+
+    def __init__(self, decay, min_weight=0.01, index=0, storage=None) -> None:
+        """
+        Weights the data of every index of the window by decay ** age, where the age is the number of indices since
+        the data was added, and forgets the data whose weight falls below the minimum weight. The weights are passed
+        to the base estimator as the sample weights, so that the old data counts less than the new data
+        :param decay: float: the factor by which the weight of the data decreases at every index, between 0 and 1
+        :param min_weight: float: the data is forgotten when its weight falls below the minimum weight. Default 0.01
+        :param index: int: The starting index of the window. Default 0
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
+        """
+        if decay <= 0 or decay >= 1:
+            raise ValueError("The decay should be between 0 and 1")
+
+        if min_weight <= 0 or min_weight > 1:
+            raise ValueError("The minimum weight should be between 0 and 1")
+
+        # the number of indices whose weight is at least the minimum weight
+        window_size = int(np.floor(np.log(min_weight) / np.log(decay))) + 1
+
+        super().__init__(window_size, index, storage=storage)
+        self.decay = decay
+        self.min_weight = min_weight
+
+    def add(self, X):
+        """
+        Adds the data to the window and forgets the data whose weight falls below the minimum weight
+        :param X: The data to be added
+        """
+        # initialize the window
+        self.initialized = True
+
+        self.add_to_window(X)
+
+        # increment the index
+        self.index = self.index + 1
+
+        with self.profiler.stage(self.index - 1, const.forget_time):
+            self.forget()
+
+    def get_weights(self, indices):
+        """
+        Gets the weights of the data with the specified indices
+        :param indices: array of the indices of the data in the window
+        :return: array of the weights
+        """
+        ages = (self.index - 1) - np.asarray(indices)
+        return self.decay ** np.maximum(ages, 0)
+
+    def get_sample_weights(self, X):
+        """
+        Gets the weights of the instances. The data that was not taken from the window is the data of the last index
+        :param X: the data
+        :return: array of the weights
+        """
+        if not self.storage.is_window_data(X):
+            return np.ones(len(X))
+        return self.get_weights(X.index.get_level_values(0))
+
+    def forget(self):
+        """
+        Forgets the data whose weight is below the minimum weight
+        """
+        indices = self.get_indices()
+        weights = self.get_weights(indices)
+        index_to_drop = [index for index, weight in zip(indices, weights) if weight < self.min_weight]
+        if len(index_to_drop) > 0:
+            self.drop_data(index_to_drop)
+
+    def get_name(self):
+        return "fading_window"
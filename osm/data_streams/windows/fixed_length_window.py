@@ -1,22 +1,67 @@
-import collections
-
+import osm.data_streams.constants as const
 from osm.data_streams.windows.abstract_window import AbstractWindow
 
 
 class FixedLengthWindow(AbstractWindow):
 
+    def __init__(self, window_size, index=0, storage=None) -> None:
+        """
+        Keeps the last window_size instances. The instances of a batch are added at once with the index of the
+        timepoint, and the oldest instances are evicted by dropping whole batches and the first rows of the oldest
+        remaining batch
+        :param window_size: int: The number of instances in the window
+        :param index: int: The starting index of the window. Default 0
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
+        """
+        super().__init__(window_size, index, storage=storage)
+
     def add(self, X):
-        if isinstance(X, collections.Iterable):
-            for x in X.__iter__():
-                # for each instance create a new index
-                super().add(x)
+        """
+        Adds the instances to the window and forgets the oldest instances if the window is full
+        :param X: The data to be added
+        """
+        # initialize the window
+        self.initialized = True
+
+        if X is not None and not X.empty:
+            # the instances that would be forgotten as soon as they are added are skipped
+            n_skipped = max(0, len(X) - self.window_size)
+            if n_skipped > 0:
+                X = X.iloc[n_skipped:]
+
+            self.add_to_window(X)
+
+            with self.profiler.stage(self.index, const.forget_time):
+                self.forget()
+
+        # increment the index
+        self.index = self.index + 1
+
+    def is_full(self):
+        """
+        Checks if the window is full
+        :return: True if the window contains window_size instances
+        """
+        if self.initialized:
+            return self.storage.get_size() >= self.window_size
         else:
-            super().add(X)
+            raise ValueError("The window is not initialized")
 
     def forget(self):
-        # drop the first instance
-        index_to_drop = self.window_data.index.levels[0][-self.window_size-1]
-        self.window_data.drop(index=index_to_drop, inplace=True, level=0)
+        """
+        Forgets the oldest instances until the window contains window_size instances
+        """
+        n_forget = self.storage.get_size() - self.window_size
+
+        while n_forget > 0:
+            index_to_drop = self.get_first_index()
+            size = self.storage.get_size(index_to_drop)
+
+            if size <= n_forget:
+                self.drop_data(index_to_drop)
+            else:
+                self.drop_rows(index_to_drop, n_forget)
+            n_forget = n_forget - size
 
     def get_name(self):
         return "fixed_length_window"
@@ -12,11 +12,13 @@ class AbstractSelectiveForgetting(AbstractBaseClass):
         super().__init__()
 
     @abstractmethod
-    def sample_data(self, data_to_forget, remaining_data):
+    def sample_data(self, data_to_forget, remaining_data, remaining_counts=None):
         """
         Based on the forgetting strategy, samples data from the data to forget
         :param data_to_forget: The data to be forgotten
-        :param remaining_data: The remaining data in the window
+        :param remaining_data: The remaining data in the window. None if the window passes the remaining_counts instead
+        :param remaining_counts: dict: the number of instances of every class in the remaining data, if the window
+        counts the classes
         :return: The sampled data
         """
         pass
@@ -1,7 +1,6 @@
 import numpy as np
 import pandas as pd
 from sklearn.utils import shuffle
-from sklearn.utils.multiclass import unique_labels
 
 from osm.data_streams.windows.forgetting_strategy.abstract_selective_forgetting import AbstractSelectiveForgetting
 
@@ -29,16 +28,17 @@ class Threshold(AbstractSelectiveForgetting):
     def get_name(self):
         return "threshold_forgetting"
 
-    def sample_data(self, data_to_forget, remaining_data):
+    def sample_data(self, data_to_forget, remaining_data, remaining_counts=None):
         """
         Samples the required the number of instances from the data_to_forget
         so that each class has a minimum number of instances
         :param data_to_forget: the data to forget
-        :param remaining_data: the remaining data in the window
+        :param remaining_data: the remaining data in the window. Not used if the remaining_counts are passed
+        :param remaining_counts: dict: the number of instances of every class in the remaining data
         :return:
         """
         # check if there is sufficient data
-        required_data = self.get_required_data(remaining_data)
+        required_data = self.get_required_data(remaining_data, remaining_counts)
 
         # sample the required data from the data that will be dropped
         sampled_data = pd.DataFrame()
@@ -53,30 +53,20 @@ class Threshold(AbstractSelectiveForgetting):
                 sampled_data = sampled_data.append(instances)
         return sampled_data
 
-    def get_required_data(self, data):
+    def get_required_data(self, data, counts=None):
         """
         Check if the data has sufficient instances from every class and gives a count of additional instances required
         from every class
-        :param data: The data to be checked
+        :param data: The data to be checked. Not used if the counts are passed
+        :param counts: dict: the number of instances of every class in the data, e.g. the class counts of the window
         :return: The number of instances to be sampled from every class to satisfy the minimum count required
         """
+        if counts is None:
+            counts = data[self.target_col_name].value_counts()
 
-        # check if all the labels are there in the sampled data
-        data_labels = unique_labels(data[self.target_col_name])
-
-        # check if the next window has samples from all classes
-        try:
-            same_labels = (self.classes == data_labels).all()
-        except:
-            same_labels = False
-
-        class_count = data.groupby(self.target_col_name)[self.target_col_name].count()
-        class_count = self.threshold - class_count
-        if not same_labels:
-            indices = np.isnan(class_count)
-            class_count[indices] = self.threshold[indices]
-
-        return class_count
+        # the classes without instances require the whole threshold
+        class_count = pd.Series(counts, dtype=np.float64).reindex(self.threshold.index, fill_value=0)
+        return self.threshold - class_count
 
 
 class FixedThreshold(Threshold):
@@ -4,17 +4,18 @@ from osm.data_streams.windows.forgetting_strategy.abstract_selective_forgetting
 
 class LandmarkWindow(AbstractWindow):
 
-    def __init__(self, window_size, index=0, forgetting_strategy=None) -> None:
+    def __init__(self, window_size, index=0, forgetting_strategy=None, storage=None) -> None:
         """
         Implementation of a sliding method
         :param window_size: int: The window size
         :param index: int: The starting index of the window. Default 0
         :param forgetting_strategy: AbstractSelectiveForgetting: the forgetting strategy to be used
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
         """
         if forgetting_strategy is not None and not isinstance(forgetting_strategy, AbstractSelectiveForgetting):
             raise ValueError("The forgetting strategy should be an instance of AbstractSelectiveForgetting")
 
-        super().__init__(window_size, index)
+        super().__init__(window_size, index, storage=storage)
         self.forgetting_strategy = forgetting_strategy
 
     def forget(self):
@@ -23,24 +24,29 @@ class LandmarkWindow(AbstractWindow):
         If the minimum count is set ensures that minimum number of instances are available before forgetting
         :return:
         """
-        index_to_drop = self.window_data.index.levels[0]
+        index_to_drop = self.get_indices()
 
         if self.forgetting_strategy is not None:
             # sample data using the specified forgetting strategy
             # the data that will be dropped
             data_to_drop = self.get_window_data(index_to_drop)
 
-            # the remaining data in the window
-            data_remaining = data_to_drop.drop(index=data_to_drop.index.levels[0], inplace=False, level=0)
+            # the remaining data in the window, which is empty as all the data is forgotten
+            if self.target_col_name is not None:
+                data_remaining = None
+                counts_remaining = self.get_class_counts([])
+            else:
+                data_remaining = data_to_drop.drop(index=index_to_drop, inplace=False, level=0)
+                counts_remaining = None
 
             # get the sampled data
-            sampled_data = self.forgetting_strategy.sample_data(data_to_drop, data_remaining)
+            sampled_data = self.forgetting_strategy.sample_data(data_to_drop, data_remaining, counts_remaining)
 
             # add the sampled data to the window
             self.add_to_window(sampled_data)
 
         # forget data from the first timepoint
-        self.window_data.drop(index=index_to_drop, inplace=True, level=0)
+        self.drop_data(index_to_drop)
 
     def get_name(self):
         return "landmark_window"
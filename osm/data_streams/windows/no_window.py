@@ -2,11 +2,12 @@ from osm.data_streams.windows.abstract_window import AbstractWindow
 
 
 class NoWindow(AbstractWindow):
-    def __init__(self) -> None:
+    def __init__(self, storage=None) -> None:
         """
         Does not implement any windowing strategy. So it only keeps adding data
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
         """
-        super().__init__(window_size=None, apply_windowing=False)
+        super().__init__(window_size=None, apply_windowing=False, storage=storage)
 
     def forget(self):
         """
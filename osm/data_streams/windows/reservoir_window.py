@@ -0,0 +1,171 @@
+import numpy as np
+
+import osm.data_streams.constants as const
+from osm.data_streams.metrics_recorder import MetricsRecorder
+from osm.data_streams.windows.abstract_window import AbstractWindow
+
+
+class ReservoirWindow(AbstractWindow):
+
+    def __init__(self, window_size, index=0, bias=0.0, random_state=None, storage=None) -> None:
+        """
+        Keeps a random sample of at most window_size of all the instances that were added to the window, so that the
+        memory of the window is bounded however long the stream is. Every instance is given a random key when it is
+        added and the window keeps the instances with the largest keys. The keys are kept next to the window data and
+        written with its snapshot, and a batch is inserted by comparing its keys with the keys in the window at once.
+        With a bias the key of an instance added at index t is increased by bias * t, which samples the instances with
+        a weight of exp(bias * t), so that the recent instances are more likely to be in the window
+        :param window_size: int: The maximum number of instances in the window
+        :param index: int: The starting index of the window. Default 0
+        :param bias: float: The time bias of the sample. Default 0, a uniform sample of the instances
+        :param random_state: int: the seed of the keys, which are drawn per index of the window. Default: None, the
+        global numpy generator
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
+        """
+        if window_size is None or window_size <= 0:
+            raise ValueError("The window size should be positive")
+
+        if bias < 0:
+            raise ValueError("The bias should not be negative")
+
+        super().__init__(window_size, index, storage=storage)
+        self.bias = bias
+        self.random_state = random_state
+
+        # index of the window -> the keys of the data
+        self.keys = {}
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['keys']
+        return state
+
+    def add(self, X):
+        """
+        Adds the instances whose keys are among the largest window_size keys to the window and forgets the instances
+        of the window whose keys are no longer among them
+        :param X: The data to be added
+        """
+        # initialize the window
+        self.initialized = True
+
+        if X is not None and not X.empty:
+            keys = self.draw_keys(len(X))
+
+            with self.profiler.stage(self.index, const.forget_time):
+                # the instances that would be forgotten as soon as they are added are skipped
+                n_forget = self.storage.get_size() + len(keys) - self.window_size
+                if n_forget > 0:
+                    window_keys = np.concatenate([keys] + list(self.keys.values()))
+                    cutoff = np.partition(window_keys, n_forget)[n_forget]
+                    selected = keys >= cutoff
+                    X = X[selected]
+                    keys = keys[selected]
+
+            if not X.empty:
+                self.add_to_window(X.assign(**{const.reservoir_key: keys}))
+
+            with self.profiler.stage(self.index, const.forget_time):
+                self.forget()
+
+        # increment the index
+        self.index = self.index + 1
+
+    def draw_keys(self, n):
+        """
+        Draws the keys of the instances added at the current index
+        :param n: the number of instances
+        :return: array of the keys
+        """
+        if self.random_state is None:
+            random = np.random
+        else:
+            random = np.random.RandomState([self.random_state, self.index])
+        return random.gumbel(size=n) + self.bias * self.index
+
+    def append_data(self, index, X):
+        """
+        Appends the data to the window with the specified index. The keys of the instances are passed in the
+        reservoir_key column, which is recorded with the change but not stored in the window data
+        :param index: the index of the data in the window
+        :param X: The data to add to the window, with the reservoir_key column
+        """
+        super().append_data(index, X.drop(columns=const.reservoir_key))
+        # the change is replayed with the keys
+        self.changes[-1] = (const.change_add, index, X)
+
+        keys = X[const.reservoir_key].values
+        if index in self.keys:
+            keys = np.concatenate([self.keys[index], keys])
+        self.keys[index] = keys
+
+    def drop_data(self, index):
+        super().drop_data(index)
+        for data_index in self.storage.to_list(index):
+            self.keys.pop(data_index, None)
+
+    def drop_rows(self, index, rows):
+        super().drop_rows(index, rows)
+        mask = self.storage.get_row_mask(len(self.keys[index]), rows)
+        if mask.all():
+            del self.keys[index]
+        else:
+            self.keys[index] = self.keys[index][~mask]
+
+    def get_snapshot(self):
+        """
+        Gets the window data that is written to the checkpoint
+        :return: dict with the snapshot of the storage and the keys of the data
+        """
+        return {"data": super().get_snapshot(), "keys": dict(self.keys)}
+
+    def restore_window(self, index, data):
+        super().restore_window(index, data["data"])
+        self.keys = dict(data["keys"])
+
+    def is_full(self):
+        """
+        Checks if the window is full
+        :return: True if the window contains window_size instances
+        """
+        if self.initialized:
+            return self.storage.get_size() >= self.window_size
+        else:
+            raise ValueError("The window is not initialized")
+
+    def forget(self):
+        """
+        Forgets the instances with the smallest keys until the window contains window_size instances
+        """
+        n_forget = self.storage.get_size() - self.window_size
+        if n_forget <= 0:
+            return
+
+        indices = list(self.keys)
+        sizes = [len(self.keys[index]) for index in indices]
+        blocks = np.repeat(np.arange(len(indices)), sizes)
+        positions = np.arange(len(blocks)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+
+        forgotten = np.argpartition(np.concatenate([self.keys[index] for index in indices]), n_forget - 1)[:n_forget]
+        forgotten = forgotten[np.lexsort((positions[forgotten], blocks[forgotten]))]
+
+        bounds = np.flatnonzero(np.diff(blocks[forgotten])) + 1
+        for rows in np.split(forgotten, bounds):
+            index = indices[blocks[rows[0]]]
+            if len(rows) == sizes[blocks[rows[0]]]:
+                self.drop_data(index)
+            else:
+                self.drop_rows(index, positions[rows])
+
+    def get_window_stats(self, index: int, classes: list, target_col_name: str,
+                         recorder: MetricsRecorder = None) -> MetricsRecorder:
+        """
+        Gets the window statistics for the specified classes and the fill of the reservoir, the number of instances in
+        the window divided by the window size
+        """
+        stats = super().get_window_stats(index, classes, target_col_name, recorder)
+        stats.record(index, (const.window_stats, const.reservoir_fill), self.storage.get_size() / self.window_size)
+        return stats
+
+    def get_name(self):
+        return "reservoir_window"
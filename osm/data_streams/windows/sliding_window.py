@@ -4,17 +4,18 @@ from osm.data_streams.windows.forgetting_strategy.abstract_selective_forgetting
 
 class SlidingWindow(AbstractWindow):
 
-    def __init__(self, window_size, index=0, forgetting_strategy=None) -> None:
+    def __init__(self, window_size, index=0, forgetting_strategy=None, storage=None) -> None:
         """
         Implementation of a sliding method
         :param window_size: int: The window size
         :param index: int: The starting index of the window. Default 0
         :param forgetting_strategy: AbstractSelectiveForgetting: the forgetting strategy to be used
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
         """
         if forgetting_strategy is not None and not isinstance(forgetting_strategy, AbstractSelectiveForgetting):
             raise ValueError("The forgetting strategy should be an instance of AbstractSelectiveForgetting")
 
-        super().__init__(window_size, index)
+        super().__init__(window_size, index, storage=storage)
         self.forgetting_strategy = forgetting_strategy
 
     def forget(self):
@@ -30,17 +31,23 @@ class SlidingWindow(AbstractWindow):
             # the data that will be dropped
             data_to_drop = self.get_window_data(index_to_drop)
 
-            # the remaining data in the window
-            data_remaining = self.get_window_data(range(index_to_drop + 1, index_to_drop + self.window_size, 1))
+            # the remaining data in the window. Only its classes are counted if the window counts them
+            index_remaining = range(index_to_drop + 1, index_to_drop + self.window_size, 1)
+            if self.target_col_name is not None:
+                data_remaining = None
+                counts_remaining = self.get_class_counts(index_remaining)
+            else:
+                data_remaining = self.get_window_data(index_remaining)
+                counts_remaining = None
 
             # get the sampled data
-            sampled_data = self.forgetting_strategy.sample_data(data_to_drop, data_remaining)
+            sampled_data = self.forgetting_strategy.sample_data(data_to_drop, data_remaining, counts_remaining)
 
             # add the sampled data to the window
             self.add_to_window(sampled_data)
 
         # forget data from the first timepoint
-        self.window_data.drop(index=index_to_drop, inplace=True, level=0)
+        self.drop_data(index_to_drop)
 
     def get_name(self):
         return "sliding_window"
@@ -0,0 +1,159 @@
+from abc import abstractmethod
+
+import numpy as np
+import pandas as pd
+
+import osm.data_streams.constants as const
+from osm.data_streams.abstract_base_class import AbstractBaseClass
+from osm.data_streams.memory_usage import get_column_sizes
+
+
+class AbstractWindowStorage(AbstractBaseClass):
+
+    def __init__(self) -> None:
+        """
+        Abstract class for the storage of the data in a window. The data is stored in blocks with the index of the
+        window, e.g. the timepoint at which the data was added
+        """
+        super().__init__()
+
+    @abstractmethod
+    def append(self, index, X):
+        """
+        Appends the data to the block with the specified index
+        :param index: the index of the block
+        :param X: the data. If the data was taken from the window its first index level is the index of the window
+        """
+        pass
+
+    @abstractmethod
+    def drop(self, index):
+        """
+        Drops the blocks with the specified index
+        :param index: {int, list}: the index of the blocks
+        """
+        pass
+
+    @abstractmethod
+    def drop_rows(self, index, rows):
+        """
+        Drops rows of a block, e.g. the oldest instances of a window with a fixed number of instances
+        :param index: the index of the block
+        :param rows: {int, array-like}: the number of first rows to drop, or the positions of the rows to drop
+        :return: the data of the dropped rows
+        """
+        pass
+
+    @abstractmethod
+    def get_data(self, index=None):
+        """
+        Gets the data of the blocks. The data of all the blocks may be cached until the storage changes, in which
+        case a shallow copy is returned: columns can be added to or removed from it, but its values are shared with
+        the cache and are not modified in place
+        :param index: {int, list}: the index of the blocks. Default: all blocks
+        :return: the data with the index of the window as the first index level
+        """
+        pass
+
+    @abstractmethod
+    def get_indices(self):
+        """
+        Gets the index of the blocks in the storage
+        :return: sorted list of the index of the blocks
+        """
+        pass
+
+    @abstractmethod
+    def get_snapshot(self):
+        """
+        Gets the data of the storage that is written to the checkpoint
+        :return: the snapshot
+        """
+        pass
+
+    @abstractmethod
+    def restore(self, snapshot):
+        """
+        Restores the storage from a snapshot returned by get_snapshot
+        :param snapshot: the snapshot
+        """
+        pass
+
+    def get_size(self, index=None):
+        """
+        Gets the number of rows of the blocks
+        :param index: {int, list}: the index of the blocks. Default: all blocks
+        :return: the number of rows
+        """
+        return len(self.get_data(index))
+
+    def is_empty(self):
+        """
+        :return: True if the storage has no data
+        """
+        return len(self.get_indices()) == 0
+
+    def get_features(self, index=None):
+        """
+        Gets the features of the blocks that are used to train the feature pipeline. Unless the storage vectorizes the
+        data, the features are the data itself
+        :param index: {int, list}: the index of the blocks. Default: all blocks
+        :return: the features in the order of the rows of get_data
+        """
+        return self.get_data(index)
+
+    def transform(self, X):
+        """
+        Transforms data that is not in the window, e.g. the test data, into the features of get_features
+        :param X: the data
+        :return: the features
+        """
+        return X
+
+    def get_vectorizer(self):
+        """
+        :return: the vectorizer of the storage. None if the storage does not vectorize the data
+        """
+        return None
+
+    def get_column_sizes(self):
+        """
+        Gets the memory used by every column of the data
+        :return: dict of column name to size in bytes
+        """
+        return get_column_sizes(self.get_data())
+
+    @staticmethod
+    def get_row_mask(n_rows, rows):
+        """
+        Converts the rows to drop from a block to a mask
+        :param n_rows: the number of rows of the block
+        :param rows: {int, array-like}: the number of first rows, or the positions of the rows
+        :return: boolean array that is True for the rows to drop
+        """
+        mask = np.zeros(n_rows, dtype=bool)
+        if np.isscalar(rows):
+            mask[:rows] = True
+        else:
+            mask[np.asarray(rows, dtype=np.int_)] = True
+        return mask
+
+    @staticmethod
+    def to_list(index):
+        """
+        Converts the index of the blocks to a list
+        :param index: {int, range, list, pd.Index}
+        :return: list of the index of the blocks
+        """
+        if isinstance(index, (range, list, tuple, pd.Index)):
+            return list(index)
+        return [index]
+
+    @staticmethod
+    def is_window_data(X):
+        """
+        Checks if the data was taken from the window, i.e. its first index level is the index of the window
+        :param X: the data
+        :return: True if the data was taken from the window
+        """
+        return isinstance(X.index, pd.MultiIndex) and X.index.names[0] == const.window_index
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+
+import pandas as pd
+
+import osm.data_streams.constants as const
+from osm.data_streams.windows.storage.abstract_window_storage import AbstractWindowStorage
+
+
+class DataFrameStorage(AbstractWindowStorage):
+
+    def __init__(self) -> None:
+        """
+        Stores the data of the window as it is, in a dataframe per index of the window. Adding and dropping an index
+        does not copy the other data of the window. The concatenated data of the window, with the index of the window
+        as the first index level, is only created when it is requested and cached until the window changes
+        """
+        super().__init__()
+
+        # index of the window -> data
+        self.blocks = OrderedDict()
+        self.data = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['blocks']
+        del state['data']
+        return state
+
+    def get_name(self):
+        return "dataframe_storage"
+
+    def append(self, index, X):
+        if self.is_window_data(X):
+            X = X.droplevel(0)
+
+        if index in self.blocks:
+            X = pd.concat([self.blocks[index], X], sort=False)
+
+        self.blocks[index] = X
+        self.data = None
+
+    def drop(self, index):
+        for block in self.to_list(index):
+            self.blocks.pop(block, None)
+        self.data = None
+
+    def drop_rows(self, index, rows):
+        block = self.blocks[index]
+        mask = self.get_row_mask(len(block), rows)
+        if mask.all():
+            del self.blocks[index]
+        else:
+            self.blocks[index] = block[~mask]
+        self.data = None
+        return block[mask]
+
+    def get_size(self, index=None):
+        blocks = list(self.blocks) if index is None else self.to_list(index)
+        return sum(len(self.blocks[block]) for block in blocks if block in self.blocks)
+
+    def get_data(self, index=None):
+        if index is None:
+            if self.data is None:
+                self.data = self.concat(list(self.blocks))
+            return self.data.copy(deep=False)
+
+        return self.concat([block for block in self.to_list(index) if block in self.blocks])
+
+    def concat(self, blocks):
+        """
+        Concatenates the data of the blocks
+        :param blocks: the index of the blocks
+        :return: the data with the index of the window as the first index level
+        """
+        if len(blocks) == 0:
+            return pd.DataFrame()
+        return pd.concat({block: self.blocks[block] for block in blocks}, names=[const.window_index], sort=False)
+
+    def get_indices(self):
+        return sorted(self.blocks)
+
+    def get_snapshot(self):
+        return self.get_data()
+
+    def restore(self, snapshot):
+        self.blocks = OrderedDict()
+        self.data = None
+
+        if snapshot.empty:
+            return
+
+        for index, data in snapshot.groupby(level=0, sort=False):
+            self.blocks[index] = data.droplevel(0)
@@ -0,0 +1,180 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+import osm.data_streams.constants as const
+from osm.data_streams.windows.storage.abstract_window_storage import AbstractWindowStorage
+from osm.transformers.IncrementalDictVectorizer import IncrementalDictVectorizer
+
+
+class SparseStorage(AbstractWindowStorage):
+
+    def __init__(self, feature_col_name, vectorizer=None) -> None:
+        """
+        Stores every block of the window as a sparse feature matrix, vectorized with a vocabulary that is shared by all
+        blocks, and a dataframe of the other columns, i.e. the labels, with the index of the reviews. The dicts of the
+        feature column are not kept, so the data is only vectorized once when it is added to the window. The feature
+        pipeline is then fitted on the feature matrix of the window, e.g. starting with a SparseFeatureSelector
+        :param feature_col_name: the name of the column with the dicts of the features, e.g. the ngrams
+        :param vectorizer: IncrementalDictVectorizer: the vectorizer with the shared vocabulary. Default: a new
+        IncrementalDictVectorizer
+        """
+        super().__init__()
+        if vectorizer is not None and not isinstance(vectorizer, IncrementalDictVectorizer):
+            raise ValueError("The vectorizer must be an instance of IncrementalDictVectorizer")
+
+        self.feature_col_name = feature_col_name
+        self.vectorizer = IncrementalDictVectorizer() if vectorizer is None else vectorizer
+
+        # index of the window -> (features, data)
+        self.blocks = OrderedDict()
+
+        # the concatenated data and features of all blocks, created when they are requested
+        self.data = None
+        self.features = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['vectorizer']
+        del state['blocks']
+        del state['data']
+        del state['features']
+        return state
+
+    def get_name(self):
+        return "sparse_storage"
+
+    def append(self, index, X):
+        if self.feature_col_name in X.columns:
+            self.vectorizer.partial_fit(X[self.feature_col_name])
+            features = self.vectorizer.transform(X[self.feature_col_name])
+            data = X.drop(columns=[self.feature_col_name])
+        elif self.is_window_data(X):
+            # the features of the rows that are added again, e.g. by a forgetting strategy, are taken from the blocks
+            features, data = self.get_rows(X)
+        else:
+            raise ValueError(str.format("The data should contain the column {0}", self.feature_col_name))
+
+        if index in self.blocks:
+            block_features, block_data = self.blocks[index]
+            features = sp.vstack([self.resize(block_features), self.resize(features)], format="csr")
+            data = pd.concat([block_data, data], sort=False)
+
+        self.blocks[index] = (features, data)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Clears the concatenated data and features after the blocks changed
+        """
+        self.data = None
+        self.features = None
+
+    def get_rows(self, X):
+        """
+        Gets the features and the data of rows of the window
+        :param X: the rows with the index of the window as the first index level
+        :return: features, data
+        """
+        features = []
+        data = []
+        for index, rows in X.groupby(level=0, sort=False):
+            block_features, block_data = self.blocks[index]
+            rows = rows.droplevel(0)
+            features.append(self.resize(block_features[block_data.index.get_indexer(rows.index)]))
+            data.append(rows)
+        return sp.vstack(features, format="csr"), pd.concat(data, sort=False)
+
+    def drop(self, index):
+        for block in self.to_list(index):
+            self.blocks.pop(block, None)
+        self.clear_cache()
+
+    def drop_rows(self, index, rows):
+        features, data = self.blocks[index]
+        mask = self.get_row_mask(len(data), rows)
+        if mask.all():
+            del self.blocks[index]
+        else:
+            self.blocks[index] = (features[np.flatnonzero(~mask)], data[~mask])
+        self.clear_cache()
+        return data[mask]
+
+    def get_size(self, index=None):
+        return sum(len(self.blocks[block][1]) for block in self.select(index))
+
+    def select(self, index):
+        """
+        :param index: {int, list}: the index of the blocks. Default: all blocks
+        :return: list of the index of the blocks in the storage
+        """
+        if index is None:
+            return list(self.blocks)
+        return [block for block in self.to_list(index) if block in self.blocks]
+
+    def get_data(self, index=None):
+        if index is None and self.data is not None:
+            return self.data.copy(deep=False)
+
+        blocks = self.select(index)
+        if len(blocks) == 0:
+            data = pd.DataFrame()
+        else:
+            data = pd.concat({block: self.blocks[block][1] for block in blocks}, names=[const.window_index],
+                             sort=False)
+
+        if index is None:
+            self.data = data
+            return data.copy(deep=False)
+        return data
+
+    def get_features(self, index=None):
+        if index is None and self.features is not None:
+            return self.features
+
+        blocks = self.select(index)
+        if len(blocks) == 0:
+            features = sp.csr_matrix((0, len(self.vectorizer.get_feature_names())))
+        else:
+            features = sp.vstack([self.resize(self.blocks[block][0]) for block in blocks], format="csr")
+
+        if index is None:
+            self.features = features
+        return features
+
+    def transform(self, X):
+        return self.vectorizer.transform(X[self.feature_col_name])
+
+    def get_vectorizer(self):
+        return self.vectorizer
+
+    def get_indices(self):
+        return sorted(self.blocks)
+
+    def get_snapshot(self):
+        return {"vectorizer": self.vectorizer, "blocks": self.blocks}
+
+    def restore(self, snapshot):
+        self.vectorizer = snapshot["vectorizer"]
+        self.blocks = snapshot["blocks"]
+        self.clear_cache()
+
+    def get_column_sizes(self):
+        sizes = super().get_column_sizes()
+        sizes[self.feature_col_name] = sum(features.data.nbytes + features.indices.nbytes + features.indptr.nbytes
+                                           for features, data in self.blocks.values())
+        return sizes
+
+    def resize(self, features):
+        """
+        Widens the features of a block to the current size of the vocabulary without copying them
+        :param features: the csr matrix of a block
+        :return: the csr matrix with a column for every feature in the vocabulary
+        """
+        n_features = len(self.vectorizer.get_feature_names())
+        if features.shape[1] == n_features:
+            return features
+        return sp.csr_matrix((features.data, features.indices, features.indptr),
+                             shape=(features.shape[0], n_features), copy=False)
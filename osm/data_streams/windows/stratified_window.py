@@ -0,0 +1,176 @@
+from collections import deque
+
+import numpy as np
+
+import osm.data_streams.constants as const
+from osm.data_streams.windows.abstract_window import AbstractWindow
+
+
+class StratifiedWindow(AbstractWindow):
+
+    def __init__(self, window_size, min_count, target_col_name=None, index=0, storage=None) -> None:
+        """
+        Sliding window that keeps a minimum number of instances of every class. Every class has a ring buffer of the
+        indices of the window with instances of the class, from the oldest to the newest. When an index slides out of
+        the last window_size indices its instances are forgotten from the head of the buffers, except the newest
+        instances of a class that the class needs to keep the minimum number. The kept instances stay in the window
+        with their index, so they are neither sampled nor added to the window again, and they are forgotten as soon as
+        the newer instances of their class reach the minimum number
+        :param window_size: int: The number of indices whose data is kept completely
+        :param min_count: {int, dict}: the minimum number of instances of every class, or of the classes of the dict
+        :param target_col_name: the column name of the target. Default: the target column set by the FrameWork
+        :param index: int: The starting index of the window. Default 0
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
+        """
+        super().__init__(window_size, index, storage=storage)
+        self.min_count = min_count
+
+        # class -> the indices of the data with instances of the class, from the oldest to the newest
+        self.buffers = {}
+
+        # index of the window -> the classes of the data
+        self.targets = {}
+
+        if target_col_name is not None:
+            self.set_target_col_name(target_col_name)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['buffers']
+        del state['targets']
+        return state
+
+    def add(self, X):
+        """
+        Adds the data to the window and forgets the instances of the indices that slid out of the window which are
+        not needed to keep the minimum number of instances of their class
+        :param X: The data to be added
+        """
+        # initialize the window
+        self.initialized = True
+
+        self.add_to_window(X)
+
+        # forget the data from the window if we have added something
+        if X is not None and not X.empty:
+            with self.profiler.stage(self.index, const.forget_time):
+                self.forget()
+
+        # increment the index
+        self.index = self.index + 1
+
+    def get_min_count(self, clazz):
+        """
+        :param clazz: the class
+        :return: the minimum number of instances of the class
+        """
+        if isinstance(self.min_count, dict):
+            return self.min_count.get(clazz, 0)
+        return self.min_count
+
+    def count_classes(self):
+        super().count_classes()
+
+        self.buffers = {}
+        self.targets = {}
+        if self.target_col_name is None:
+            return
+
+        for index in sorted(self.class_counts):
+            self.add_to_buffers(index, self.class_counts[index])
+            self.targets[index] = self.storage.get_data(index)[self.target_col_name].values
+
+    def add_to_buffers(self, index, counts):
+        """
+        Adds the index to the end of the ring buffers of its classes
+        :param index: the index of the data in the window
+        :param counts: the number of instances of every class of the data
+        """
+        for clazz, count in counts.items():
+            buffer = self.buffers.setdefault(clazz, deque())
+            if count > 0 and (len(buffer) == 0 or buffer[-1] != index):
+                buffer.append(index)
+
+    def append_data(self, index, X):
+        super().append_data(index, X)
+        if self.target_col_name is None:
+            return
+
+        targets = X[self.target_col_name].values
+        if index in self.targets:
+            targets = np.concatenate([self.targets[index], targets])
+        self.targets[index] = targets
+        self.add_to_buffers(index, X[self.target_col_name].value_counts().to_dict())
+
+    def remove_from_buffers(self):
+        """
+        Removes the indices without instances of the class from the head of the ring buffers
+        """
+        for clazz, buffer in self.buffers.items():
+            while len(buffer) > 0 and self.class_counts.get(buffer[0], {}).get(clazz, 0) <= 0:
+                buffer.popleft()
+
+    def drop_data(self, index):
+        super().drop_data(index)
+        for data_index in self.storage.to_list(index):
+            self.targets.pop(data_index, None)
+        self.remove_from_buffers()
+
+    def drop_rows(self, index, rows):
+        super().drop_rows(index, rows)
+        if index not in self.targets:
+            return
+
+        mask = self.storage.get_row_mask(len(self.targets[index]), rows)
+        if mask.all():
+            del self.targets[index]
+        else:
+            self.targets[index] = self.targets[index][~mask]
+        self.remove_from_buffers()
+
+    def is_full(self):
+        """
+        Checks if the window is full
+        :return: True if the window contains window_size indices, besides the indices with the kept instances
+        """
+        if self.initialized:
+            return len(self.get_indices()) >= self.window_size
+        else:
+            raise ValueError("The window is not initialized")
+
+    def forget(self):
+        """
+        Forgets the oldest instances of every class of the indices that slid out of the last window_size indices, as
+        long as the class keeps the minimum number of instances
+        """
+        if self.target_col_name is None:
+            raise ValueError("The stratified window requires the target column to be set")
+
+        indices = self.get_indices()
+        if len(indices) <= self.window_size:
+            return
+        last_expired = indices[len(indices) - self.window_size - 1]
+
+        # index -> class -> the number of instances to forget
+        to_forget = {}
+        for clazz, buffer in self.buffers.items():
+            n_forget = self.total_counts[clazz] - self.get_min_count(clazz)
+            for index in buffer:
+                if n_forget <= 0 or index > last_expired:
+                    break
+                n = min(self.class_counts[index][clazz], n_forget)
+                to_forget.setdefault(index, {})[clazz] = n
+                n_forget = n_forget - n
+
+        for index in sorted(to_forget):
+            counts = to_forget[index]
+            if sum(counts.values()) == len(self.targets[index]):
+                self.drop_data(index)
+            else:
+                # the first instances of every class in the data of the index
+                targets = self.targets[index]
+                rows = np.concatenate([np.flatnonzero(targets == clazz)[:n] for clazz, n in counts.items()])
+                self.drop_rows(index, np.sort(rows))
+
+    def get_name(self):
+        return "stratified_window"
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+import osm.data_streams.constants as const
+from osm.data_streams.windows.abstract_window import AbstractWindow
+
+
+class TimeSpanWindow(AbstractWindow):
+
+    def __init__(self, duration, index=0, date_level="date", storage=None) -> None:
+        """
+        Keeps the reviews whose date is within the duration before the latest date in the window, irrespective of the
+        number of reviews in a timepoint. The data of every timepoint is sorted by date when it is added, so that the
+        reviews to forget are found by a binary search on the dates of the oldest timepoints. The timepoints are
+        expected in the order of their dates, so the search stops at the first timepoint without reviews to forget
+        :param duration: {pd.Timedelta, str}: the duration, e.g. "28D"
+        :param index: int: The starting index of the window. Default 0
+        :param date_level: the name of the index level with the date of the reviews
+        :param storage: AbstractWindowStorage: stores the data of the window. Default: DataFrameStorage
+        """
+        duration = pd.Timedelta(duration)
+        if duration <= pd.Timedelta(0):
+            raise ValueError("The duration should be positive")
+
+        super().__init__(duration, index, storage=storage)
+        self.date_level = date_level
+
+        # index of the window -> the sorted dates of the data
+        self.dates = {}
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        del state['dates']
+        state['window_size'] = str(self.window_size)
+        return state
+
+    def add(self, X):
+        """
+        Adds the data to the window and forgets the reviews that are older than the duration
+        :param X: The data to be added
+        """
+        # initialize the window
+        self.initialized = True
+
+        self.add_to_window(X)
+
+        with self.profiler.stage(self.index, const.forget_time):
+            self.forget()
+
+        # increment the index
+        self.index = self.index + 1
+
+    def get_dates(self, X):
+        """
+        :param X: the data
+        :return: the dates of the data as datetime64
+        """
+        return X.index.get_level_values(self.date_level).values
+
+    def append_data(self, index, X):
+        """
+        Sorts the data by date and appends it to the window
+        :param index: the index of the data in the window
+        :param X: The data to add to the window
+        """
+        dates = self.get_dates(X)
+        order = np.argsort(dates, kind="mergesort")
+        if (order != np.arange(len(order))).any():
+            X = X.iloc[order]
+            dates = dates[order]
+
+        if index in self.dates:
+            raise ValueError("The time span window does not add data to an index twice")
+
+        super().append_data(index, X)
+        self.dates[index] = dates
+
+    def drop_data(self, index):
+        super().drop_data(index)
+        for data_index in self.storage.to_list(index):
+            self.dates.pop(data_index, None)
+
+    def drop_rows(self, index, rows):
+        super().drop_rows(index, rows)
+        mask = self.storage.get_row_mask(len(self.dates[index]), rows)
+        if mask.all():
+            del self.dates[index]
+        else:
+            self.dates[index] = self.dates[index][~mask]
+
+    def restore_window(self, index, data):
+        super().restore_window(index, data)
+
+        # the data of every index is already sorted by date
+        self.dates = {}
+        for data_index in self.get_indices():
+            self.dates[data_index] = self.get_dates(self.storage.get_data(data_index))
+
+    def get_last_date(self):
+        """
+        :return: the latest date in the window. None if the window is empty
+        """
+        if not self.dates:
+            return None
+        return max(dates[-1] for dates in self.dates.values())
+
+    def is_full(self):
+        """
+        Checks if the window is full
+        :return: True if the dates in the window span the duration
+        """
+        if not self.initialized:
+            raise ValueError("The window is not initialized")
+        if not self.dates:
+            return False
+        first_date = min(dates[0] for dates in self.dates.values())
+        return self.get_last_date() - first_date >= self.window_size
+
+    def forget(self):
+        """
+        Forgets the reviews whose date is not within the duration before the latest date in the window
+        """
+        last_date = self.get_last_date()
+        if last_date is None:
+            return
+
+        cutoff = last_date - self.window_size.to_timedelta64()
+        for index in list(self.dates):
+            n_forget = np.searchsorted(self.dates[index], cutoff, side="right")
+            if n_forget == 0:
+                # the reviews of the later timepoints are newer
+                break
+            elif n_forget == len(self.dates[index]):
+                self.drop_data(index)
+            else:
+                self.drop_rows(index, n_forget)
+
+    def get_name(self):
+        return "time_span_window"
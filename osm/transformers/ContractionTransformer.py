@@ -1,5 +1,6 @@
 from sklearn.base import TransformerMixin
-from textacy.preprocess import unpack_contractions
+
+from osm.transformers.preprocessor import get_textacy_preprocess
 
 
 class ContractionTransformer(TransformerMixin):
@@ -11,4 +12,5 @@ class ContractionTransformer(TransformerMixin):
         return self
 
     def transform(self, x):
-        return [unpack_contractions(doc) for doc in x]
+        preprocess = get_textacy_preprocess()
+        return [preprocess.unpack_contractions(doc) for doc in x]
@@ -1,5 +1,6 @@
 from sklearn.base import TransformerMixin
-from textacy.preprocess import replace_currency_symbols
+
+from osm.transformers.preprocessor import get_textacy_preprocess
 
 
 class CurrencyTransformer(TransformerMixin):
@@ -12,4 +13,5 @@ class CurrencyTransformer(TransformerMixin):
         return self
 
     def transform(self, x):
-        return [replace_currency_symbols(doc, self.replace_currency_with) for doc in x]
+        preprocess = get_textacy_preprocess()
+        return [preprocess.replace_currency_symbols(doc, self.replace_currency_with) for doc in x]
@@ -0,0 +1,125 @@
+from copy import deepcopy
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.pipeline import Pipeline
+
+
+class FeatureCache(BaseEstimator, TransformerMixin):
+    """
+    Caches the features of the reviews that the wrapped transformer created when the pipeline was fitted, keyed by the
+    review id. When the pipeline is refitted on the window only the reviews that were added to the window since the
+    last fit are transformed, so the wrapped transformer should be the stateless part of the pipeline, e.g. the
+    selector and the vectorization, and the stateful steps like SelectDynamicKBest or the TfidfTransformer follow it.
+    The cache only keeps the reviews of the last fit, which are the reviews in the window
+    """
+
+    def __init__(self, transformer, key="review_id"):
+        """
+        :param transformer: the transformer whose features are cached. It is fitted on the first data only. Afterwards
+        the transformer, or the steps of a pipeline, that support partial_fit are extended with the new reviews, e.g.
+        an IncrementalDictVectorizer, so that the features of the cached reviews do not change
+        :param key: the index level with the id of the reviews
+        """
+        self.transformer = transformer
+        self.key = key
+
+    def __getstate__(self):
+        # the cache covers the reviews of the whole window, so it is not pickled, e.g. with the checkpoint of the
+        # models. The next fit transforms all the reviews again
+        state = dict(super().__getstate__())
+        state.pop("ids_", None)
+        state.pop("features_", None)
+        return state
+
+    def __deepcopy__(self, memo):
+        # the copies that are trained in the background keep the cache
+        copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copy
+        copy.__dict__.update(deepcopy(self.__dict__, memo))
+        return copy
+
+    def fit(self, X, y=None):
+        self.fit_transform(X, y)
+        return self
+
+    def fit_transform(self, X, y=None, **fit_params):
+        ids = X.index.get_level_values(self.key)
+
+        if hasattr(self, "ids_"):
+            positions = self.ids_.get_indexer(ids)
+        else:
+            positions = np.full(len(ids), -1)
+        missing = positions < 0
+
+        # transform only the reviews that are not cached
+        new_data = X[missing]
+        new_y = y[missing] if y is not None else None
+        if not hasattr(self, "ids_"):
+            new_features = self.transformer.fit_transform(new_data, new_y)
+        else:
+            new_features = self.partial_fit_transform(new_data, new_y)
+
+        n_cached = len(ids) - len(new_data)
+        if n_cached > 0:
+            features = self.stack([self.features_[positions[~missing]], new_features])
+
+            # the rows in the order of the data
+            order = np.empty(len(ids), dtype=np.int_)
+            order[~missing] = np.arange(n_cached)
+            order[missing] = np.arange(n_cached, len(ids))
+            features = features[order]
+        else:
+            features = new_features
+
+        self.n_hits_ = n_cached
+        self.n_misses_ = len(new_data)
+
+        # evict the reviews that are no longer in the window
+        unique = ~ids.duplicated()
+        self.ids_ = ids[unique]
+        self.features_ = features[unique] if not unique.all() else features
+        return features
+
+    def transform(self, X):
+        return self.transformer.transform(X)
+
+    def partial_fit_transform(self, X, y=None):
+        """
+        Extends the transformer, or the steps of the pipeline, that support partial_fit with the data and transforms it
+        :param X: the data
+        :param y: the labels
+        :return: the transformed data
+        """
+        if isinstance(self.transformer, Pipeline):
+            steps = [step for name, step in self.transformer.steps]
+        else:
+            steps = [self.transformer]
+
+        for step in steps:
+            if hasattr(step, "partial_fit"):
+                step.partial_fit(X, y)
+            X = step.transform(X)
+        return X
+
+    @staticmethod
+    def stack(features):
+        """
+        Stacks the cached and the new features. The cached sparse features are widened to the number of features of
+        the new features, as a growing vocabulary appends the new features as columns
+        :param features: list of the features
+        :return: the stacked features
+        """
+        if not sp.issparse(features[-1]):
+            return np.vstack(features)
+
+        n_features = max(matrix.shape[1] for matrix in features)
+        widened = []
+        for matrix in features:
+            matrix = matrix.tocsr()
+            if matrix.shape[1] < n_features:
+                matrix = sp.csr_matrix((matrix.data, matrix.indices, matrix.indptr),
+                                       shape=(matrix.shape[0], n_features))
+            widened.append(matrix)
+        return sp.vstack(widened, format="csr")
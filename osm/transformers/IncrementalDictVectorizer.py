@@ -0,0 +1,81 @@
+from array import array
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.base import BaseEstimator, TransformerMixin
+
+
+class IncrementalDictVectorizer(BaseEstimator, TransformerMixin):
+    """
+    Vectorizes dicts of numeric features, e.g. the ngram counts of the reviews, into a sparse matrix. Unlike the
+    DictVectorizer the vocabulary is only extended by partial_fit. A feature keeps its column once it is seen, so the
+    matrices vectorized at different times share the same feature space up to their number of columns
+    """
+
+    def __init__(self, dtype=np.float64):
+        self.dtype = dtype
+
+    def fit(self, X, y=None):
+        """
+        Learns the vocabulary from scratch
+        :param X: iterable of dicts
+        :param y: ignored
+        :return: self
+        """
+        self.vocabulary_ = {}
+        self.feature_names_ = []
+        return self.partial_fit(X)
+
+    def partial_fit(self, X, y=None):
+        """
+        Appends the features that are not yet in the vocabulary
+        :param X: iterable of dicts
+        :param y: ignored
+        :return: self
+        """
+        if not hasattr(self, "vocabulary_"):
+            self.vocabulary_ = {}
+            self.feature_names_ = []
+
+        vocabulary = self.vocabulary_
+        feature_names = self.feature_names_
+        for x in X:
+            for feature in x:
+                if feature not in vocabulary:
+                    vocabulary[feature] = len(feature_names)
+                    feature_names.append(feature)
+        return self
+
+    def transform(self, X):
+        """
+        Vectorizes the dicts with the current vocabulary. Features that are not in the vocabulary are ignored
+        :param X: iterable of dicts
+        :return: csr matrix with a column for every feature in the vocabulary
+        """
+        vocabulary = self.vocabulary_
+        indices = array("i")
+        values = array("d")
+        indptr = [0]
+
+        for x in X:
+            for feature, value in x.items():
+                column = vocabulary.get(feature)
+                if column is not None:
+                    indices.append(column)
+                    values.append(value)
+            indptr.append(len(indices))
+
+        return sp.csr_matrix((np.frombuffer(values, dtype=np.float64).astype(self.dtype, copy=False),
+                              np.frombuffer(indices, dtype=np.intc),
+                              np.asarray(indptr)),
+                             shape=(len(indptr) - 1, len(vocabulary)))
+
+    def fit_transform(self, X, y=None, **fit_params):
+        X = list(X)
+        return self.fit(X).transform(X)
+
+    def get_feature_names(self):
+        """
+        :return: the features in the order of the columns
+        """
+        return self.feature_names_
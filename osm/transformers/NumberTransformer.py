@@ -1,5 +1,6 @@
 from sklearn.base import TransformerMixin
-from textacy.preprocess import replace_numbers
+
+from osm.transformers.preprocessor import get_textacy_preprocess
 
 
 class NumberTransformer(TransformerMixin):
@@ -11,4 +12,5 @@ class NumberTransformer(TransformerMixin):
         return self
 
     def transform(self, x):
-        return [replace_numbers(doc) for doc in x]
+        preprocess = get_textacy_preprocess()
+        return [preprocess.replace_numbers(doc) for doc in x]
@@ -1,5 +1,6 @@
 from sklearn.base import TransformerMixin
-from textacy.preprocess import remove_punct
+
+from osm.transformers.preprocessor import get_textacy_preprocess
 
 
 class PunctuationTransformer(TransformerMixin):
@@ -11,4 +12,5 @@ class PunctuationTransformer(TransformerMixin):
         return self
 
     def transform(self, x):
-        return [remove_punct(doc) for doc in x]
+        preprocess = get_textacy_preprocess()
+        return [preprocess.remove_punct(doc) for doc in x]
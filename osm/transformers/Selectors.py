@@ -80,3 +80,24 @@ class SelectDynamicKBest(SelectKBest):
     def _check_params(self, X, y):
         self.k = min(X.shape[1], self.k_max)
         return super()._check_params(X, y)
+
+
+class SparseFeatureSelector(BaseEstimator, TransformerMixin):
+    """
+    Transformer to select the columns of a sparse feature matrix that the pipeline was fitted on
+    Use as the first step of the pipeline when the window stores the features vectorized with a growing vocabulary,
+    as the features that are added to the vocabulary after the fit are appended as new columns
+    """
+
+    def fit(self, X, y=None):
+        self.n_features_ = X.shape[1]
+        return self
+
+    def transform(self, X):
+        if X.shape[1] == self.n_features_:
+            return X
+        if X.shape[1] < self.n_features_:
+            X = X.tocsr(copy=True)
+            X.resize((X.shape[0], self.n_features_))
+            return X
+        return X.tocsr()[:, :self.n_features_]
@@ -1,5 +1,6 @@
 from sklearn.base import TransformerMixin
-from textacy.preprocess import normalize_whitespace
+
+from osm.transformers.preprocessor import get_textacy_preprocess
 
 
 class WhitespaceTransformer(TransformerMixin):
@@ -11,4 +12,5 @@ class WhitespaceTransformer(TransformerMixin):
         return self
 
     def transform(self, x):
-        return [normalize_whitespace(doc) for doc in x]
+        preprocess = get_textacy_preprocess()
+        return [preprocess.normalize_whitespace(doc) for doc in x]
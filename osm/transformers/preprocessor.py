@@ -1,10 +1,14 @@
 import re
 
-import textacy.preprocess as preprocess
-
 from osm.transformers import constants_preprocess as const
 
 
+def get_textacy_preprocess():
+    # textacy imports spaCy, so it is only imported when the text is preprocessed
+    import textacy.preprocess as preprocess
+    return preprocess
+
+
 def run_regex(regex, replace, text):
     return re.sub(regex, replace, text, const.RE_FLAGS)
 
@@ -59,6 +63,8 @@ def get_value_from_dict(dict, key):
 
 
 def run_unpack_contractions(text):
+    preprocess = get_textacy_preprocess()
+
     text = preprocess.unpack_contractions(text)
     text = text.replace("'s", "")
     text = text.replace("'d", "")
@@ -85,6 +91,8 @@ def run_preprocessor(text,
     if replace_colloquials is True and colloq_dict is None:
         raise ValueError("The colloquial dictionary is missing")
 
+    preprocess = get_textacy_preprocess()
+
     if replace_whitespace is True:
         text = preprocess.normalize_whitespace(text)
 
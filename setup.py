@@ -4,8 +4,11 @@ setup(
     name='osm',
     version='1.0.0.0',
     packages=['osm', 'osm.data_streams', 'osm.data_streams.oracle', 'osm.data_streams.windows',
-              'osm.data_streams.windows.forgetting_strategy', 'osm.data_streams.algorithm',
+              'osm.data_streams.windows.forgetting_strategy', 'osm.data_streams.windows.storage',
+              'osm.data_streams.algorithm',
               'osm.data_streams.evaluation', 'osm.data_streams.evaluation.strategy', 'osm.data_streams.active_learner',
+              'osm.data_streams.stream_source', 'osm.data_streams.drift_detector',
+              'osm.data_streams.retraining_policy',
               'osm.data_streams.active_learner.measures', 'osm.data_streams.active_learner.strategy',
               'osm.data_streams.active_learner.strategy.pool_based', 'osm.transformers', 'snippets'],
     url='',
@@ -27,10 +27,14 @@ from osm.data_streams.windows.forgetting_strategy.threshold import FixedThreshol
 from osm.transformers.Selectors import TextSelector, SelectDynamicKBest
 from osm.data_streams.active_learner.strategy.pool_based.fixed_uncertainity import FixedUncertainty
 from osm.data_streams.algorithm.framework import FrameWork
+from osm.data_streams.algorithm.experiment_runner import ExperimentRunner
+from osm.data_streams.stream_source.summary_file_stream_source import SummaryFileStreamSource
 
 warnings.filterwarnings('ignore')
 np.seterr(all='ignore')
 
+ILD_TIMEPOINT = datetime(2011, 1, 10)
+
 
 def get_feature_pipeline():
     tfidf = Pipeline([
@@ -43,50 +47,85 @@ def get_feature_pipeline():
     return tfidf
 
 
-@plac.annotations(
-    oracle_availability=("Oracle availability. Default: 0.1", "option", "a", float)
-)
-def main(oracle_availability=0.1):
-    summary_file = os.path.join(paths.DIR_FILE_REVIEW_WEEKLY, "summary_converted" + paths.EXT_PKL)
+def get_active_learner(strategy, budget, oracle, target_col_name):
+    if strategy == "random":
+        return Random(budget=budget, oracle=oracle, target_col_name=target_col_name)
+    elif strategy == "fixed_uncertainty":
+        return FixedUncertainty(budget=budget, oracle=oracle, target_col_name=target_col_name, threshold=0.9)
+    elif strategy == "variable_uncertainty":
+        return VariableUncertainty(budget=budget, oracle=oracle, target_col_name=target_col_name, step=0.01)
+    elif strategy == "variable_randomized_uncertainty":
+        return RandomizedVariableUncertainty(budget=budget, oracle=oracle, target_col_name=target_col_name,
+                                             step=0.01, variance=1)
+    else:
+        raise ValueError("The specified strategy is not supported: " + str(strategy))
+
+
+def build_framework(strategy, budget, availability, window_size, min_count, columnar=False, result_name=None):
     target_col_name = cols.STARS
-    ild_timepoint = datetime(2011, 1, 10)
+    ild_timepoint = ILD_TIMEPOINT
+
+    if columnar:
+        # read only the ngrams and the target from the columnar files
+        summary_file = os.path.join(paths.DIR_FILE_REVIEW_WEEKLY, "summary_columnar" + paths.EXT_PKL)
+        stream_source = SummaryFileStreamSource(summary_file, columns=["ngrams", target_col_name])
+    else:
+        summary_file = os.path.join(paths.DIR_FILE_REVIEW_WEEKLY, "summary_converted" + paths.EXT_PKL)
+        stream_source = SummaryFileStreamSource(summary_file)
 
     # initialize oracle
-    oracle = AvailabilityAwareOracle(availability=oracle_availability)
+    oracle = AvailabilityAwareOracle(availability=availability)
 
     # initialize active learner
-    active_learners = [Random(budget=0.1, oracle=oracle, target_col_name=target_col_name),
-                       FixedUncertainty(budget=0.1, oracle=oracle, target_col_name=target_col_name, threshold=0.9),
-                       VariableUncertainty(budget=0.1, oracle=oracle, target_col_name=target_col_name, step=0.01),
-                       RandomizedVariableUncertainty(budget=0.1, oracle=oracle, target_col_name=target_col_name,
-                                                     step=0.01, variance=1)]
-
-    for active_learner in active_learners:
-        base_estimator = CalibratedClassifierCV(SGDClassifier(max_iter=1000, n_jobs=-1, class_weight="balanced"))
-
-        # initialize window
-        forgetting_strategy = FixedThreshold(min_count=3, classes=["negative", "neutral", "positive"],
-                                             target_col_name=target_col_name)
-        window = SlidingWindow(window_size=5, forgetting_strategy=forgetting_strategy)
-
-        # initialize evaluation strategy
-        eval_strategy = Prequential(target_col_name)
-
-        # create the feature processing pipeline
-        pipe = get_feature_pipeline()
-
-        # build the framework
-        framework = FrameWork(summary_file=summary_file,
-                              base_estimator=base_estimator,
-                              feature_pipeline=pipe,
-                              target_col_name=target_col_name,
-                              ild_timepoint=ild_timepoint,
-                              active_learner=active_learner,
-                              window=window,
-                              evaluation_strategy=eval_strategy
-                              )
-
-        framework.process_data_stream()
+    active_learner = get_active_learner(strategy, budget, oracle, target_col_name)
+
+    base_estimator = CalibratedClassifierCV(SGDClassifier(max_iter=1000, n_jobs=-1, class_weight="balanced"))
+
+    # initialize window
+    forgetting_strategy = FixedThreshold(min_count=min_count, classes=["negative", "neutral", "positive"],
+                                         target_col_name=target_col_name)
+    window = SlidingWindow(window_size=window_size, forgetting_strategy=forgetting_strategy)
+
+    # initialize evaluation strategy
+    eval_strategy = Prequential(target_col_name)
+
+    # create the feature processing pipeline
+    pipe = get_feature_pipeline()
+
+    # build the framework
+    return FrameWork(summary_file=None,
+                     stream_source=stream_source,
+                     base_estimator=base_estimator,
+                     feature_pipeline=pipe,
+                     target_col_name=target_col_name,
+                     ild_timepoint=ild_timepoint,
+                     active_learner=active_learner,
+                     window=window,
+                     evaluation_strategy=eval_strategy,
+                     result_name=result_name
+                     )
+
+
+@plac.annotations(
+    oracle_availability=("Comma separated oracle availabilities. Default: 0.1", "option", "a", str),
+    n_jobs=("Number of experiments run in parallel. Default: 1", "option", "n", int),
+    seed=("Seed from which the seed of every experiment is drawn. Default: None", "option", "s", int),
+    columnar=("Read the columnar files created by the convert_to_columnar snippet", "flag", "c")
+)
+def main(oracle_availability="0.1", n_jobs=1, seed=None, columnar=False):
+    availabilities = [float(availability) for availability in oracle_availability.split(",")]
+
+    param_grid = {
+        "strategy": ["random", "fixed_uncertainty", "variable_uncertainty", "variable_randomized_uncertainty"],
+        "budget": [0.1],
+        "availability": availabilities,
+        "window_size": [5],
+        "min_count": [3],
+        "columnar": [columnar]
+    }
+
+    runner = ExperimentRunner(build_framework, param_grid, n_jobs=n_jobs, random_state=seed)
+    runner.run()
 
 
 if __name__ == '__main__':
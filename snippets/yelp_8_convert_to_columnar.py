@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pandas as pd
+import plac
+
+sys.path.append('../')
+import snippets.yelp_constants_file_paths as paths
+from osm.data_streams.stream_source.file_format import write_columnar
+
+
+@plac.annotations(
+    compression=("Compression of the Arrow files: uncompressed, lz4 or zstd. Default: uncompressed", "option", "c", str)
+)
+def main(compression="uncompressed"):
+    """
+    This code snippet converts the files of the 3 class problem to the columnar Arrow format, which can be
+    memory-mapped and read with column projection. Only uncompressed files are memory-mapped without copying
+    """
+
+    # set the input folder
+    input_folder = paths.DIR_FILE_REVIEW_WEEKLY
+    summary_filename = "summary_converted" + paths.EXT_PKL
+
+    # read the summary file
+    summary = pd.read_pickle(os.path.join(input_folder, summary_filename))
+
+    path = os.path.join(input_folder, paths.DIR_COLUMNAR)
+    if not os.path.exists(path):
+        os.mkdir(path)
+
+    filenames = []
+    for index, row in summary.iterrows():
+
+        # read the data
+        print(row['filename'])
+        data = pd.read_pickle(os.path.join(input_folder, row['filename']))
+
+        # write the data
+        filename = os.path.basename(row['filename'])[:-len(paths.EXT_PKL)] + paths.EXT_ARROW
+        filename = os.path.join(paths.DIR_COLUMNAR, filename)
+        write_columnar(data, os.path.join(input_folder, filename), compression=compression)
+
+        filenames.append(filename)
+
+    summary['filename'] = filenames
+
+    summary_filename = "summary_columnar" + paths.EXT_PKL
+    summary.to_pickle(os.path.join(input_folder, summary_filename))
+
+
+if __name__ == '__main__':
+    plac.call(main)
@@ -4,6 +4,7 @@ import os
 EXT_CSV = ".csv"
 EXT_PKL = ".pkl.gzip"
 EXT_JSON = ".json"
+EXT_ARROW = ".arrow"
 
 # name of the files
 FILE_NAME_REVIEW = "review"
@@ -34,6 +35,7 @@ DIR_WEEKLY = "weekly"
 DIR_RAW = "raw"
 DIR_PRE_PROCESSED = "preprocessed"
 DIR_RESULTS = "results"
+DIR_COLUMNAR = "columnar"
 DIR_FILE_REVIEW_WEEKLY = os.path.join(DIR_FILTERED, DIR_WEEKLY)
 DIR_FILE_REVIEW_WEEKLY_RAW = os.path.join(DIR_FILE_REVIEW_WEEKLY, DIR_RAW)
 
@@ -0,0 +1,104 @@
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+from sklearn.feature_extraction import DictVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.pipeline import Pipeline
+
+from osm.data_streams.active_learner.strategy.pool_based.random import Random
+from osm.data_streams.algorithm.framework import FrameWork
+from osm.data_streams.oracle.availability_aware_oracle import AvailabilityAwareOracle
+from osm.data_streams.stream_source.synthetic_stream_source import SyntheticStreamSource
+from osm.data_streams.windows.sliding_window import SlidingWindow
+from osm.transformers.Selectors import TextSelector
+
+
+class Stop(Exception):
+    pass
+
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="osm_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def build_framework(self, directory):
+        stream_source = SyntheticStreamSource(directory, n_timepoints=8, reviews_per_timepoint=30)
+        # every review is labeled, so that the resumed data stream labels the same reviews
+        active_learner = Random(budget=1.0, oracle=AvailabilityAwareOracle(availability=1.0), target_col_name="stars",
+                                debug=False)
+        np.random.seed(0)
+        return FrameWork(summary_file=None,
+                         stream_source=stream_source,
+                         base_estimator=SGDClassifier(loss="log_loss", random_state=0),
+                         feature_pipeline=Pipeline([('selector', TextSelector(key='ngrams')),
+                                                    ('vect', DictVectorizer())]),
+                         target_col_name="stars",
+                         ild_timepoint=stream_source.get_summary().index[0],
+                         active_learner=active_learner,
+                         window=SlidingWindow(window_size=5),
+                         compaction_interval=2,
+                         checkpoint_models=False,
+                         debug=False)
+
+    def test_resume_after_compaction(self):
+        expected = self.build_framework(tempfile.mkdtemp(dir=self.directory))
+        expected.process_data_stream()
+
+        framework = self.build_framework(tempfile.mkdtemp(dir=self.directory))
+        save_state = framework.save_state
+
+        def stop_after_compaction(index):
+            save_state(index)
+            if index == 3:
+                raise Stop()
+
+        framework.save_state = stop_after_compaction
+        with self.assertRaises(Stop):
+            framework.process_data_stream()
+        index = framework.window.index
+
+        # the window is restored from the snapshot of the compaction
+        resumed = self.build_framework(framework.stream_source.get_directory())
+        resumed.initialize()
+        self.assertEqual(index, resumed.window.index)
+
+        resumed.process_data_stream()
+        self.assertEqual(expected.window.get_indices(), resumed.window.get_indices())
+        self.assertTrue(expected.window.get_window_data().equals(resumed.window.get_window_data()))
+
+    def test_resume_after_interrupted_compaction(self):
+        expected = self.build_framework(tempfile.mkdtemp(dir=self.directory))
+        expected.process_data_stream()
+
+        framework = self.build_framework(tempfile.mkdtemp(dir=self.directory))
+        checkpoint = framework.checkpoint
+        write = checkpoint.write
+        summaries = []
+
+        def crash_before_second_summary(obj, path):
+            # the window snapshot of the second compaction is written, its summary is not
+            if path.endswith(checkpoint.summary_filename):
+                summaries.append(path)
+                if len(summaries) == 2:
+                    raise Stop()
+            write(obj, path)
+
+        checkpoint.write = crash_before_second_summary
+        with self.assertRaises(Stop):
+            framework.process_data_stream()
+
+        resumed = self.build_framework(framework.stream_source.get_directory())
+        resumed.process_data_stream()
+        self.assertEqual(expected.window.get_indices(), resumed.window.get_indices())
+        self.assertTrue(expected.window.get_window_data().equals(resumed.window.get_window_data()))
+        self.assertTrue(resumed.summary[("summary", "processed")].all())
+
+
+if __name__ == '__main__':
+    unittest.main()
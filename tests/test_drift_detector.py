@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from osm.data_streams.drift_detector.adwin import ADWIN
+from osm.data_streams.drift_detector.ddm import DDM
+from osm.data_streams.drift_detector.eddm import EDDM
+
+
+def add_elements(detector, values):
+    return [i for i, value in enumerate(values) if detector.add_element(value)]
+
+
+class TestDDM(unittest.TestCase):
+
+    def test_drift_is_signaled_once(self):
+        random = np.random.RandomState(0)
+        errors = np.concatenate([random.rand(1000) < 0.1, random.rand(1000) < 0.5]).astype(int)
+
+        detector = DDM()
+        drifts = add_elements(detector, errors)
+        self.assertEqual(1, len(drifts))
+        self.assertGreaterEqual(drifts[0], 1000)
+
+        # the errors after the drift are monitored from a new minimum
+        self.assertEqual(len(errors) - drifts[0] - 1, detector.n)
+
+    def test_reset(self):
+        detector = DDM(min_num_instances=5)
+        add_elements(detector, [0, 1, 0, 1, 1, 1])
+        detector.reset()
+        self.assertEqual(0, detector.n)
+        self.assertEqual(np.inf, detector.p_min)
+        self.assertFalse(detector.in_warning)
+
+
+class TestEDDM(unittest.TestCase):
+
+    def test_drift_is_signaled_once(self):
+        # an error every 10 instances, then an error every 2 instances
+        errors = [int(i % 10 == 0) for i in range(1, 401)] + [int(i % 2 == 0) for i in range(1, 401)]
+
+        detector = EDDM()
+        drifts = add_elements(detector, errors)
+        self.assertEqual(1, len(drifts))
+        self.assertGreaterEqual(drifts[0], 400)
+
+        # the distances after the drift are monitored from a new maximum
+        self.assertEqual(len(errors) - drifts[0] - 1, detector.n)
+        self.assertEqual(2, detector.mean)
+
+    def test_no_drift_without_errors(self):
+        detector = EDDM()
+        self.assertEqual([], add_elements(detector, [0] * 100))
+        self.assertEqual(0, detector.num_errors)
+
+
+class TestADWIN(unittest.TestCase):
+
+    def test_errors_are_summarized_in_blocks(self):
+        detector = ADWIN(block_size=10, max_blocks=4)
+        add_elements(detector, [0.5] * 95)
+
+        # the oldest blocks are dropped beyond max_blocks, the last errors are in the open block
+        self.assertEqual(4, len(detector.blocks))
+        self.assertEqual((10, 5.0, 2.5), detector.blocks[0])
+        self.assertEqual([5, 2.5, 1.25], detector.block)
+
+    def test_drift_drops_the_older_blocks(self):
+        random = np.random.RandomState(0)
+        errors = np.concatenate([random.rand(2000) < 0.1, random.rand(2000) < 0.5]).astype(float)
+
+        detector = ADWIN()
+        drifts = add_elements(detector, errors)
+        self.assertGreater(len(drifts), 0)
+        self.assertGreaterEqual(drifts[0], 2000)
+
+        # the window only contains the errors after the drift
+        count = sum(block[0] for block in detector.blocks)
+        total = sum(block[1] for block in detector.blocks)
+        self.assertAlmostEqual(0.5, total / count, delta=0.05)
+
+    def test_reset(self):
+        detector = ADWIN(block_size=10)
+        add_elements(detector, [1.0] * 25)
+        detector.reset()
+        self.assertEqual(0, len(detector.blocks))
+        self.assertEqual([0, 0.0, 0.0], detector.block)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import pickle
+import unittest
+from copy import deepcopy
+
+import pandas as pd
+from sklearn.pipeline import Pipeline
+
+from osm.transformers.FeatureCache import FeatureCache
+from osm.transformers.IncrementalDictVectorizer import IncrementalDictVectorizer
+from osm.transformers.Selectors import TextSelector
+
+
+def build_data(review_ids):
+    index = pd.MultiIndex.from_arrays([[review_id // 10 for review_id in review_ids], review_ids],
+                                      names=["timepoint", "review_id"])
+    ngrams = [{"good": review_id % 3, "bad": review_id % 2, str(review_id): 1} for review_id in review_ids]
+    return pd.DataFrame({"ngrams": ngrams}, index=index)
+
+
+def build_cache():
+    return FeatureCache(Pipeline([("selector", TextSelector(key="ngrams")),
+                                  ("vect", IncrementalDictVectorizer())]))
+
+
+class TestFeatureCache(unittest.TestCase):
+
+    def test_only_new_reviews_are_transformed(self):
+        cache = build_cache()
+        cache.fit_transform(build_data(list(range(0, 20))))
+
+        features = cache.fit_transform(build_data(list(range(10, 30))))
+        self.assertEqual(10, cache.n_hits_)
+        self.assertEqual(10, cache.n_misses_)
+
+        # the cached features are the same as the features of the transformer
+        expected = cache.transform(build_data(list(range(10, 30))))
+        self.assertEqual(0, (features != expected).nnz)
+
+        # the reviews that are no longer in the window are evicted
+        self.assertEqual(list(range(10, 30)), list(cache.ids_))
+
+    def test_deepcopy_keeps_the_cache(self):
+        cache = build_cache()
+        cache.fit_transform(build_data(list(range(0, 20))))
+
+        copy = deepcopy(cache)
+        self.assertEqual(list(cache.ids_), list(copy.ids_))
+        self.assertEqual(0, (cache.features_ != copy.features_).nnz)
+
+        # the copy is fitted independently of the original
+        copy.fit_transform(build_data(list(range(10, 30))))
+        self.assertEqual(10, copy.n_hits_)
+        self.assertEqual(list(range(0, 20)), list(cache.ids_))
+        self.assertNotIn("29", cache.transformer.named_steps["vect"].vocabulary_)
+
+    def test_pickle_drops_the_cache(self):
+        cache = build_cache()
+        cache.fit_transform(build_data(list(range(0, 20))))
+
+        restored = pickle.loads(pickle.dumps(cache))
+        self.assertFalse(hasattr(restored, "ids_"))
+        self.assertFalse(hasattr(restored, "features_"))
+        self.assertEqual(cache.transformer.named_steps["vect"].vocabulary_,
+                         restored.transformer.named_steps["vect"].vocabulary_)
+
+        # the original keeps its cache
+        self.assertEqual(20, len(cache.ids_))
+
+        # the next fit transforms all the reviews again
+        restored.fit_transform(build_data(list(range(10, 30))))
+        self.assertEqual(0, restored.n_hits_)
+
+
+if __name__ == '__main__':
+    unittest.main()
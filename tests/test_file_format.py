@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from osm.data_streams.stream_source.file_format import read_file, write_columnar
+
+
+def build_data():
+    index = pd.MultiIndex.from_arrays([[1, 1, 2, 2], [10, 11, 12, 13]], names=["timepoint", "review_id"])
+    return pd.DataFrame({"ngrams": [{"good": 2, "not good": 1}, {}, None, {"bad": 3}],
+                         "weights": [{"good": 0.5}, {"bad": 1.5}, {}, {}],
+                         "stars": ["positive", "negative", "neutral", "negative"]}, index=index)
+
+
+class TestFileFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="osm_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_round_trip(self):
+        data = build_data()
+        for filename in ["data.arrow", "data.parquet"]:
+            path = os.path.join(self.directory, filename)
+            write_columnar(data, path)
+
+            read = read_file(path)
+            self.assertTrue(data.equals(read))
+            self.assertEqual(data.index.names, read.index.names)
+
+            # the dicts keep the types of their values
+            for column in ["ngrams", "weights"]:
+                for expected, value in zip(data[column], read[column]):
+                    self.assertEqual(expected, value)
+                    if value:
+                        self.assertEqual({type(item) for item in expected.values()},
+                                         {type(item) for item in value.values()})
+
+    def test_column_projection(self):
+        data = build_data()
+        path = os.path.join(self.directory, "data.arrow")
+        write_columnar(data, path)
+
+        read = read_file(path, columns=["stars"])
+        self.assertEqual(["stars"], list(read.columns))
+        self.assertTrue(data.index.equals(read.index))
+
+
+if __name__ == '__main__':
+    unittest.main()
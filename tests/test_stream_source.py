@@ -0,0 +1,51 @@
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from osm.data_streams.stream_source.in_memory_stream_source import InMemoryStreamSource
+
+
+def build_stream(timepoints):
+    for timepoint in timepoints:
+        yield timepoint, pd.DataFrame({"timepoint": [timepoint]})
+
+
+class TestInMemoryStreamSource(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="osm_test_")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_iterator_keeps_the_timepoints_until_read(self):
+        timepoints = list(range(5))
+        source = InMemoryStreamSource(build_stream(timepoints), self.directory, timepoints=timepoints)
+
+        self.assertEqual([3], list(source.read(3)["timepoint"]))
+        self.assertEqual([0, 1, 2], sorted(source.data))
+        self.assertEqual([1], list(source.read(1)["timepoint"]))
+        self.assertEqual([0, 2], sorted(source.data))
+
+    def test_skipped_timepoints_are_not_kept(self):
+        timepoints = list(range(5))
+        source = InMemoryStreamSource(build_stream(timepoints), self.directory, timepoints=timepoints)
+        source.skip([0, 1, 2])
+
+        self.assertEqual([3], list(source.read(3)["timepoint"]))
+        self.assertEqual({}, source.data)
+        self.assertEqual(set(), source.skipped)
+
+    def test_skipped_timepoints_are_dropped_from_the_data(self):
+        data = {timepoint: pd.DataFrame({"timepoint": [timepoint]}) for timepoint in range(5)}
+        source = InMemoryStreamSource(data, self.directory)
+        source.skip([0, 1])
+
+        self.assertEqual([2, 3, 4], sorted(source.data))
+        self.assertEqual(list(range(5)), list(source.get_summary().index))
+
+
+if __name__ == '__main__':
+    unittest.main()
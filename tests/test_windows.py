@@ -0,0 +1,174 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+import osm.data_streams.constants as const
+from osm.data_streams.windows.fading_window import FadingWindow
+from osm.data_streams.windows.reservoir_window import ReservoirWindow
+from osm.data_streams.windows.sliding_window import SlidingWindow
+from osm.data_streams.windows.stratified_window import StratifiedWindow
+from osm.data_streams.windows.time_span_window import TimeSpanWindow
+
+
+def build_batch(index, size=10):
+    ids = np.arange(index * size, (index + 1) * size)
+    return pd.DataFrame({"id": ids, "y": ids % 3})
+
+
+def get_keys(window):
+    return {index: list(keys) for index, keys in window.keys.items()}
+
+
+class TestReservoirWindow(unittest.TestCase):
+
+    def sample(self, n_runs, bias=0.0):
+        # the rate at which the instances of every batch are in the window
+        hits = np.zeros(100)
+        for seed in range(n_runs):
+            window = ReservoirWindow(20, bias=bias, random_state=seed)
+            for index in range(10):
+                window.add(build_batch(index))
+            hits[window.get_window_data()["id"].values] += 1
+        return (hits / n_runs).reshape(10, 10).mean(axis=1)
+
+    def test_uniform_sample(self):
+        np.testing.assert_allclose(self.sample(300), 0.2, atol=0.04)
+
+    def test_biased_sample(self):
+        rates = self.sample(100, bias=0.3)
+        self.assertTrue(np.all(np.diff(rates) > 0))
+
+    def test_window_size(self):
+        window = ReservoirWindow(20, random_state=0)
+        window.set_target_col_name("y")
+        for index in range(10):
+            window.add(build_batch(index))
+            self.assertEqual(min(10 * (index + 1), 20), len(window.get_window_data()))
+
+        data = window.get_window_data()
+        self.assertEqual(data["y"].value_counts().to_dict(), dict(+window.get_class_counts()))
+        self.assertEqual(20, sum(len(keys) for keys in window.keys.values()))
+
+        # the keys are not stored in the window data
+        self.assertNotIn(const.reservoir_key, data.columns)
+
+    def test_replay_and_restore(self):
+        window = ReservoirWindow(20, random_state=1)
+        replayed = ReservoirWindow(20)
+        for index in range(10):
+            window.add(build_batch(index))
+            replayed.apply_changes(window.pop_changes(), window.index)
+        self.assertTrue(window.get_window_data().equals(replayed.get_window_data()))
+        self.assertEqual(get_keys(window), get_keys(replayed))
+
+        restored = ReservoirWindow(20, random_state=1)
+        restored.restore_window(window.index, window.get_snapshot())
+        self.assertEqual(get_keys(window), get_keys(restored))
+
+        # the restored window continues the same sample
+        for index in range(10, 15):
+            window.add(build_batch(index))
+            restored.add(build_batch(index))
+        self.assertTrue(window.get_window_data().equals(restored.get_window_data()))
+
+
+class TestStratifiedWindow(unittest.TestCase):
+
+    def setUp(self):
+        random = np.random.RandomState(0)
+        # the rare classes disappear from the stream after 5 batches
+        self.batches = [pd.DataFrame({"id": np.arange(index * 50, (index + 1) * 50),
+                                      "y": random.choice(["a", "b", "c"], size=50,
+                                                         p=[0.8, 0.15, 0.05] if index < 5 else [0.98, 0.02, 0])})
+                        for index in range(15)]
+
+    def test_without_min_count_same_as_sliding_window(self):
+        window = StratifiedWindow(3, 0, target_col_name="y")
+        sliding = SlidingWindow(3)
+        for batch in self.batches:
+            window.add(batch)
+            sliding.add(batch)
+        self.assertTrue(window.get_window_data().equals(sliding.get_window_data()))
+
+    def test_min_count_keeps_the_newest_instances(self):
+        min_count = {"a": 5, "b": 10, "c": 4}
+        window = StratifiedWindow(3, min_count, target_col_name="y")
+        for batch in self.batches:
+            window.add(batch)
+
+            data = window.get_window_data()
+            self.assertEqual(data["y"].value_counts().to_dict(), dict(+window.get_class_counts()))
+            for clazz, count in min_count.items():
+                seen = sum((previous["y"] == clazz).sum() for previous in self.batches[:window.index])
+                self.assertGreaterEqual((data["y"] == clazz).sum(), min(count, seen))
+
+        # the kept instances of a class are its newest instances
+        stream = pd.concat(self.batches)
+        expected = stream[stream["y"] == "c"]["id"].values[-4:]
+        self.assertEqual(sorted(expected), sorted(data[data["y"] == "c"]["id"].values))
+
+    def test_replay_and_restore(self):
+        min_count = {"a": 5, "b": 10, "c": 4}
+        window = StratifiedWindow(3, min_count, target_col_name="y")
+        replayed = StratifiedWindow(3, min_count, target_col_name="y")
+        for batch in self.batches:
+            window.add(batch)
+            replayed.apply_changes(window.pop_changes(), window.index)
+        self.assertTrue(window.get_window_data().equals(replayed.get_window_data()))
+
+        restored = StratifiedWindow(3, min_count, target_col_name="y")
+        restored.restore_window(window.index, window.get_snapshot())
+        for window_copy in [replayed, restored]:
+            self.assertEqual({clazz: list(buffer) for clazz, buffer in window.buffers.items()},
+                             {clazz: list(buffer) for clazz, buffer in window_copy.buffers.items()})
+
+        # the restored window forgets the same instances
+        for batch in self.batches[:3]:
+            window.add(batch)
+            restored.add(batch)
+        self.assertTrue(window.get_window_data().equals(restored.get_window_data()))
+
+
+class TestFadingWindow(unittest.TestCase):
+
+    def test_validation(self):
+        for decay in [0, 1, 1.5]:
+            with self.assertRaises(ValueError):
+                FadingWindow(decay)
+        with self.assertRaises(ValueError):
+            FadingWindow(0.5, min_weight=0)
+
+    def test_weights_and_forgetting(self):
+        # the weights of the last 4 indices are 1, 0.5, 0.25 and 0.125
+        window = FadingWindow(0.5, min_weight=0.1)
+        self.assertEqual(4, window.window_size)
+        for index in range(6):
+            window.add(build_batch(index))
+
+        self.assertEqual([2, 3, 4, 5], window.get_indices())
+        data = window.get_window_data()
+        np.testing.assert_allclose(window.get_sample_weights(data), np.repeat([0.125, 0.25, 0.5, 1.0], 10))
+
+        # the data that is not in the window, e.g. the labeled data of the last index, is not weighted down
+        np.testing.assert_allclose(window.get_sample_weights(build_batch(6)), np.ones(10))
+
+
+class TestTimeSpanWindow(unittest.TestCase):
+
+    def test_forget(self):
+        window = TimeSpanWindow("10D")
+        for index in range(5):
+            # a review every day of the week, in reverse order
+            dates = pd.date_range("2020-01-01", periods=7, freq="D")[::-1] + pd.Timedelta(weeks=index)
+            window.add(pd.DataFrame({"id": np.arange(7) + 7 * index}, index=pd.Index(dates, name="date")))
+
+        # the reviews within 10 days before the last review of 2020-02-04
+        dates = window.get_window_data().index.get_level_values("date")
+        self.assertEqual(pd.Timestamp("2020-01-26"), dates.min())
+        self.assertEqual(10, len(dates))
+        self.assertEqual([3, 4], window.get_indices())
+
+
+if __name__ == '__main__':
+    unittest.main()